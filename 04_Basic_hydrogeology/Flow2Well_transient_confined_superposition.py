@@ -1,9 +1,20 @@
 # Loading the required Python libraries
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import pandas as pd
 import streamlit as st
 
+# Make the shared gwtools package importable
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from gwtools.superposition import boundary, drawdown_field
+from gwtools.well_hydraulics import compute_s
+
 st.title('Transient Flow towards wells and superposition')
 
 st.subheader('Consideration of two wells under the principle of :orange[superposition]', divider="orange")
@@ -55,33 +66,6 @@ st.subheader('Computation of well drawdown with the principle of superposition',
 st.markdown(r"""
 The menu point '**Use cases**' allows you to choose different scenarios and to modify the pumping rate and the position of the wells.  
 """, unsafe_allow_html=True)
-# (Here the necessary functions like the well function $W(u)$ are defined. Later, those functions are used in the computation)
-# Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-
-# (Here, the method computes the data for the well function. Those data can be used to generate a type curve.)
-u_max = 1
-r_max = 10000
-u  = [u_max for x in range(r_max)]
-u_inv  = [r_max/u_max for x in range(r_max)]
-w_u  = [well_function(u_max/r_max) for x in range(r_max)]
-
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
-
-
 # This is the function to plot the graph with the data     
 
 # Get input data
@@ -155,13 +139,8 @@ s2  = compute_s(T, S, t, Q2, r)
 num_steps = 500
 r_super = np.linspace(-1000, 1000, num_steps)
 
-s_super = []
-
-for x in r_super:
-    y1 = compute_s(T, S, t, Q1, x-0.5*distanz)
-    y2 = compute_s(T, S, t, Q2, x+0.5*distanz)
-    y3 = y1 + y2
-    s_super.append(y3)
+wells = [(0.5*distanz, 0, Q1), (-0.5*distanz, 0, Q2)]
+s_super = drawdown_field(wells, r_super, 0, t, T, S)[0]
     
 # Plotting
 fig=plt.figure(figsize=(10, 6))
@@ -221,6 +200,75 @@ if st.session_state.case == 'Well with infiltration bc':
     with st.expander('Here you can find additional explanation'):
         st.image('04_Basic_hydrogeology/FIGS/ferris_infiltration.png', caption="Conceptual sketch through an aquifer with one pumping well and an imaginary well to represent an infiltration boundary [Ferris et al. 1962]( https://pubs.usgs.gov/wsp/wsp1536-E/).")
 
+'---'
+st.subheader('Well fields and boundaries in plan view', divider = 'orange')
+
+st.markdown(r"""
+The same principle works for any number of wells. The table below defines the well field (coordinates in m, pumping rate in m³/s, negative values for injection wells) - rows can be added, edited, or deleted. A well can be shut down after a number of days (leave the field empty for continuous pumping); its drawdown then recovers by superposition in time. Straight boundaries are represented by image wells: for a no-flow boundary the image pumps with the same rate, for a constant-head (infiltration) boundary it injects. Two boundaries require images of the images; for two parallel boundaries this series is truncated after ten reflections.
+
+The maps show the drawdown of the whole system for the selected times, computed for all grid cells, wells, and times at once. Image wells whose drawdown in the model area stays negligible are skipped, and distant ones are summed on a coarser grid and interpolated.
+""", unsafe_allow_html=True)
+
+BOUNDARY_CASES = {
+    'No boundary': [],
+    'No-flow boundary (west)': [('no_flow', 'west')],
+    'Constant-head boundary (west)': [('constant_head', 'west')],
+    'No-flow (west) and constant-head (south) boundary': [('no_flow', 'west'), ('constant_head', 'south')],
+    'Two no-flow boundaries (west and east)': [('no_flow', 'west'), ('no_flow', 'east')],
+}
+SNAPSHOTS = {'1 hour': 3600, '1 day': 86400, '1 week': 86400*7, '30 days': 86400*30, '1 year': 86400*365}
+
+columns2 = st.columns((1,1))
+with columns2[0]:
+    wells_df = st.data_editor(pd.DataFrame({'x (m)': [200., 350., 350., 500.], 'y (m)': [300., 150., 450., 300.],
+                                            'Q (m³/s)': [0.005, 0.005, 0.005, 0.005],
+                                            'Shut down after (d)': [np.nan, np.nan, 3., np.nan]}),
+                              num_rows='dynamic', key='well_field')
+with columns2[1]:
+    bc_case = st.selectbox('**Boundaries**', list(BOUNDARY_CASES), index=1)
+    extent = st.slider('**Size of the model area** (m)', 200, 5000, 1000, 100)
+    snapshots = st.multiselect('**Times for the maps**', list(SNAPSHOTS), ['1 day', '1 week', '30 days'])
+    n_grid = st.select_slider('**Grid cells per direction**', (100, 200, 300, 500), 200)
+
+
+@st.cache_data
+def drawdown_map(wells, stops, bc_case, extent, times, n_grid, T, S):
+    # West boundary along the y-axis, south boundary along the x-axis, east boundary at x = extent
+    lines = {'west': (0, 0, 90), 'south': (0, 0, 0), 'east': (extent, 0, 90)}
+    sides = [side for _, side in BOUNDARY_CASES[bc_case]]
+    bounds = [boundary(kind, *lines[side]) for kind, side in BOUNDARY_CASES[bc_case]]
+    x = np.linspace(0 if 'west' in sides else -0.5*extent, extent, n_grid)
+    y = np.linspace(0 if 'south' in sides else -0.5*extent, extent, n_grid)
+    X, Y = np.meshgrid(x, y)
+    # Wells with a shutdown time pump their rate until then, the others continuously
+    schedules = [None if np.isnan(stop) else ((0., stop * 86400.), (Q, 0.)) for (_, _, Q), stop in zip(wells, stops)]
+    return X, Y, drawdown_field(np.array(wells), X, Y, times, T, S, bounds, schedules=schedules)
+
+
+wells_table = wells_df.dropna(subset=['x (m)', 'y (m)', 'Q (m³/s)'])
+wells_field = wells_table[['x (m)', 'y (m)', 'Q (m³/s)']].to_numpy(dtype=float)
+stops = tuple(wells_table['Shut down after (d)'].to_numpy(dtype=float))
+if len(wells_field) == 0 or not snapshots:
+    st.info('Define at least one well and one time for the maps.')
+else:
+    times = [SNAPSHOTS[label] for label in snapshots]
+    X, Y, s_map = drawdown_map(tuple(map(tuple, wells_field)), stops, bc_case, extent, tuple(times), n_grid, T, S)
+    levels = np.linspace(min(s_map.min(), 0), max(s_map.max(), 1e-3), 21)
+    fig2, axes = plt.subplots(1, len(times), figsize=(5*len(times), 5), squeeze=False, sharey=True)
+    for ax2, label, s_t in zip(axes[0], snapshots, s_map):
+        cf = ax2.contourf(X, Y, s_t, levels=levels, cmap='Blues')
+        ax2.contour(X, Y, s_t, levels=levels[1::4], colors='k', linewidths=0.5)
+        pumping = wells_field[:, 2] >= 0
+        ax2.plot(wells_field[pumping, 0], wells_field[pumping, 1], 'rv', label='pumping well')
+        ax2.plot(wells_field[~pumping, 0], wells_field[~pumping, 1], 'g^', label='injection well')
+        ax2.set_title('t = %s' % label)
+        ax2.set_xlabel('x in m')
+        ax2.set_aspect('equal')
+    axes[0, 0].set_ylabel('y in m')
+    fig2.colorbar(cf, ax=axes[0].tolist(), label='Drawdown in m', shrink=0.8)
+    st.pyplot(fig2)
+    st.write('**Maximum drawdown in the model area:** %5.2f m' % s_map.max())
+
 '---'
 
 # Copyright
@@ -2,7 +2,15 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 import io
+import sys
+from pathlib import Path
 import matplotlib.pyplot as plt
+ROOT = str(Path(__file__).resolve().parents[1])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.loggers import read_logger
+from gwtools.slug import compare_slug_models, fit_bouwer_rice
+from gwtools.metrics import compute_statistics
 
 st.title('Slugtest evaluation 📉')
 
@@ -80,6 +88,11 @@ st.markdown("""
             
             Once the data are loaded, you can modify the time offset and fit the hydraulic conductivity to the measured data.
            """)
+# Logger files (e.g. Diver exports) with many samples are reduced before plotting
+@st.cache_data
+def load_logger(content, origin, per_decade):
+    return read_logger(io.BytesIO(content), origin=origin, per_decade=per_decade)
+
 # Available Data / Choose data
 # Select data
 columns = st.columns((1,4,1), gap = 'large')
@@ -94,6 +107,8 @@ with columns[1]:
         slugsize = st.number_input("Slug size in cm³ (1 liter = 1000 cm³)", value = 700,step=1)
         h_static = st.number_input("Static water level (hydraulic head) in m", value = 0., step=0.01)
     
+# Uploaded file and time grid of your own dataset, part of the key of the automatic fit
+upload_key = None
 if (st.session_state.Data == "Varnum (SWE) 2018 - R4"):
     slugsize = 700
     h_static = 0
@@ -120,11 +135,19 @@ elif(st.session_state.Data =="Load your own CSV dataset"):
     rc_ini = 0.025
     rw_ini = 0.07
     L_ini = 2.
-    uploaded_file = st.file_uploader("Choose a CSV file for evaluation (time in seconds / normalized heads in meters)")
+    uploaded_file = st.file_uploader("Choose a CSV file or logger export for evaluation (time in seconds or date/time stamps / heads in meters, e.g. Diver files)")
     if uploaded_file is not None:
-        df = pd.read_csv(uploaded_file)
-        m_time = list(df.iloc[:,0].values)
-        m_head = list(df.iloc[:,1].values)
+        # Logger records are read in chunks and averaged on a log-spaced time grid that starts at the slug
+        lc_log, rc_log = st.columns((1,1))
+        with lc_log:
+            t_slug = st.number_input("Time of the slug in s after the first sample (start of the log-spaced time grid)", value = 0., min_value = 0., step = 1.)
+        with rc_log:
+            per_decade = st.slider("Samples per log cycle of time (thinning of long logger records)", 10, 200, 50, 10)
+        logger = load_logger(uploaded_file.getvalue(), t_slug, per_decade)
+        upload_key = (uploaded_file.name, uploaded_file.size, t_slug, per_decade)
+        m_time = logger['t'].tolist()
+        m_head = logger['values'].tolist()
+        st.write('%i samples of **%s** read, %i log-spaced values used' %(logger['n'], logger['name'], len(m_time)))
     st.write('Overview about loaded data', m_head[:min(100, len(m_head))])
 elif(st.session_state.Data =="Data from random properties with added noise"):
     # Generate Random Data
@@ -157,32 +180,36 @@ elif(st.session_state.Data =="Data from random properties with added noise"):
 
 st.session_state.m_time = m_time
 st.session_state.m_head = m_head
+# A new dataset (selection, uploaded file or its time grid, regenerated random data) invalidates the automatic fit
+data_key = (st.session_state.Data, upload_key, st.session_state.get('K_random') if st.session_state.Data == "Data from random properties with added noise" else None)
+if st.session_state.get('slug_fit_source') != data_key:
+    st.session_state.slug_fit_source = data_key
+    st.session_state.slug_fit = None
 "---"
 # Computation
 
-def compute_statistics(measured, computed):
-    # Calculate the number of values
-    n = len(measured)
-
-    # Initialize a variable to store the sum of squared differences
-    total_me = 0
-    total_mae = 0
-    total_rmse = 0
-
-    # Loop through each value
-    for i in range(n): # Add the squared difference to the total
-        total_me   += (computed[i] - measured[i])
-        total_mae  += (abs(computed[i] - measured[i]))
-        total_rmse += (computed[i] - measured[i])**2
+# Callbacks to update session state
+def update_K():
+    st.session_state.K_slug_value = st.session_state.K_slug_input
+def update_t_off():
+    st.session_state.t_off_value = st.session_state.t_off_input
 
-    # Calculate the me, mae, mean squared error
-    me = total_me / n
-    mae = total_mae / n
-    meanSquaredError = total_rmse / n
+def fit_automatically(m_time, h_norm, rc, rw, L):
+    try:
+        fit = fit_bouwer_rice(m_time, h_norm, rc, rw, L)
+    except ValueError as error:
+        st.session_state.slug_fit = str(error)
+        return
+    st.session_state.slug_fit = fit
+    st.session_state.K_slug_value = float(np.clip(fit['log_K'], -6., -2.))
+    st.session_state.t_off_value = float(np.clip(fit['t_off'], 0., 1200.))
+    # Drop the widget states so the inputs are re-created with the fitted values
+    for key in ('K_slug_input', 't_off_input'):
+        st.session_state.pop(key, None)
 
-    # Raise the mean squared error to the power of 0.5 
-    rmse = (meanSquaredError) ** (1/2)
-    return me, mae, rmse
+@st.cache_data
+def compare_models(m_time, h_norm, rc, rw, L, b, d, anisotropy):
+    return compare_slug_models(m_time, h_norm, rc, rw, L, b, d, anisotropy)
 
 # Everything inside the fragment is re-computed with every input change
 @st.fragment
@@ -194,6 +221,10 @@ def slug():
     # Define the minimum and maximum for the logarithmic scale
     log_min = -6.0 # Corresponds to 10^-7 = 0.0000001
     log_max =  -2.0  # Corresponds to 10^0 = 1
+    if "K_slug_value" not in st.session_state:
+        st.session_state["K_slug_value"] = -3.0
+    if "t_off_value" not in st.session_state:
+        st.session_state["t_off_value"] = 0.0
 
     lc1, rc1 = st.columns((1,1))
     with lc1:
@@ -227,16 +258,31 @@ def slug():
             output_csv = df.to_csv(index=False).encode('utf-8')
             st.download_button('Download Random data as CSV', output_csv, file_name="random_data_slug.csv", mime='text/csv')
         scatter = st.toggle('**Show scatter plot**')
+
+    # For random data, the initial head increase due to the slug is randomly computed
+    if(st.session_state.Data =="Data from random properties with added noise"):
+        H0 = st.session_state.m_head_random[0]
+    else:
+        H0 = 0.01*slugsize/np.pi/(rc*100)**2
+    # Generate the normalized heads for the plot
+    h_norm = []
+    if(st.session_state.Data =="Data from random properties with added noise"):
+        for i in m_head_noise:
+            h_norm.append((i-h_static)/H0)
+    else:
+        for i in st.session_state.m_head:
+            h_norm.append((i-h_static)/H0)
     
     with rc1:
         # Log slider with input and print
         with st.expander('**Scale of plot and time offset**'):
-            t_off = st.number_input('**Time offset $t_{off}$** in s (up to 1200)', 0, 1200, 0, 1)
+            t_off = st.number_input('**Time offset $t_{off}$** in s (up to 1200)', 0., 1200., st.session_state["t_off_value"], 1., format="%.1f", key="t_off_input", on_change=update_t_off)
             x_plot = st.number_input('**Max x-value in plot** in s (up to 21600)', 60, 21600, 300, 30)
         container = st.container()
-        K_slider_value=st.slider('_(log of) hydraulic conductivity in m/s_', log_min,log_max,-3.0,0.01,format="%4.2f" )
+        K_slider_value=st.slider('_(log of) hydraulic conductivity in m/s_', log_min,log_max,st.session_state["K_slug_value"],0.01,format="%4.2f", key="K_slug_input", on_change=update_K)
         K = 10 ** K_slider_value
         container.write("**Hydraulic conductivity in m/s:** %5.2e" %K)
+        st.button(':orange[**Fit automatically**] (robust log-linear regression) and set $K$ and $t_{off}$ to the result', on_click=fit_automatically, args=(st.session_state.m_time, h_norm, rc, rw, L))
     
     columns = st.columns((1,4,1), gap = 'large')
     with columns[1]:
@@ -244,11 +290,6 @@ def slug():
             show_truth = st.toggle(":rainbow[How accurate are the parameter value estimates?]")
     
     # Calculation
-    # For random data, the initial head increase due to the slug is randomly computed
-    if(st.session_state.Data =="Data from random properties with added noise"):
-        H0 = st.session_state.m_head_random[0]
-    else:
-        H0 = 0.01*slugsize/np.pi/(rc*100)**2
     F = 2 * np.pi * L/np.log(L/rw)
     prq = np.pi * rc**2
     #t = np.arange(0, tmax, 1)
@@ -259,15 +300,6 @@ def slug():
     for i in t:
         t_plot.append(i+t_off)
     
-    # Generate the normalized heads for the plot
-    h_norm = []
-    if(st.session_state.Data =="Data from random properties with added noise"):
-        for i in m_head_noise:
-            h_norm.append((i-h_static)/H0)
-    else:
-        for i in st.session_state.m_head:
-            h_norm.append((i-h_static)/H0)
-    
     # Compute the function 
     exp_decay = np.exp(-F/prq*K*t)
     
@@ -282,9 +314,12 @@ def slug():
     props   = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
     out_txt = '\n'.join((       
                          r'$K$ (m/s) = %10.2E' % (K, ),
-                         r'$t_{off}$ (s) = %4i' % (t_off, )))
+                         r'$t_{off}$ (s) = %5.1f' % (t_off, )))
     ax.plot(t_plot,exp_decay, color='magenta', label='computed')
     plt.plot(st.session_state.m_time,h_norm, 'bo', mfc='none', label='measured')
+    fit = st.session_state.slug_fit
+    if isinstance(fit, dict):
+        plt.plot(np.array(st.session_state.m_time)[fit['window']], np.array(h_norm)[fit['window']], 'bo', label='used for the automatic fit')
     plt.axis([0,x_plot,0,1])
 
     plt.xlabel(r'time t in (s)', fontsize=14)
@@ -342,6 +377,59 @@ def slug():
     else:
         st.write("Slugsize = %5.2f_"% slugsize, ' cm³')
         st.write("Initial water level $H_0$ = %5.3f"% H0, ' m')
+    if isinstance(fit, dict):
+        h_window = np.array(h_norm)[fit['window']]
+        st.write("**Automatic fit** with %i measurements between $H/H_0$ = %4.2f and %4.2f:" %(fit['window'].sum(), h_window.max(), h_window.min()))
+        st.write("- Hydraulic conductivity **$K$ = %5.2e m/s** (95%% confidence interval %5.2e to %5.2e m/s)" %(fit['K'], *fit['ci_K']))
+        if fit['t_off_clipped']:
+            st.write("- Time offset **$t_{off}$ = %5.1f s**, fixed at the limit of the record: the regression line places the slug before the first measurement or after the start of the fitted decay, so only $K$ is fitted" %fit['t_off'])
+        else:
+            st.write("- Time offset **$t_{off}$ = %5.1f s** (95%% confidence interval %5.1f to %5.1f s)" %(fit['t_off'], *fit['ci_t_off']))
+        if fit['t_off'] > 1200.:
+            st.write("- The time offset exceeds the input range, the input is set to 1200 s")
+    elif fit is not None:
+        st.warning('The automatic fit is not possible: ' + fit)
+
+    "---"
+    if st.toggle('**Compare the Bouwer & Rice, Hvorslev and KGS models** for these data'):
+        st.markdown("""
+            All three models are fitted automatically to the normalized heads. The **Hvorslev** solution uses the shape factor of a screen in an anisotropic aquifer, the **KGS model** (Hyder et al. 1994) additionally accounts for the specific storage $S_s$ of a confined aquifer and for partial penetration. RMSE and AIC refer to the same measurements (the head decay after the latest fitted offset) for all models; the lowest AIC indicates the preferred model.
+            """)
+        lc2, rc2 = st.columns((1,1))
+        with lc2:
+            b = st.number_input("Aquifer thickness $b$ in m", value = max(5., L), min_value = L, step = 0.5)
+            d = st.number_input("Depth of the top of the screen below the top of the aquifer in m", value = 0., min_value = 0., max_value = b - L, step = 0.1)
+        with rc2:
+            log_anisotropy = st.slider('_(log of) anisotropy_ $K_z/K_r$', -3.0, 0.0, 0.0, 0.1, format="%4.1f")
+        try:
+            fits = compare_models(st.session_state.m_time, h_norm, rc, rw, L, b, d, 10 ** log_anisotropy)
+        except ValueError as error:
+            st.warning('The models cannot be compared: ' + str(error))
+            return
+        table = pd.DataFrame({name: {'K in m/s': '%5.2e' %fit['K'],
+                                     '95% confidence interval of K': '%5.2e - %5.2e' %fit['ci_K'],
+                                     't_off in s': '%5.1f' %fit['t_off'],
+                                     'Ss in 1/m': '%5.2e' %fit['Ss'] if 'Ss' in fit else '-',
+                                     'RMSE of H/H0': '%5.3f' %fit['decay_rmse'],
+                                     'AIC': '%5.1f' %fit['decay_aic'],
+                                     'NSE': '%5.3f' %fit['decay_nse'],
+                                     'Lag-1 autocorrelation of the residuals': '%5.2f' %fit['decay_autocorrelation']} for name, fit in fits.items()})
+        st.dataframe(table)
+        fig = plt.figure(figsize=(15,5))
+        for i, (name, fit) in enumerate(fits.items()):
+            ax = fig.add_subplot(1, 3, i + 1)
+            ax.plot(st.session_state.m_time, h_norm, 'bo', mfc='none', label='measured')
+            ax.plot(np.array(st.session_state.m_time)[fit['window']], np.array(h_norm)[fit['window']], 'bo', label='fitted')
+            ax.plot(st.session_state.m_time, fit['h'], color='magenta', label='computed')
+            ax.set_yscale('log')
+            ax.set_ylim(0.01, 1.5)
+            ax.set_xlim(0, x_plot)
+            ax.set_xlabel(r'time t in (s)', fontsize=12)
+            ax.set_ylabel(r'H/Ho', fontsize=12)
+            ax.set_title('%s: $K$ = %5.2e m/s' %(name, fit['K']), fontsize=13)
+            ax.grid(which="both")
+            ax.legend(fontsize=10)
+        st.pyplot(fig=fig)
 
 slug()
 
@@ -354,6 +442,12 @@ with st.expander('**Click here for some references**'):
     st.markdown("""    
                 Bouwer, H., & Rice, R. C. (1976). A slug test for determining hydraulic conductivity of unconfined aquifers with completely or partially penetrating wells. [Water Resources Research, 12(3), 423-428.](https://doi.org/10.1029/WR012i003p00423)
             
+                Hvorslev, M. J. (1951). Time lag and soil permeability in ground-water observations. Bulletin No. 36, Waterways Experiment Station, Corps of Engineers, U.S. Army, Vicksburg, Mississippi.
+            
+                Hyder, Z., Butler, J. J., McElwee, C. D., & Liu, W. (1994). Slug tests in partially penetrating wells. Water Resources Research, 30(11), 2945-2957.
+            
+                Cooper, H. H., Bredehoeft, J. D., & Papadopulos, I. S. (1967). Response of a finite-diameter well to an instantaneous charge of water. Water Resources Research, 3(1), 263-269.
+            
                 [Kruseman, G.P., de Ridder, N.A., & Verweij, J.M.,  1991.](https://gw-project.org/books/analysis-and-evaluation-of-pumping-test-data/) Analysis and Evaluation of Pumping Test Data, International Institute for Land Reclamation and Improvement, Wageningen, The Netherlands, 377 pages.
                 
                 The  interactive app is based on an idea from Prof. Masaki Hayashi.
@@ -1,25 +1,19 @@
 import numpy as np
 import pandas as pd
 import streamlit as st
-import random
-import string
 import io
-import unicodedata
+import sys
+from pathlib import Path
 import matplotlib.pyplot as plt
 import re
-from deep_translator import GoogleTranslator
+ROOT = str(Path(__file__).resolve().parents[1])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.loggers import read_logger
+from gwtools.metrics import compute_statistics
+from gwtools.translation import DEFAULT_BACKEND, TranslationCache, get_backend, translate_markdown
 
 ### 1ST PART - Translation
-# ✅ Generate a unique random sequence for each term
-def generate_random_key():
-    """Creates a truly random sequence to act as a placeholder."""
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=10))
-    
-def remove_accents(input_str):
-    """Removes accents and normalizes Unicode characters for consistent replacement."""
-    nfkd_form = unicodedata.normalize('NFKD', input_str)
-    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
-
 def apply_custom_terms(text, language_code):
     """Replaces specific technical terms with predefined translations before sending to translator."""
     if language_code in custom_terms_dict:
@@ -28,88 +22,24 @@ def apply_custom_terms(text, language_code):
             text = re.sub(rf'\b{re.escape(term)}\b', translation, text)  # Präzise Ersetzung
     return text
     
-def translate_text(text, target_language):
-    """ Translates markdown and HTML text while preserving formatting. """
-   
-    if target_language == ORIGINAL_LANGUAGE_CODE:
-        return text  # No translation needed
-
-    # Replace technical terms with randomized placeholders**
-    for term, placeholder in technical_terms.items():
-        text = re.sub(rf'\b{re.escape(term)}\b', placeholder, text, flags=re.IGNORECASE)
-
-    translator = GoogleTranslator(source="auto", target=target_language)
-
-    # Step 1: Preserve HTML content separately
-    def translate_html(match):
-        """ Translates only the inner text of HTML tags, preserving structure. """
-        opening_tag, inner_text, closing_tag = match.groups()
-        translated_inner_text = translator.translate(inner_text)  # Translate only inner text
-        return f"{opening_tag}{translated_inner_text}{closing_tag}"
-
-    html_pattern = r"(<[^>]+>)(.*?)(</[^>]+>)"
-    text = re.sub(html_pattern, translate_html, text)
-
-    # Step 2: Add spaces inside **bold** and *italic* before translation
-    text_with_spaces = re.sub(r"(\*\*|\*)(\S.*?\S)(\*\*|\*)", r"\1 \2 \3", text)
-
-    # Step 3: Split text into lines to preserve Markdown structure
-    lines = text_with_spaces.strip().split("\n")
+@st.cache_resource
+def translation_cache():
+    """On-disk store of translated segments, shared by all sessions."""
+    return TranslationCache()
 
-    translated_lines = []
-    for line in lines:
-        stripped_line = line.strip()
+def translate_sections(sections, target_language):
+    """ Translates all markdown and HTML sections of the page at once while preserving formatting. """
 
-        if stripped_line.startswith("#"):  # ✅ Preserve headers (even multiple ##)
-            header_level = len(stripped_line) - len(stripped_line.lstrip("#"))  # Count #
-            text_without_hash = stripped_line.lstrip("#").strip()  # Remove #
-            translated_text = translator.translate(text_without_hash)  # Translate only text
-
-            # Normalize accents before replacing placeholders
-            normalized_text = remove_accents(translated_text)
-
-            # Replace placeholders with correct translations
-            if target_language in translations_dict:
-                for placeholder, original_term in decryption_map.items():
-                    # Get the correct translation for the technical term
-                    correct_translation = translations_dict[target_language].get(original_term, original_term)
-                    # Replace placeholder with translated term
-                    normalized_text = re.sub(re.escape(placeholder), correct_translation, normalized_text, flags=re.IGNORECASE)
+    if target_language == ORIGINAL_LANGUAGE_CODE:
+        return dict(sections)  # No translation needed
 
-           #translated_lines.append("#" * header_level + " " + translated_text)  # Rebuild header
-            translated_lines.append("#" * header_level + " " + normalized_text)  # Rebuild header
-        else:
-            # Translate and normalize normal text lines
-            translated_text = translator.translate(stripped_line)
-            normalized_text = remove_accents(translated_text)  # ✅ Fix: process single string
-
-            # Replace placeholders with correct translations
-            if target_language in translations_dict:
-                for placeholder, original_term in decryption_map.items():
-                    # Get the correct translation for the technical term
-                    correct_translation = translations_dict[target_language].get(original_term, original_term)
-                    # Replace placeholder with translated term
-                    normalized_text = re.sub(re.escape(placeholder), correct_translation, normalized_text, flags=re.IGNORECASE)
-            translated_lines.append(normalized_text)  # ✅ Append the corrected text
-
-    translated_text = "\n\n".join(translated_lines)  # Ensure proper spacing
-
-    # Step 4: Remove spaces inside **bold** and *italic* after translation
-    final_text = re.sub(r"(\*\*|\*) (.*?) (\*\*|\*)", r"\1\2\3", translated_text)
-
-    return final_text
-
-# Store random placeholders directly in `technical_terms`
-technical_terms = {
-    "slug test": generate_random_key(),
-    "hydraulic conductivity": generate_random_key(),
-    "aquifer": generate_random_key(),
-    "pumping test": generate_random_key(),
-    "slug": generate_random_key()
-}
+    # Google Translate, the local dictionary or the offline stand-in (GWTOOLS_TRANSLATOR)
+    backend = get_backend(DEFAULT_BACKEND, target_language)
+    return translate_markdown(sections, backend, target_language, technical_terms,
+                              translations_dict.get(target_language), translation_cache())
 
-# ✅ Reverse lookup dictionary to get the original term from the placeholder
-decryption_map = {v: k for k, v in technical_terms.items()}  # Reverse map for decoding
+# Technical terms are masked during translation and replaced by the translations below
+technical_terms = ["slug test", "hydraulic conductivity", "aquifer", "pumping test", "slug"]
 
 # Define correct translations for technical terms per language
 translations_dict = {
@@ -282,12 +212,9 @@ for key in sections.keys():
 
 # Translate only when the language actually changes
 if st.session_state["current_lang"] != target_lang:
-    new_sections = {}
-
-    # Translate Sections
-    for key in sections:
-        translated_text = translate_text(sections[key], target_lang)
-        new_sections[key] = translated_text if translated_text else sections[key]  # Keep English if translation fails
+    # Translate all sections together (batched requests, cached segments)
+    new_sections = translate_sections(sections, target_lang)
+    new_sections = {key: new_sections[key] or sections[key] for key in sections}  # Keep English if translation fails
 
     # Update translations in session state after all translations are done
     st.session_state["translated_sections"] = new_sections
@@ -356,6 +283,11 @@ part07_placeholder.markdown(st.session_state["translated_sections"].get("part_07
 
 # 3rd part COMPUTATION HERE
 
+# Logger files (e.g. Diver exports) with many samples are reduced before plotting
+@st.cache_data
+def load_logger(content, origin, per_decade):
+    return read_logger(io.BytesIO(content), origin=origin, per_decade=per_decade)
+
 # Available Data / Choose data
 # Select data
 columns = st.columns((1,4,1), gap = 'large')
@@ -395,11 +327,18 @@ elif(st.session_state.Data =="Load your own CSV dataset"):
     rc_ini = 0.025
     rw_ini = 0.07
     L_ini = 2.
-    uploaded_file = st.file_uploader("Choose a CSV file for evaluation (time in seconds / normalized heads in meters)")
+    uploaded_file = st.file_uploader("Choose a CSV file or logger export for evaluation (time in seconds or date/time stamps / heads in meters, e.g. Diver files)")
     if uploaded_file is not None:
-        df = pd.read_csv(uploaded_file)
-        m_time = list(df.iloc[:,0].values)
-        m_head = list(df.iloc[:,1].values)
+        # Logger records are read in chunks and averaged on a log-spaced time grid that starts at the slug
+        lc_log, rc_log = st.columns((1,1))
+        with lc_log:
+            t_slug = st.number_input("Time of the slug in s after the first sample (start of the log-spaced time grid)", value = 0., min_value = 0., step = 1.)
+        with rc_log:
+            per_decade = st.slider("Samples per log cycle of time (thinning of long logger records)", 10, 200, 50, 10)
+        logger = load_logger(uploaded_file.getvalue(), t_slug, per_decade)
+        m_time = logger['t'].tolist()
+        m_head = logger['values'].tolist()
+        st.write('%i samples of **%s** read, %i log-spaced values used' %(logger['n'], logger['name'], len(m_time)))
     st.write('Overview about loaded data', m_head[:min(100, len(m_head))])
 elif(st.session_state.Data =="Data from random properties with added noise"):
     # Generate Random Data
@@ -435,30 +374,6 @@ st.session_state.m_head = m_head
 "---"
 # Computation
 
-def compute_statistics(measured, computed):
-    # Calculate the number of values
-    n = len(measured)
-
-    # Initialize a variable to store the sum of squared differences
-    total_me = 0
-    total_mae = 0
-    total_rmse = 0
-
-    # Loop through each value
-    for i in range(n): # Add the squared difference to the total
-        total_me   += (computed[i] - measured[i])
-        total_mae  += (abs(computed[i] - measured[i]))
-        total_rmse += (computed[i] - measured[i])**2
-
-    # Calculate the me, mae, mean squared error
-    me = total_me / n
-    mae = total_mae / n
-    meanSquaredError = total_rmse / n
-
-    # Raise the mean squared error to the power of 0.5 
-    rmse = (meanSquaredError) ** (1/2)
-    return me, mae, rmse
-
 # Everything inside the fragment is re-computed with every input change
 @st.fragment
 def slug():
@@ -1,7 +1,13 @@
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[1])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.well_hydraulics import well_function, theis_u, theis_wu, compute_s
+from gwtools.fitting import fit_theis
 import pandas as pd
 import streamlit as st
 
@@ -43,44 +49,14 @@ st.markdown("""
 """
 )            
 # Computation
-# (Here the necessary functions like the well function $W(u)$ are defined. Later, those functions are used in the computation)
-# Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-
-def theis_wu(Q, T, s):
-    wu = s * 4. * np.pi * T / Q
-    return wu
-
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
+# (The Theis functions like the well function $W(u)$ are imported from gwtools.well_hydraulics, further functions are defined here. Later, those functions are used in the computation)
 
 # (Here, the methode computes the data for the well function. Those data can be used to generate a type curve.)
 u_max = 1
 r_max = 100000
-u  = [u_max for x in range(r_max)]
-um = [u_max for x in range(r_max)]
-u_inv  = [r_max/u_max for x in range(r_max)]
-um_inv = [r_max/u_max for x in range(r_max)]
-w_u  = [well_function(u_max/r_max) for x in range(r_max)]
-w_um = [well_function(u_max/r_max) for x in range(r_max)]
-
-for x in range(1,r_max,1):
-    if x>0:
-        u[x] = x*u_max/r_max
-        u_inv[x] = 1/u[x]
-        w_u[x] = well_function(u[x])
+u  = np.arange(1, r_max) * u_max / r_max
+u_inv  = 1 / u
+w_u  = well_function(u)
 
 # Select data
 columns = st.columns((10,80,10), gap = 'large')
@@ -185,6 +161,20 @@ st.markdown("""
 """
 )
 
+# Initial values of the (log) T and S sliders
+if 'T_slider' not in st.session_state:
+    st.session_state.T_slider = -3.0
+if 'S_slider' not in st.session_state:
+    st.session_state.S_slider = -4.0
+
+# Callback for the automatic fit - the sliders are set to the fitted values
+def fit_automatically():
+    fit = fit_theis(m_time_s, m_ddown, Qs, r)   # starts from the Cooper-Jacob estimate
+    fit['data'] = st.session_state.Data
+    st.session_state.theis_fit = fit
+    st.session_state.T_slider = float(fit['log_T'])
+    st.session_state.S_slider = float(fit['log_S'])
+
 @st.fragment
 def inverse():
     # This is the function to plot the graph with the data     
@@ -197,17 +187,18 @@ def inverse():
    
     columns2 = st.columns((1,1), gap = 'large')
     with columns2[0]:
-        T_slider_value=st.slider('(log of) **Transmissivity** in m2/s', log_min1,log_max1,-3.0,0.01,format="%4.2f" )
+        T_slider_value=st.slider('(log of) **Transmissivity** in m2/s', log_min1,log_max1,step=0.01,format="%4.2f", key='T_slider')
         # Convert the slider value to the logarithmic scale
         T = 10 ** T_slider_value
         # Display the logarithmic value
         st.write("_Transmissivity_ in m2/s: %5.2e" %T)
-        S_slider_value=st.slider('(log of) **Storativity**', log_min2,log_max2,-4.0,0.01,format="%4.2f" )
+        S_slider_value=st.slider('(log of) **Storativity**', log_min2,log_max2,step=0.01,format="%4.2f", key='S_slider')
         # Convert the slider value to the logarithmic scale
         S = 10 ** S_slider_value
         # Display the logarithmic value
         st.write("_Storativity_ (dimensionless):** %5.2e" %S)
         refine_theis = st.toggle("**Refine** the range of the **Theis matching plot**")
+        st.button('**Fit automatically** (Levenberg-Marquardt) and set T and S to the result', on_click=fit_automatically)
     with columns2[1]:
         Q_pred = st.slider(f'**Pumping rate** (m^3/s) for the **prediction**', 0.001,0.100,Qs,0.001,format="%5.3f")
         r_pred = st.slider(f'**Distance** (m) from the **well** for the **prediction**', 1,1000,r,1)
@@ -228,12 +219,9 @@ def inverse():
     
     # PLOT MEASURED DATA
     max_s = 20
-    x = 0
-    for t1 in m_time_s:
-        um[x] = theis_u(T,S,r,t1)
-        um_inv[x] = 1/um[x]
-        w_um[x] = theis_wu(Qs,T,m_ddown[x])
-        x = x+1
+    um = theis_u(T, S, r, np.array(m_time_s))
+    um_inv = 1/um
+    w_um = theis_wu(Qs, T, m_ddown)
 
     # PLOT DRAWDOWN VS TIME
     # Range of delta_h / delta_l values (hydraulic gradient)
@@ -311,6 +299,12 @@ def inverse():
         st.write("Transmissivity T = ","% 10.2E"% T, " m^2/s")
         st.write("(Hydr. cond. K) = ","% 10.2E"% (T/b), " m^2/s")
         st.write("Storativity    S = ","% 10.2E"% S, "[-]")
+        if st.session_state.get('theis_fit', {}).get('data') == st.session_state.Data:
+            fit = st.session_state.theis_fit
+            sd_log_T, sd_log_S = np.sqrt(np.diag(fit['cov']))
+            st.write("**Automatic fit** (%i iterations)" % fit['iterations'])
+            st.write("T = % 10.2E m^2/s, S = % 10.2E [-], RMSE = %5.3f m" % (fit['T'], fit['S'], fit['rmse']))
+            st.write("Std. dev. of log T = %5.3f, of log S = %5.3f, correlation = %5.2f" % (sd_log_T, sd_log_S, fit['cov'][0, 1] / sd_log_T / sd_log_S))
 
     with columns3[1]:
         st.write("**Prediction**")
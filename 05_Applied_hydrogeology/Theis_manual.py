@@ -1,11 +1,18 @@
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
 import io
+import sys
+from pathlib import Path
 import pandas as pd
 import streamlit as st
 from streamlit_extras.stodo import to_do
+ROOT = str(Path(__file__).resolve().parents[1])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.datasets import load_dataset, registry
+from gwtools.diagnostics import bourdet_derivative, log_resample
+from gwtools.well_hydraulics import theis_type_curve
 
 ### 01 TITLE AND HEADER
 
@@ -53,55 +60,9 @@ st.markdown('''
 
 ### 05 FUNCTIONS
 
-#Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-
-def theis_wu(Q, T, s):
-    wu = s * 4. * np.pi * T / Q
-    return wu
-
-def deriv(t, tm, s, sm):
-    #d = (s-sm)/(np.log(t)-np.log(tm))
-    d=((t+tm)/2)*((s-sm)/(t-tm))
-    return d
-    
-# Data for the type curve plot
-u_max = 10
-r_max = 1000000
-u  = [u_max for x in range(r_max)]
-um = [u_max for x in range(r_max)]
-u_inv  = [r_max/u_max for x in range(r_max)]
-um_inv = [r_max/u_max for x in range(r_max)]
-w_u  = [well_function(u_max/r_max) for x in range(r_max)]
-w_um = [well_function(u_max/r_max) for x in range(r_max)]
-
-
 ### 07 COMPUTATION
-#for x in range(1,r_max,1):
-#    if x>0:
-#        u[x] = x*u_max/r_max
-#        u_inv[x] = 1/u[x]
-#        w_u[x] = well_function(u[x])
-    
-# Define parameters
-num_points = 100  # Adjust for desired resolution
-u_min = 1e-6  # Set a small minimum u value to avoid division by zero
-u_max = 10    # Adjust u_max based on problem constraints
-
-# Use log-spaced values to cover a wide range efficiently
-u = np.geomspace(u_min, u_max, num=num_points)  # Log-spaced values of u
-u_inv = 1 / u
-w_u = well_function(u)  # Assuming well_function is vectorized
+# Type curve for u from 1e-6 to 10 (log10 exponents)
+u_inv, w_u = theis_type_curve(-6, 1, 100)
     
 ### 08 PLOTTING
 # Plotting the Theis curve
@@ -169,10 +130,13 @@ st.markdown('''
 
 # TODO ALLOW CSV / MORE DATA (RANDOM GENERATED)
 # Select data and solution
+# Registered field datasets (label -> key), see 05_Applied_hydrogeology/DATA/Pumping_tests/datasets.csv
+datasets = registry()
+keys = {label: key for key, label in datasets.loc[datasets['test_type'] == 'pumping', 'label'].items() if key != 'synthetic'}
 columns12 = st.columns((1,1), gap = 'large')
 with columns12[0]:
     datasource = st.selectbox("**What data should be used?**",
-    ("Synthetic textbook data", "Load own CSV dataset"), key='Data')
+    ("Synthetic textbook data", "Load own CSV dataset") + tuple(keys), key='Data')
 if (datasource == "Synthetic textbook data"):
     # Data and parameter from SYMPLE exercise
     m_time = [1,1.5,2,2.5,3,4,5,6,8,10,12,14,18,24,30,40,50,60,100,120] # time in minutes
@@ -206,17 +170,53 @@ elif(st.session_state.Data =="Load own CSV dataset"):
         r = st.number_input(f'**Distance** (m) from the **well** for the **observation**', 1,1000,100,1)
         b = st.number_input(f'**average Aquifer thickness** (m)', 1.,200.,10.,0.01)
         Qd = Qs*60*60*24 # m^3/d
+else:
+    # Field data and parameters from the dataset registry
+    dataset = load_dataset(keys[datasource])
+    m_time = list(dataset['t']/60)  # time in minutes
+    m_ddown = list(dataset['s'])     # drawdown in meters
+    r = dataset['r']     # m
+    b = dataset['b']     # m
+    Qs = dataset['Q']    # m^3/s
+    Qd = Qs*60*60*24     # m^3/d
+    st.write('**Pumping rate (m³/s)** for the **pumping test** = % 5.3f'% Qs)
+    st.write('**Distance** (m) from the **well** for the **observation** =  % 6.2f'% r)
+    st.write('**average Aquifer thickness** (m) = % 6.2f'% b)
 
 semilog = st.toggle('Switch from log-log to semi-log plot')
-# Parameter for the measured data plot
+show_deriv = st.toggle('Show the **Bourdet derivative** $ds/d\\ln t$ (diagnostic plot)')
+if show_deriv:
+    st.markdown('''
+            The derivative of the drawdown with respect to the logarithm of time shows the flow regime: it is **horizontal** for radial flow in an infinite confined aquifer (Theis), **falls** for leakage or a recharge boundary, **rises** (doubles) for a no-flow boundary and shows a **dip** between two horizontal parts for delayed yield of an unconfined aquifer. Each derivative point uses the first measurements on the left and right that are at least $L$ apart in $\\ln t$ - a larger $L$ smooths noisy logger data. Long records can be averaged in log-spaced time intervals first.
+            ''')
+    columns13 = st.columns((1,1), gap = 'large')
+    with columns13[0]:
+        L_deriv = st.slider('**Smoothing window** $L$ (in $\\ln t$)', 0.0, 1.0, 0.2, 0.05)
+    with columns13[1]:
+        resample = st.toggle('Average the data in log-spaced time intervals', value = len(m_time) > 500)
+        per_decade = st.slider('Intervals per log cycle of time', 5, 50, 20, 5, disabled = not resample)
 
-t_max = len(m_time)
-d = [0 for x in range(t_max)]
+# Parameter for the measured data plot
+m_time_d = np.asarray(m_time, dtype=float)
+m_ddown_d = np.asarray(m_ddown, dtype=float)
+if show_deriv:
+    order = np.argsort(m_time_d)
+    m_time_d, m_ddown_d = m_time_d[order], m_ddown_d[order]
+    m_ddown_d = m_ddown_d[m_time_d > 0]
+    m_time_d = m_time_d[m_time_d > 0]
+    if resample:
+        m_time_d, m_ddown_d = log_resample(m_time_d, m_ddown_d, per_decade)
+    m_deriv = bourdet_derivative(m_time_d, m_ddown_d, L_deriv)
 
 fig = plt.figure(figsize=(9,6))
 ax = fig.add_subplot(1, 1, 1)
 plt.subplots_adjust(left=0.1, bottom=0.1, right=0.9, top=0.9)  # adjust plot area
 ax.plot(m_time, m_ddown,'ro', markersize=6)
+if show_deriv:
+    if resample:
+        ax.plot(m_time_d, m_ddown_d, 'ko', markersize=3, label='averaged drawdown')
+    ax.plot(m_time_d, m_deriv, 'b^', markersize=5, label='Bourdet derivative')
+    ax.legend()
 if semilog:
     plt.xscale("log")
 else:
@@ -294,6 +294,22 @@ if st.button('Show the computed results'):
     st.write("- Transmissivity **$T$ = % 10.2E"% transmissivity, " m²/s**")
     st.write("- Storativity **$S$ = % 10.2E"% storativity, "[dimensionless]**")
 
+if show_deriv and st.toggle('Show the **matched data and derivative on the type curve**'):
+    # Measured data in type-curve coordinates with the matching point (t0, s0) <-> (1/u, W(u)); the Theis derivative is e^-u
+    fig = plt.figure(figsize=(9,6))
+    ax = fig.add_subplot(1, 1, 1)
+    ax.plot(u_inv, w_u, color = 'black', linewidth = 2, label='Theis type curve $W(u)$')
+    ax.plot(u_inv, np.exp(-1 / u_inv), '--', color = 'black', linewidth = 2, label='Theis derivative $e^{-u}$')
+    ax.plot(np.asarray(m_time)/time_input*match_u_inv, np.asarray(m_ddown)/ddown*match_wu, 'ro', markersize=4, label='measured drawdown')
+    ax.plot(m_time_d/time_input*match_u_inv, m_deriv/ddown*match_wu, 'b^', markersize=5, label='Bourdet derivative')
+    plt.yscale("log")
+    plt.xscale("log")
+    plt.axis([0.1,1E4,1E-2,1E+1])
+    ax.set(xlabel='1/u', ylabel='w(u)', title='Matched data and derivative on the Theis type curve')
+    ax.grid(which="both", color='grey', linewidth=0.5)
+    ax.legend()
+    st.pyplot(fig)
+
 # TODO - INSTRUCTION HOW TO USE (MAYBE SCREENCAST)
 
 with st.expander(':green[**Click here**] to see a **video tutorial** of the manual Theis type-curve matching'):
@@ -11,7 +11,14 @@ Created on Sun Oct 13 15:28:58 2024
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[3])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.well_hydraulics import compute_s
+from gwtools.dewatering import compute_linU, optimize_rate
+from gwtools.sensitivity import full_factorial, sobol_analysis
 import streamlit as st
 import streamlit_book as stb
 from streamlit_extras.stodo import to_do
@@ -48,33 +55,7 @@ if st.toggle('Show additional **Notes for instructors**'):
 
 
 
-# (Here the necessary functions like the well function $W(u)$ are defined. Later, those functions are used in the computation)
-# Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-
-def theis_wu(Q, T, s):
-    wu = s * 4. * np.pi * T / Q
-    return wu
-
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
-
-def compute_linU(s, s_U0, s_U1):
-    u = (s-s_U0)/(s_U1-s_U0)
-    u = u.clip(0,1)
-    return u
+# (The Theis functions like the well function $W(u)$ are imported from gwtools.well_hydraulics, the stakeholder utility compute_linU from gwtools.dewatering. Later, those functions are used in the computation)
 
 r_preds = np.array([100, 2500, 7500])
 
@@ -125,8 +106,6 @@ with columns2[1]:
     S_max_slider_value=st.slider('Higher (log of) Storativity - unitless', S_min_slider_value,log_max1,(S_min_slider_value+log_max1)/2,0.01,format="%4.2f" )
     S_max_value = 10 ** S_max_slider_value     # Convert the slider value to the logarithmic scale
 
-S_values =  10 ** np.linspace(S_min_slider_value, S_max_slider_value, 5)
-
 stakeholder = st.selectbox('Choose a Stakeholder:',["Mine", "Town", "Environment"])
 
 if (stakeholder == "Mine"):
@@ -140,25 +119,18 @@ r = r_preds[stakeholder_slider_value]
 
 t2 = np.linspace(.1, 10, 100)     # in years
 
-T_values = [T_min_value, T_min_value, T_max_value, T_max_value]
-S_values = [S_min_value, S_max_value, S_min_value, S_max_value]
-    
-counter=-1
-for T in T_values:
-    counter += 1
-    S = S_values[counter]
-    s = compute_s(T, S, t2*365 *24 *60 *60, Q, r)
-    if counter == 0:
-        plt.plot(t2, s, linewidth=3., color='r', label=r'low T / low S')
-    if counter == 1:
-        plt.plot(t2, s, linewidth=3., color='g', label=r'low T / high S')
-    if counter == 2:
-        plt.plot(t2, s, linewidth=3., color='b', label=r'high T / low S')
-    if counter == 3:
-        plt.plot(t2, s, linewidth=3., color='k', label=r'high T / high S')
+# Full factorial design with 5 levels of log T and log S, the first, fifth, 21st and 25th combinations are the corners
+TS_values = 10 ** full_factorial(np.linspace(T_min_slider_value, T_max_slider_value, 5), np.linspace(S_min_slider_value, S_max_slider_value, 5))
+s_ff = compute_s(TS_values[:,:1], TS_values[:,1:], t2*365 *24 *60 *60, Q, r)
+
+plt.fill_between(t2, s_ff.min(axis=0), s_ff.max(axis=0), color='grey', alpha=0.3, label=r'all 5 x 5 combinations of T and S')
+plt.plot(t2, s_ff[0], linewidth=3., color='r', label=r'low T / low S')
+plt.plot(t2, s_ff[4], linewidth=3., color='g', label=r'low T / high S')
+plt.plot(t2, s_ff[20], linewidth=3., color='b', label=r'high T / low S')
+plt.plot(t2, s_ff[24], linewidth=3., color='k', label=r'high T / high S')
 
 plt.xlabel(r'Time, years', fontsize=14)
-plt.ylabel(r'Utility', fontsize=14)
+plt.ylabel(r'Drawdown, m', fontsize=14)
 plt.axis([0, None, 0, None])
 plt.legend()
     
@@ -222,6 +194,71 @@ plt.legend()
     
 st.pyplot(fig)
 
+st.markdown(
+    """
+
+    ---
+    
+    #### Which parameter matters most for each stakeholder?
+    
+    The sensitivity analysis samples _T_ and _S_ (within the ranges chosen above), the pumping rate _Q_, and the distance to the stakeholders at the same time. The **first-order Sobol index** is the fraction of the variance of the utility (or drawdown) that is caused by one parameter alone; the **total index** also includes its interactions with the other parameters. An index close to zero means that the parameter hardly matters for this stakeholder.
+
+"""
+)
+
+columns_sa = st.columns((1,1,1), gap = 'large')
+with columns_sa[0]:
+    Q_range = st.slider('Range of the **pumping rate** in m3/d', 10., 500., (150., 350.), 10., format="%4.0f")
+with columns_sa[1]:
+    r_uncert = st.slider('Uncertainty of the **distance** to the stakeholders in %', 0, 50, 10, 1)
+with columns_sa[2]:
+    n_sobol = st.select_slider('Number of base samples', (256, 1024, 4096), 1024)
+
+names_sa = ['T', 'S', 'Q', 'distance']
+bounds_sa = [(T_min_slider_value, T_max_slider_value), (S_min_slider_value, S_max_slider_value),
+             (Q_range[0], Q_range[1]), (1 - r_uncert/100, 1 + r_uncert/100)]
+U_values = np.array([[mine_s_U0_value, mine_s_U1_value], [town_s_U0_value, town_s_U1_value], [env_s_U0_value, env_s_U1_value]])
+t_assess = np.array([mine_t_value, town_t_value, env_t_value])*365 *24 *60 *60
+
+def dewatering_model(X):
+    # Drawdown (samples x stakeholders x times) and utility at the assessment time (samples x stakeholders) in one broadcast
+    T_sa, S_sa, Q_sa, r_sa = 10 ** X[:,:1], 10 ** X[:,1:2], X[:,2:3]/24/60/60, X[:,3:4] * r_preds
+    s_t = compute_s(T_sa[..., None], S_sa[..., None], t2*365 *24 *60 *60, Q_sa[..., None], r_sa[..., None])
+    u_sa = compute_linU(compute_s(T_sa, S_sa, t_assess, Q_sa, r_sa), U_values[:,0], U_values[:,1])
+    return np.concatenate((u_sa[..., None], s_t), axis=-1)
+
+sa = sobol_analysis(dewatering_model, bounds_sa, n_sobol, seed=0)
+colors_sa = ['r', 'g', 'b', 'k']
+
+fig = plt.figure(figsize=(12,5))
+for i, name in enumerate(["Mine", "Town", "Environment"]):
+    ax = fig.add_subplot(1, 3, i+1)
+    ax.bar(np.arange(4)-0.2, np.nan_to_num(sa['S1'][:,i,0]).clip(0,1), 0.4, color=colors_sa, alpha=0.5, label='first-order')
+    ax.bar(np.arange(4)+0.2, np.nan_to_num(sa['ST'][:,i,0]).clip(0,1), 0.4, color=colors_sa, label='total')
+    ax.set_xticks(np.arange(4), names_sa)
+    ax.set_ylim(0, 1)
+    plt.title('Utility of the %s' % name, fontsize=14)
+    if i == 0:
+        plt.ylabel(r'Sobol index', fontsize=14)
+        plt.legend()
+st.pyplot(fig)
+if np.isnan(sa['ST'][0,:,0]).any():
+    st.write('_Missing bars: the utility of this stakeholder does not change within the chosen ranges (it is always 0 or 1)._')
+
+fig = plt.figure(figsize=(12,5))
+for i, name in enumerate(["Mine", "Town", "Environment"]):
+    ax = fig.add_subplot(1, 3, i+1)
+    for j in range(4):
+        ax.plot(t2, sa['ST'][j,i,1:], linewidth=3., color=colors_sa[j], label=names_sa[j])
+    ax.set_ylim(0, 1)
+    plt.xlabel(r'Time, years', fontsize=14)
+    plt.title('Drawdown at the %s' % name, fontsize=14)
+    if i == 0:
+        plt.ylabel(r'Total Sobol index', fontsize=14)
+        plt.legend()
+st.pyplot(fig)
+st.write('The analysis used %i model runs for %i stakeholders and %i times.' % (sa['runs'], len(r_preds), len(t2)))
+
 st.markdown(
     """
 
@@ -462,6 +499,66 @@ plt.legend()
 st.pyplot(fig)
 
 
+st.markdown(
+    """
+
+    ---
+
+    #### Which pumping rate is best if T and S are uncertain?
+    
+    Instead of one conservative T and S pair, consider an **ensemble of many plausible T and S values** around the values chosen above. For every pumping rate, each stakeholder then has a distribution of utilities. It can be summarized by the **mean utility** or, for a risk-averse stakeholder, by the **CVaR** (conditional value at risk): the mean utility of the worst cases. Pumping rates that cannot be improved for one stakeholder without making another one worse off form the **Pareto front**.
+
+"""
+)
+
+columns_opt = st.columns((1,1,1), gap = 'large')
+with columns_opt[0]:
+    log_uncert = st.slider('Uncertainty of log T and log S (standard deviation)', 0.01, 1., 0.2, 0.01, format="%4.2f")
+with columns_opt[1]:
+    alpha_cvar = st.slider('CVaR: fraction of worst cases', 0.01, 0.5, 0.1, 0.01, format="%4.2f")
+with columns_opt[2]:
+    n_ens = st.select_slider('Number of T and S realizations', (100, 500, 1000, 5000), 1000)
+
+# Ensemble of T and S (log-normal around the chosen values) and candidate rates between the chosen minimum and maximum
+rng = np.random.default_rng(0)
+T_ens = 10 ** (T_min_slider_value2 + log_uncert * rng.standard_normal(n_ens))
+S_ens = 10 ** (S_min_slider_value2 + log_uncert * rng.standard_normal(n_ens))
+Q_cand = np.linspace(Q_min_value, Q_max_value, 100)
+
+opt = optimize_rate(Q_cand / 24 / 60 / 60, T_ens, S_ens, r_preds, t_assess, U_values[:,0], U_values[:,1], alpha_cvar)
+names_opt = ["Mine", "Town", "Environment"]
+colors_opt = ['r', 'g', 'b']
+
+fig = plt.figure(figsize=(12,7))
+for i in range(3):
+    p10, p90 = np.percentile(opt['utilities'][:,:,i], (10, 90), axis=1)
+    plt.fill_between(Q_cand, p10, p90, color=colors_opt[i], alpha=0.15)
+    plt.plot(Q_cand, opt['mean'][:,i], linewidth=3., color=colors_opt[i], label='%s - mean' % names_opt[i])
+    plt.plot(Q_cand, opt['cvar'][:,i], linewidth=2., color=colors_opt[i], linestyle='dashed', label='%s - CVaR' % names_opt[i])
+plt.axvline(opt['Q_mean']*24*60*60, color='k', linestyle='solid', label='max. total mean utility')
+plt.axvline(opt['Q_cvar']*24*60*60, color='k', linestyle='dashed', label='max. total CVaR')
+plt.axvline(opt['Q_maximin']*24*60*60, color='k', linestyle='dotted', label='max. CVaR of the worst-off stakeholder')
+plt.xlabel(r'Dewatering rate, m3/d', fontsize=14)
+plt.ylabel(r'Utility (shaded: 10 - 90 % of the realizations)', fontsize=14)
+plt.legend(fontsize=10, loc='center left', bbox_to_anchor=(1, 0.5))
+st.pyplot(fig)
+
+summary_opt = st.radio('Pareto front based on', ('mean utility', 'CVaR'), horizontal=True)
+u_opt = opt['mean'] if summary_opt == 'mean utility' else opt['cvar']
+front = opt['pareto_mean'] if summary_opt == 'mean utility' else opt['pareto_cvar']
+fig = plt.figure(figsize=(12,5))
+for k, (i, j) in enumerate(((0, 1), (0, 2), (2, 1))):
+    ax = fig.add_subplot(1, 3, k+1)
+    sc = ax.scatter(u_opt[~front,i], u_opt[~front,j], c=Q_cand[~front], cmap='viridis', vmin=Q_cand[0], vmax=Q_cand[-1], marker='.', alpha=0.5)
+    ax.scatter(u_opt[front,i], u_opt[front,j], c=Q_cand[front], cmap='viridis', vmin=Q_cand[0], vmax=Q_cand[-1], marker='o', edgecolors='k')
+    plt.xlabel('%s (%s)' % (names_opt[i], summary_opt), fontsize=12)
+    plt.ylabel('%s (%s)' % (names_opt[j], summary_opt), fontsize=12)
+fig.colorbar(sc, ax=fig.axes, label='Dewatering rate, m3/d')
+st.pyplot(fig)
+
+st.write("**%i of %i rates are Pareto optimal** (circles) for the %s of all three stakeholders, between %4.0f and %4.0f m3/d." % (front.sum(), len(Q_cand), summary_opt, Q_cand[front].min(), Q_cand[front].max()))
+st.write("Highest total mean utility at **Q = %4.0f m3/d**, highest total CVaR at **Q = %4.0f m3/d**, highest CVaR of the worst-off stakeholder at **Q = %4.0f m3/d**." % (opt['Q_mean']*24*60*60, opt['Q_cvar']*24*60*60, opt['Q_maximin']*24*60*60))
+
 st.markdown(
     """
     ---
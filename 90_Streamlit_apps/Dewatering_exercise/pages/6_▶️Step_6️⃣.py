@@ -11,7 +11,12 @@ Created on Sun Oct 13 15:28:58 2024
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[3])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.well_hydraulics import compute_s
 import streamlit as st
 import streamlit_book as stb
 from streamlit_extras.stodo import to_do
@@ -39,34 +44,8 @@ if st.toggle('Show additional **Notes for instructors**'):
     "td05",)
     
     
-# (Here the necessary functions like the well function $W(u)$ are defined. Later, those functions are used in the computation)
-# Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-
-def theis_wu(Q, T, s):
-    wu = s * 4. * np.pi * T / Q
-    return wu
-
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
-
-def compute_linU(s, s_U0, s_U1):
-    u = (s-s_U0)/(s_U1-s_U0)
-    u = u.clip(0,1)
-    return u
-  
+# (The Theis functions like the well function $W(u)$ are imported from gwtools.well_hydraulics. Later, those functions are used in the computation)
+
 st.markdown(
     """
     A pumping well was operated for 2 days at a rate of 25 m3/d and the drawdown was measured at a monitoring well 25 m from the pumped well.
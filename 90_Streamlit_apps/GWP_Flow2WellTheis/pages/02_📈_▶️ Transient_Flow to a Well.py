@@ -1,7 +1,12 @@
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[3])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.well_hydraulics import compute_s
 import streamlit as st
 import streamlit_book as stb
 
@@ -47,31 +52,7 @@ st.markdown('''
             '''
 )
 
-# (Here the necessary functions like the well function $W(u)$ are defined. Later, those functions are used in the computation)
-# Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-
-# (Here, the method computes the data for the well function. Those data can be used to generate a type curve.)
-u_max = 1
-r_max = 10000
-u  = [u_max for x in range(r_max)]
-u_inv  = [r_max/u_max for x in range(r_max)]
-w_u  = [well_function(u_max/r_max) for x in range(r_max)]
-
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
+# (The Theis functions like the well function $W(u)$ are imported from gwtools.well_hydraulics. Later, those functions are used in the computation)
 
 # This is the function to plot the graph with the data     
 
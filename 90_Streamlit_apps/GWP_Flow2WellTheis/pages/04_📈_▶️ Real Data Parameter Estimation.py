@@ -1,7 +1,12 @@
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[3])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.well_hydraulics import well_function, theis_u, theis_wu, compute_s
 import pandas as pd
 import streamlit as st
 import streamlit_book as stb
@@ -46,44 +51,14 @@ st.markdown("""
 """     
 )
 # Computation
-# (Here the necessary functions like the well function $W(u)$ are defined. Later, those functions are used in the computation)
-# Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-
-def theis_wu(Q, T, s):
-    wu = s * 4. * np.pi * T / Q
-    return wu
-
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
+# (The Theis functions like the well function $W(u)$ are imported from gwtools.well_hydraulics, further functions are defined here. Later, those functions are used in the computation)
 
 # (Here, the methode computes the data for the well function. Those data can be used to generate a type curve.)
 u_max = 1
 r_max = 100000
-u  = [u_max for x in range(r_max)]
-um = [u_max for x in range(r_max)]
-u_inv  = [r_max/u_max for x in range(r_max)]
-um_inv = [r_max/u_max for x in range(r_max)]
-w_u  = [well_function(u_max/r_max) for x in range(r_max)]
-w_um = [well_function(u_max/r_max) for x in range(r_max)]
-
-for x in range(1,r_max,1):
-    if x>0:
-        u[x] = x*u_max/r_max
-        u_inv[x] = 1/u[x]
-        w_u[x] = well_function(u[x])
+u  = np.arange(1, r_max) * u_max / r_max
+u_inv  = 1 / u
+w_u  = well_function(u)
 
 # Select data
 columns = st.columns((10,80,10), gap = 'large')
@@ -231,12 +206,9 @@ def inverse():
     
     # PLOT MEASURED DATA
     max_s = 20
-    x = 0
-    for t1 in m_time_s:
-        um[x] = theis_u(T,S,r,t1)
-        um_inv[x] = 1/um[x]
-        w_um[x] = theis_wu(Qs,T,m_ddown[x])
-        x = x+1
+    um = theis_u(T, S, r, np.array(m_time_s))
+    um_inv = 1/um
+    w_um = theis_wu(Qs, T, m_ddown)
 
     # PLOT DRAWDOWN VS TIME
     # Range of delta_h / delta_l values (hydraulic gradient)
@@ -1,7 +1,14 @@
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[3])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.well_hydraulics import compute_s, theis_type_curve
+from gwtools.fitting import fit_theis
+from gwtools.metrics import compute_statistics
 import math
 import pandas as pd
 import streamlit as st
@@ -116,54 +123,23 @@ st.markdown("""
 """
 )
 # Computation
-# (Here the necessary functions like the well function $W(u)$ are defined. Later, those functions are used in the computation)
-# Define a function, class, and object for Theis Well analysis
-
-def well_function(u):
-    return scipy.special.exp1(u)
-    
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-    
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
-    
-def compute_statistics(measured, computed):
-    # Calculate the number of values
-    n = len(measured)
-
-    # Initialize a variable to store the sum of squared differences
-    total_me = 0
-    total_mae = 0
-    total_rmse = 0
-
-    # Loop through each value
-    for i in range(n): # Add the squared difference to the total
-        total_me   += (computed[i] - measured[i])
-        total_mae  += (abs(computed[i] - measured[i]))
-        total_rmse += (computed[i] - measured[i])**2
-
-    # Calculate the me, mae, mean squared error
-    me = total_me / n
-    mae = total_mae / n
-    meanSquaredError = total_rmse / n
-
-    # Raise the mean squared error to the power of 0.5 
-    rmse = (meanSquaredError) ** (1/2)
-    return me, mae, rmse
+# (The Theis functions like the drawdown and the type curve $W(u)$ are imported from gwtools.well_hydraulics, further functions are defined here. Later, those functions are used in the computation)
 
 # Callback function to update session state
 def update_T(v):
     st.session_state[f"T_slider_value_{v}"] = st.session_state[f"T_input_{v}"]
 def update_S(v):
     st.session_state[f"S_slider_value_{v}"] = st.session_state[f"S_input_{v}"]
+
+# Callback for the automatic fit - seeds the T and S input widgets with the fitted values
+def fit_automatically(v, m_time_s, m_ddown, Qs, r):
+    fit = fit_theis(m_time_s, m_ddown, Qs, r)   # starts from the Cooper-Jacob estimate
+    st.session_state[f"theis_fit_{v}"] = fit
+    st.session_state[f"T_slider_value_{v}"] = float(fit['log_T'])
+    st.session_state[f"S_slider_value_{v}"] = float(fit['log_S'])
+    # Drop the widget states so the inputs are re-created with the fitted values
+    for key in (f"T_input_{v}", f"S_input_{v}"):
+        st.session_state.pop(key, None)
     
 # Initialize session state for value and toggle state
 st.session_state.number_input = False  # Default to number_input
@@ -172,9 +148,7 @@ st.session_state.number_input = False  # Default to number_input
 u_min = -5
 u_max = 4
 
-u = np.logspace(u_min,u_max)
-u_inv = 1/u
-w_u = well_function(u)
+u_inv, w_u = theis_type_curve(u_min, u_max)
 
 
 
@@ -268,7 +242,7 @@ def inverse(v):
     s = w_u * s_term
     
     # Compute point data for scatter plot 
-    m_ddown_theis = [compute_s(T, S, i, Qs, r) for i in m_time_s]
+    m_ddown_theis = compute_s(T, S, np.array(m_time_s), Qs, r)
     
     # Find the max for the scatter plot
     max_s = math.ceil(max(m_ddown)*10)/10
@@ -331,6 +305,13 @@ def inverse(v):
     
     columns3 = st.columns((1,10,1), gap = 'medium')
     with columns3[1]:
+        st.button(':orange[**Fit automatically**] (Levenberg-Marquardt) and set $T$ and $S$ to the result', key = 70+v, on_click=fit_automatically, args=(v, m_time_s, m_ddown, Qs, r))
+        if f"theis_fit_{v}" in st.session_state:
+            fit = st.session_state[f"theis_fit_{v}"]
+            sd_log_T, sd_log_S = np.sqrt(np.diag(fit['cov']))
+            corr = fit['cov'][0, 1] / sd_log_T / sd_log_S
+            st.write("**Automatic fit** (%i iterations): $T$ = %5.2e m²/s, $S$ = %5.2e, $RMSE$ = %.3f m" % (fit['iterations'], fit['T'], fit['S'], fit['rmse']))
+            st.write("Standard deviation of log $T$ = %.3f and of log $S$ = %.3f, correlation = %.2f" % (sd_log_T, sd_log_S, corr))
         if st.button(':green[**Submit**] your parameters and **show results**', key = 60+v):
             st.write("**Parameters and Results**")
             st.write("- Distance of measurement from the well **$r$ = %3i" %r," m**")
@@ -0,0 +1,212 @@
+# Loading the required Python libraries
+import numpy as np
+import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[3])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.datasets import load_dataset, registry
+from gwtools.recovery import split_phases, residual_drawdown, recovery_line, fit_theis_recovery
+import pandas as pd
+import streamlit as st
+
+st.title('🔄 Recovery Test Analysis with the :red[Theis] solution')
+
+st.header('Estimating aquifer property values from the :rainbow[recovery] after the pump is shut down')
+
+st.subheader('Introduction and Motivation', divider="rainbow")
+st.markdown("""
+            Many pumping tests continue to record the water level after the pump is shut down. The recovery phase is less affected by variations of the pumping rate and provides an independent estimate of the transmissivity.
+
+            This application analyses records that contain the pumping and the recovery phase in one file. The time of the shutdown is detected automatically from the data. You can use one of the field datasets or upload your own data as a *.csv file (time in minutes separated by a comma from drawdown in meters).
+            """
+)
+
+with st.expander('Show the theory of the recovery analysis'):
+    st.markdown(r"""
+    After the shutdown at the time $t_p$, the well is represented by the pumping well and an injection well with the same rate that starts at $t_p$ (superposition in time). With the time since shutdown $t' = t - t_p$, the **residual drawdown** is
+
+    $s' = \frac{Q}{4\pi T}\left[W(u) - W(u')\right]$ with $u = \frac{r^2S}{4Tt}$ and $u' = \frac{r^2S}{4Tt'}$
+
+    For small $u$ and $u'$ (late recovery) this simplifies to the **Theis recovery line**
+
+    $s' = \frac{2.303 Q}{4\pi T}\log_{10}\frac{t}{t'}$
+
+    so that $T$ follows from the slope $\Delta s'$ per log cycle of $t/t'$:  $T = \frac{2.303 Q}{4\pi \Delta s'}$. The storativity does not appear in the recovery line, but it can be estimated by matching the full superposition to the measured pumping and recovery phases.
+
+    At an observation well, the drawdown still increases for a short time after the shutdown. The drawdown peak is therefore only an upper limit of $t_p$, and the automatic analysis estimates $t_p$ together with $T$ and $S$.
+    """)
+
+"---"
+
+# Registered recovery datasets (label -> key), the synthetic dataset first
+datasets = registry()
+keys = {label: key for key, label in datasets.loc[datasets['test_type'] == 'recovery', 'label'].items()}
+labels = sorted(keys, key=lambda label: keys[label] != 'synthetic_recovery')
+
+columns = st.columns((1,1), gap = 'large')
+with columns[0]:
+    datasource = st.selectbox("**What data should be used?**", labels[:1] + ["Load own CSV dataset"] + labels[1:], key = 'Data_recovery')
+
+if datasource == "Load own CSV dataset":
+    m_time_s = np.array([])
+    m_ddown = np.array([])
+    uploaded_file = st.file_uploader("Choose a file with the pumping and recovery phase. The required data format for the CSV-file is time in minutes separated by a comma from drawdown in meters.", type="csv")
+    Qs = st.number_input(f'**Pumping rate (m³/s)** before the shutdown', 0.001,0.100,0.005,0.001,format="%5.3f")
+    r = st.number_input(f'**Distance** (m) from the **well** for the **observation**', 0.1,1000.,100.,0.1)
+    b = st.number_input(f'**average Aquifer thickness** (m)', 1.,200.,10.,0.01)
+    if uploaded_file is not None:
+        df = pd.read_csv(uploaded_file)
+        data = df.iloc[:, :2].apply(pd.to_numeric, errors='coerce').dropna()
+        m_time_s = data.iloc[:, 0].to_numpy(dtype=float)*60
+        m_ddown = data.iloc[:, 1].to_numpy(dtype=float)
+else:
+    # Measured data and parameters from the dataset registry (05_Applied_hydrogeology/DATA/Pumping_tests/datasets.csv)
+    dataset = load_dataset(keys[datasource])
+    m_time_s = dataset['t']
+    m_ddown = dataset['s']
+    r = dataset['r']     # m
+    b = dataset['b']     # m
+    Qs = dataset['Q']    # m^3/s
+
+valid = m_time_s > 0
+m_time_s, m_ddown = m_time_s[valid], m_ddown[valid]
+if len(m_time_s) < 10:
+    st.info('Select a dataset or upload a file with at least ten measurements.')
+    st.stop()
+
+
+@st.cache_data
+def shutdown_time(m_time_s, m_ddown, Qs, r):
+    # Drawdown peak and the shutdown time estimated together with T and S (searched up to two measurements after the peak)
+    k = split_phases(m_time_s, m_ddown)
+    if k is None:
+        return None, None
+    t_max = m_time_s[min(k + 2, len(m_time_s) - 1)]
+    return m_time_s[k - 1], fit_theis_recovery(m_time_s, m_ddown, Qs, r, t_max, fit_shutdown=True)['t_p']
+
+
+t_peak, t_p_auto = shutdown_time(m_time_s, m_ddown, Qs, r)
+with columns[1]:
+    if t_p_auto is None:
+        st.warning('No recovery phase was detected in these data. Please set the shutdown time manually.')
+    manual = st.toggle('Set the **shutdown time** manually', value = t_p_auto is None)
+    if manual:
+        t_p_default = t_p_auto if t_p_auto is not None else m_time_s[len(m_time_s)//2]
+        t_p = st.slider('**Shutdown time** (min)', float(m_time_s[0]/60), float(m_time_s[-2]/60), float(t_p_default/60), 0.1)*60
+    else:
+        t_p = t_p_auto
+        st.write("**Drawdown peak** at %5.1f min, **estimated shutdown** at %5.1f min" %(t_peak/60, t_p/60))
+
+recovery = m_time_s > t_p
+if recovery.sum() < 2:
+    st.warning('Less than two measurements after the shutdown - please select a different shutdown time.')
+    st.stop()
+
+st.subheader(':green[Estimating aquifer parameter values]', divider="rainbow")
+st.markdown("""
+            Modify $T$ and $S$ to match the computed residual drawdown to the measurements, or fit them automatically to the pumping and recovery phase or to the recovery phase only. The Theis recovery line (dashed) is fitted to the late recovery data and gives an estimate of $T$ that does not depend on $S$.
+            """)
+
+
+# Callbacks to update session state
+def update_T():
+    st.session_state.T_rec_value = st.session_state.T_rec_input
+def update_S():
+    st.session_state.S_rec_value = st.session_state.S_rec_input
+
+def fit_automatically(phases):
+    fit = fit_theis_recovery(m_time_s, m_ddown, Qs, r, t_p, phases='recovery' if phases == 'Recovery phase only' else 'both')
+    st.session_state.T_rec_value = float(fit['log_T'])
+    st.session_state.S_rec_value = float(fit['log_S'])
+    # Drop the widget states so the inputs are re-created with the fitted values
+    for key in ('T_rec_input', 'S_rec_input'):
+        st.session_state.pop(key, None)
+
+
+@st.fragment
+def recovery_matching():
+    if "T_rec_value" not in st.session_state:
+        st.session_state["T_rec_value"] = -3.0
+    if "S_rec_value" not in st.session_state:
+        st.session_state["S_rec_value"] = -4.0
+
+    columns2 = st.columns((1,1), gap = 'large')
+    with columns2[0]:
+        container = st.container()
+        log_T = st.slider("_(log of) Transmissivity in m²/s_", -7.0, 0.0, st.session_state["T_rec_value"], 0.01, format="%4.2f", key="T_rec_input", on_change=update_T)
+        T = 10 ** log_T
+        container.write("**Transmissivity in m²/s:** %5.2e" %T)
+        container = st.container()
+        log_S = st.slider('_(log of) Storativity_', -7.0, 0.0, st.session_state["S_rec_value"], 0.01, format="%4.2f", key="S_rec_input", on_change=update_S)
+        S = 10 ** log_S
+        container.write("**Storativity (dimensionless):** %5.2e" %S)
+    with columns2[1]:
+        phases = st.radio('**Data for the automatic fit**', ('Pumping and recovery phase', 'Recovery phase only'))
+        st.button(':orange[**Fit automatically**] (Levenberg-Marquardt) and set $T$ and $S$ to the result', on_click=fit_automatically, args=(phases,))
+
+    # Recovery line and computed drawdown for the whole record
+    try:
+        line = recovery_line(m_time_s, m_ddown, Qs, t_p)
+    except ValueError:
+        line = None
+    s_calc = residual_drawdown(T, S, m_time_s, Qs, r, t_p)
+    ratio = m_time_s[recovery]/(m_time_s[recovery] - t_p)
+    t_plot = np.concatenate((np.geomspace(m_time_s[0], t_p, 200), t_p + np.geomspace(min(1e-3*(m_time_s[-1]-t_p), (m_time_s[recovery]-t_p).min()), m_time_s[-1]-t_p, 200)))
+    s_plot = residual_drawdown(T, S, t_plot, Qs, r, t_p)
+
+    fig = plt.figure(figsize=(10,14))
+    ax = fig.add_subplot(2, 1, 1)
+    ax.plot(ratio, m_ddown[recovery], 'ro', label=r'measured residual drawdown')
+    ax.plot(t_plot[200:]/(t_plot[200:] - t_p), s_plot[200:], color='b', label=r'Computed residual drawdown - Theis')
+    if line is not None:
+        x_line = np.array([1., ratio.max()])
+        ax.plot(ratio[line['window'][recovery]], m_ddown[recovery][line['window'][recovery]], 'o', mfc='none', mec='k', ms=10, label=r'data for the recovery line')
+        ax.plot(x_line, line['slope']*np.log10(x_line) + line['intercept'], 'k--', label=r'Theis recovery line')
+    plt.xscale("log")
+    plt.xlim(1, None)
+    plt.ylim(bottom=0)
+    plt.xlabel(r"$t/t'$", fontsize=14)
+    plt.ylabel(r"residual drawdown s' in (m)", fontsize=14)
+    plt.title('Residual drawdown versus t/t\'', fontsize=16)
+    ax.grid(which="both")
+    plt.legend(fontsize=12)
+
+    ax = fig.add_subplot(2, 1, 2)
+    ax.plot(m_time_s/60, m_ddown, 'ro', label=r'measured drawdown')
+    ax.plot(t_plot/60, s_plot, color='b', label=r'Computed drawdown - Theis with superposition')
+    ax.axvline(t_p/60, color='grey', linestyle='--', label=r'shutdown')
+    plt.ylim(bottom=0)
+    ax.invert_yaxis()
+    plt.xlabel(r'time t in (min)', fontsize=14)
+    plt.ylabel(r'drawdown s in (m)', fontsize=14)
+    plt.title('Pumping and recovery phase', fontsize=16)
+    ax.grid()
+    plt.legend(fontsize=12)
+    st.pyplot(fig)
+
+    rmse = np.sqrt(np.mean((s_calc - m_ddown)**2))
+    st.write("**Parameters and Results**")
+    st.write("- Distance of measurement from the well **$r$ = %5.1f" %r," m**, pumping rate before the shutdown **$Q$ = %5.3f" %Qs," m³/s**")
+    st.write("- Shutdown after **$t_p$ = %5.1f" %(t_p/60)," min**")
+    st.write("- Transmissivity **$T$ = % 10.2E"% T, " m²/s**, hydraulic conductivity **$K$ = % 10.2E"% (T/b), " m/s**")
+    st.write("- Storativity **$S$ = % 10.2E"% S, "[dimensionless]**")
+    st.write("- RMSE of the computed drawdown (pumping and recovery): **%5.3f" %rmse, " m**")
+    if line is not None:
+        st.write("- Transmissivity from the **Theis recovery line**: **$T$ = % 10.2E"% line['T'], " m²/s** (slope %5.3f m per log cycle)" %line['slope'])
+
+recovery_matching()
+
+"---"
+# Navigation at the bottom of the side - useful for mobile phone users     
+        
+columnsN1 = st.columns((1,1,1), gap = 'large')
+with columnsN1[0]:
+    if st.button("Previous page"):
+        st.switch_page("pages/06_🎯_▶️ Pumping_Test_Analysis.py")
+with columnsN1[1]:
+    st.subheader(':orange[**Navigation**]')
+with columnsN1[2]:
+    if st.button("Next page"):
+        st.switch_page("pages/08_📈_▶️ Parameter_Uncertainty.py")
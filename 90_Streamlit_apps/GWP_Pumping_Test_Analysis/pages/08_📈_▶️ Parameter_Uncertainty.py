@@ -1,7 +1,17 @@
 # Loading the required Python libraries
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.special
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[3])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.well_hydraulics import well_function, compute_s
+from gwtools.fitting import objective_surface
+from gwtools.uncertainty import PERCENTILES, bootstrap_theis, monte_carlo_theis, prediction_bands
+from gwtools.superposition import schedule_drawdown, uniform_schedule_drawdown
+from gwtools.mcmc import N_STEPS, run_mcmc
+from gwtools.metrics import compute_statistics
 import math
 import streamlit as st
 import streamlit_book as stb
@@ -110,45 +120,17 @@ with st.expander(":blue[**Detailed instructions for the exercise are provided by
 # (Here the necessary functions like the well function _W(u)_ are defined. Later, those functions are used in the computation)
 # Define a function, class, and object for Theis Well analysis
 
-def well_function(u):
-    return scipy.special.exp1(u)
-
-def theis_u(T,S,r,t):
-    u = r ** 2 * S / 4. / T / t
-    return u
-
-def theis_s(Q, T, u):
-    s = Q / 4. / np.pi / T * well_function(u)
-    return s
-    
-def compute_s(T, S, t, Q, r):
-    u = theis_u(T, S, r, t)
-    s = theis_s(Q, T, u)
-    return s
+@st.cache_data
+def uncertainty_ensemble(method, m_time_s, m_ddown, Qs, r, n):
+    # Ensemble of (log10 T, log10 S) that reflects the noise in the measured data
+    if method == 'Residual bootstrap':
+        return bootstrap_theis(m_time_s, m_ddown, Qs, r, n, seed=0)
+    return monte_carlo_theis(m_time_s, m_ddown, Qs, r, n, seed=0)
     
-def compute_statistics(measured, computed):
-    # Calculate the number of values
-    n = len(measured)
-
-    # Initialize a variable to store the sum of squared differences
-    total_me = 0
-    total_mae = 0
-    total_rmse = 0
-
-    # Loop through each value
-    for i in range(n): # Add the squared difference to the total
-        total_me   += (computed[i] - measured[i])
-        total_mae  += (abs(computed[i] - measured[i]))
-        total_rmse += (computed[i] - measured[i])**2
-
-    # Calculate the me, mae, mean squared error
-    me = total_me / n
-    mae = total_mae / n
-    meanSquaredError = total_rmse / n
-
-    # Raise the mean squared error to the power of 0.5 
-    rmse = (meanSquaredError) ** (1/2)
-    return me, mae, rmse
+@st.cache_data
+def posterior_samples(model, m_time_s, m_ddown, Qs, r, n_steps):
+    # MCMC posterior of the parameters and the noise level, four chains in parallel processes
+    return run_mcmc(model, m_time_s, m_ddown, Qs, r, n_chains=4, n_steps=n_steps)
     
 def update_T():
     st.session_state.T_slider_value = st.session_state.T_input
@@ -188,9 +170,9 @@ m_time_all_s = [i*60 for i in m_time_all] # time in seconds
 max_noise = 50 # max noise - should not be smaller than 20 - see input slider 
 
 # Compute all random data 
-m_ddown_all = [compute_s(st.session_state.T_random, st.session_state.S_random, i, Qs, r) for i in m_time_all_s]
+m_ddown_all = compute_s(st.session_state.T_random, st.session_state.S_random, np.array(m_time_all_s), Qs, r)
 # Compute the random noise
-m_ddown_noise = [np.random.randint((100-max_noise), (100+max_noise))/100 for i in m_time_all_s]
+m_ddown_noise = np.random.randint((100-max_noise), (100+max_noise), len(m_time_all_s))/100
 
 # Random number of samples
 n_samples_long = np.random.randint (35, 49)
@@ -220,6 +202,8 @@ def inverse():
         long = st.toggle('**Provide data for a longer pumping test**')
         refine_plot = st.toggle("**Zoom in** on the **data in the graph**")
         scatter = st.toggle('Show scatter plot')
+        surface = st.toggle('Show the **RMSE map** of $T$ and $S$')
+        bayes = st.toggle('**Bayesian inference** (MCMC)')
         show_truth = st.toggle(":rainbow[How accurate are the parameter value estimates?]")
     with columns2[1]:
         # READ LOG VALUE, CONVERT, AND WRITE VALUE FOR TRANSMISSIVITY
@@ -247,6 +231,19 @@ def inverse():
             r_pred = st.slider(f'**Distance** (m) from the **well** for the **prediction**', 1,1000,r,1)
             per_pred = st.slider(f'**Duration** of the **prediction period** (days)',1,3652,3,1) 
             max_t = 86400*per_pred
+            schedule = st.selectbox('**Pumping schedule** for the prediction', ('Constant rate', 'Pumping and recovery', 'Daily operation (weekdays only, seasonal variation)'))
+            if schedule == 'Pumping and recovery':
+                # Pumping with Q_pred, then shutdown and recovery until the end of the prediction period
+                t_stop = st.slider(f'**Pumping period** before the shutdown (days)', 0.1, per_pred*1.0, per_pred/2, 0.1)
+                t_steps, Q_steps = [0., t_stop*86400], [Q_pred, 0.]
+            elif schedule == 'Daily operation (weekdays only, seasonal variation)':
+                # Daily rates: no pumping on weekends, seasonal variation around Q_pred (maximum in summer)
+                seasonal = st.slider(f'**Seasonal variation** of the pumping rate (%)', 0, 100, 30, 5)
+                days = np.arange(per_pred)
+                t_steps = days*86400.
+                Q_steps = Q_pred * (1 - seasonal/100*np.cos(2*np.pi*days/365.25)) * (days % 7 < 5)
+            else:
+                t_steps, Q_steps = [0.], [Q_pred]
             if per_pred <= 3:
                 t_search = st.slider(f'**Select time (s) for printout below graph**', 1,max_t,1,1)
             elif per_pred <= 7:
@@ -258,6 +255,10 @@ def inverse():
             else:
                 t_search_mo = st.slider(f'**Select time (months) for printout below graph**', 1.,per_pred/30.4375,1.)
                 t_search = t_search_mo*2629800
+            bands = st.toggle('Show the **uncertainty of the prediction**')
+            if bands:
+                band_method = st.radio('Method', ('Residual bootstrap', 'Monte Carlo (covariance of the fit)'), horizontal=True)
+                n_real = st.select_slider('Number of realizations', (100, 1000, 10000), 1000)
    
     if long:
         n_samples = n_samples_long
@@ -268,7 +269,7 @@ def inverse():
     num_times = len(m_time_s)
     
     # Multiply each value to add noise and normalize the noise according to the noise strength
-    m_ddown_all_noise = [ddown * (1 + noise_strength * (noise - 1 ))  for ddown, noise in zip(m_ddown_all, m_ddown_noise)]
+    m_ddown_all_noise = m_ddown_all * (1 + noise_strength * (m_ddown_noise - 1 ))
     
     # Use a random number of samples
     m_ddown = m_ddown_all_noise[:n_samples]
@@ -281,7 +282,7 @@ def inverse():
     s1 = w_u * s_term
     
     # Compute point data for scatter plot 
-    m_ddown_theis = [compute_s(T, S, i, Qs, r) for i in m_time_s]
+    m_ddown_theis = compute_s(T, S, np.array(m_time_s), Qs, r)
     
     # Find the max for the scatter plot
     max_s = math.ceil(max(m_ddown)*10)/10
@@ -295,20 +296,35 @@ def inverse():
     if prediction:
         # PLOT DRAWDOWN VS TIME
         # Range of delta_h / delta_l values (hydraulic gradient)
-        t2 = np.linspace(1, max_t, 100)
+        if schedule == 'Daily operation (weekdays only, seasonal variation)':
+            # Uniform grid with at least 100 times: the daily rates are convolved with the unit response
+            n_sub = int(np.ceil(100/per_pred))
+            dt = 86400/n_sub
+            t2 = dt*np.arange(1, n_sub*per_pred+1)
+            predict_curve = lambda T, S: uniform_schedule_drawdown(T, S, r_pred, np.repeat(Q_steps, n_sub), dt)
+        else:
+            t2 = np.linspace(1, max_t, 100)
+            predict_curve = lambda T, S: schedule_drawdown(T, S, t2, r_pred, t_steps, Q_steps)
         t2_h = t2/3600
         t2_d = t2/86400
         t2_mo = t2/2629800
 
         # Compute s for prediction h
-        s  = compute_s(T, S, t2, Q_pred, r_pred)
+        s  = predict_curve(T, S)
         # Compute s for a specific point
         x_point = t_search
-        y_point = compute_s(T, S, t_search, Q_pred, r_pred)
+        y_point = schedule_drawdown(T, S, t_search, r_pred, t_steps, Q_steps)[0]
 
         # Compute true s for prediction
-        true_s  = compute_s(T_random, S_random, t2, Q_pred, r_pred)
-        true_y_point = compute_s(T_random, S_random, t_search, Q_pred, r_pred)
+        true_s  = predict_curve(T_random, S_random)
+        true_y_point = schedule_drawdown(T_random, S_random, t_search, r_pred, t_steps, Q_steps)[0]
+        
+        # Prediction bands from the ensemble of parameters fitted to the data
+        if bands:
+            ensemble = uncertainty_ensemble(band_method, np.array(m_time_s), m_ddown, Qs, r, n_real)
+            s_bands = np.percentile(predict_curve(10**ensemble[:, 0], 10**ensemble[:, 1]), PERCENTILES, axis=0)
+            _, s_point = prediction_bands(ensemble, t_search, Q_steps, r_pred, t_steps=t_steps)
+            p_point = np.percentile(s_point[:, 0], (5, 50, 95))
             
         fig = plt.figure(figsize=(12,14))
         ax = fig.add_subplot(2, 2, 1)
@@ -360,6 +376,10 @@ def inverse():
             plt.plot(t_search_mo,y_point, marker='o', color='b',linestyle ='None', label='drawdown output')
             plt.xlabel(r'Time in months', fontsize=14)
             plt.xlim(0, max_t/2629800)
+        if bands:
+            t_unit = 1 if per_pred <= 3 else 3600 if per_pred <= 7 else 86400 if per_pred <= 366 else 2629800
+            plt.fill_between(t2/t_unit, s_bands[0], s_bands[2], color='orange', alpha=0.3, label=r'P5 - P95 band (fitted to data)')
+            plt.plot(t2/t_unit, s_bands[1], '--', color='orange', linewidth=2., label=r'P50 (fitted to data)')
 
         plt.ylim(bottom=0, top=None)
         ax.invert_yaxis()
@@ -388,6 +408,22 @@ def inverse():
         
         
         st.pyplot(fig)
+        
+        if bands:
+            fig = plt.figure(figsize=(10,4))
+            ax = fig.add_subplot(1, 1, 1)
+            ax.hist(s_point[:, 0], bins=50, color='orange', alpha=0.7)
+            for p_value, p_label in zip(p_point, ('P5', 'P50', 'P95')):
+                ax.axvline(p_value, color='k', linestyle='--')
+                ax.text(p_value, ax.get_ylim()[1]*0.95, ' ' + p_label, fontsize=12, verticalalignment='top')
+            ax.axvline(y_point, color='b', linewidth=2., label='drawdown output (your estimate)')
+            if show_truth:
+                ax.axvline(true_y_point, color='g', linewidth=2., label='"true" drawdown output')
+            plt.xlabel(r'Drawdown in m at the selected time', fontsize=14)
+            plt.ylabel(r'Number of realizations', fontsize=14)
+            plt.title('Distribution of the predicted drawdown (%s, %i realizations)' % (band_method, n_real), fontsize=14)
+            plt.legend()
+            st.pyplot(fig)
     else:
         fig = plt.figure(figsize=(10,14))
         ax = fig.add_subplot(2, 1, 1)
@@ -429,6 +465,81 @@ def inverse():
         
         st.pyplot(fig)
     
+    if surface:
+        # RMSE of all T-S combinations, 400 x 400 grid over the slider range, then zoomed to +/- 1 log cycle around the optimum
+        n_grid = 400
+        grid_T = np.linspace(log_min1, log_max1, n_grid)
+        grid_S = np.linspace(log_min2, log_max2, n_grid)
+        coarse = objective_surface(m_time_s, m_ddown, Qs, r, grid_T, grid_S)
+        grid_T = np.linspace(coarse['log_T_opt']-1, coarse['log_T_opt']+1, n_grid)
+        grid_S = np.linspace(coarse['log_S_opt']-1, coarse['log_S_opt']+1, n_grid)
+        surf = objective_surface(m_time_s, m_ddown, Qs, r, grid_T, grid_S)
+        
+        fig = plt.figure(figsize=(10,8))
+        ax = fig.add_subplot(1, 1, 1)
+        cf = ax.contourf(grid_T, grid_S, np.log10(surf['rmse']), levels=30, cmap='viridis_r')
+        ax.contour(grid_T, grid_S, np.log10(surf['rmse']), levels=15, colors='k', linewidths=0.5)
+        ax.contour(grid_T, grid_S, surf['rmse'], levels=[surf['rmse_limit']], colors='r', linewidths=2.5)
+        fig.colorbar(cf, ax=ax, label='log of RMSE in m')
+        ax.plot(surf['log_T_opt'], surf['log_S_opt'], 'r*', markersize=18, label='best fit (minimum RMSE)')
+        ax.plot(T_slider_value_new, S_slider_value_new, 'wo', markeredgecolor='k', markersize=12, label='your estimate')
+        if show_truth:
+            ax.plot(np.log10(T_random), np.log10(S_random), 'gD', markersize=12, label='"true" parameters')
+        ax.plot([], [], 'r-', linewidth=2.5, label='95% confidence region')
+        ax.set_xlim(grid_T[0], grid_T[-1])
+        ax.set_ylim(grid_S[0], grid_S[-1])
+        plt.xlabel(r'log of transmissivity $T$ in m²/s', fontsize=14)
+        plt.ylabel(r'log of storativity $S$', fontsize=14)
+        plt.title('RMSE of the Theis solution for all combinations of $T$ and $S$', fontsize=16)
+        plt.legend(loc='upper right')
+        st.pyplot(fig)
+        st.write("**Minimum RMSE = %5.3f m** at **$T$ = %10.2E m²/s** and **$S$ = %10.2E**. Parameter combinations inside the red line fit the data equally well within the measurement noise (RMSE < %5.3f m); an elongated region indicates correlated $T$ and $S$." %(surf['rmse_min'], 10**surf['log_T_opt'], 10**surf['log_S_opt'], surf['rmse_limit']))
+    
+    if bayes:
+        # Posterior distribution of log T, log S (, log r/B) and the noise level from an ensemble MCMC sampler
+        columns_b = st.columns((1,1), gap = 'medium')
+        with columns_b[0]:
+            bayes_model = st.radio('Model for the Bayesian inference', ('Theis', 'Hantush-Jacob'), horizontal=True)
+        model_key = 'theis' if bayes_model == 'Theis' else 'hantush_jacob'
+        with columns_b[1]:
+            # The default chain length grows with the number of parameters (N_STEPS of gwtools.mcmc)
+            n_steps = st.select_slider('Number of steps per chain (4 chains with 32 walkers each)', (1000, 2000, 4000, 8000, 16000), N_STEPS[model_key], key='n_steps_%s' % model_key)
+        with st.spinner('Sampling the posterior distribution ...'):
+            post = posterior_samples(model_key, np.array(m_time_s), m_ddown, Qs, r, n_steps)
+        
+        labels = {'log_T': 'log $T$', 'log_S': 'log $S$', 'log_r_div_B': 'log $r/B$', 'log_sigma': r'log $\sigma$ (noise in m)'}
+        truth = {'log_T': np.log10(T_random), 'log_S': np.log10(S_random)}
+        k = len(post['names'])
+        fig = plt.figure(figsize=(3*k, 3*k))
+        for i in range(k):
+            for j in range(i+1):
+                ax = fig.add_subplot(k, k, i*k+j+1)
+                if i == j:
+                    ax.hist(post['flat'][:, i], bins=50, color='steelblue', histtype='stepfilled', alpha=0.7)
+                    ax.axvline(np.median(post['flat'][:, i]), color='k', linestyle='--')
+                    ax.set_yticks([])
+                else:
+                    ax.hist2d(post['flat'][:, j], post['flat'][:, i], bins=50, cmap='Blues')
+                    if show_truth and post['names'][j] in truth and post['names'][i] in truth:
+                        ax.plot(truth[post['names'][j]], truth[post['names'][i]], 'gD', markersize=8)
+                if show_truth and i == j and post['names'][i] in truth:
+                    ax.axvline(truth[post['names'][i]], color='g', linewidth=2.)
+                if i == k-1:
+                    ax.set_xlabel(labels[post['names'][j]], fontsize=12)
+                else:
+                    ax.set_xticklabels([])
+                if j == 0 and i > 0:
+                    ax.set_ylabel(labels[post['names'][i]], fontsize=12)
+        fig.suptitle('Posterior distribution (%s)' % bayes_model, fontsize=16)
+        st.pyplot(fig)
+        
+        st.write("**Posterior median and 90%% credible interval** (acceptance rate %4.2f)" % post['acceptance'].mean())
+        for i, name in enumerate(post['names']):
+            p5, p50, p95 = np.percentile(post['flat'][:, i], (5, 50, 95))
+            st.write("- %s = %6.3f  [%6.3f, %6.3f], R-hat = %5.3f, ESS = %i" % (labels[name], p50, p5, p95, post['r_hat'][i], post['ess'][i]))
+        if np.any(post['r_hat'] > 1.1):
+            st.write(":red[R-hat > 1.1: the chains have not converged, increase the number of steps.]")
+    
     columns3 = st.columns((1,1), gap = 'medium')
     with columns3[0]:
         st.write("**Estimated Parameters**")
@@ -449,6 +560,9 @@ def inverse():
             st.write("**Prediction**")
             st.write("Distance of measurement from the well **$r$ = %3i" %r_pred," m**")
             st.write("Pumping rate of prediction **$Q$ = %5.3f" %Q_pred," m³/s**")
+            st.write("Pumping schedule: **%s**" %schedule)
+            if schedule == 'Pumping and recovery':
+                st.write("Shutdown of the well after **%5.1f" %t_stop," days**")
             st.write("Time since pumping started **$t$ = %3i" %x_point," s**")
             if per_pred <= 3:
                 st.write("Time since pumping started **$t$ = %3i" %t_search," s**")
@@ -459,6 +573,8 @@ def inverse():
             else:
                 st.write("Time since pumping started **$t$ = %5.2f" %t_search_mo," months**")
             st.write("**Predicted drawdown at $r$ and $t$  %5.2f" %y_point," m**")
+            if bands:
+                st.write("**Uncertainty of the prediction (P5 / P50 / P95):  %5.2f / %5.2f / %5.2f" %tuple(p_point)," m**")
             if show_truth:
                 st.write("**Predicted drawdown with 'true' parameters:  %5.2f" %true_y_point," m**")
                 st.write("**Difference:  %5.2f" %(true_y_point-y_point)," m**")
@@ -493,9 +609,9 @@ with st.expander('**Click here for some references**'):
 columnsN1 = st.columns((1,1,1), gap = 'large')
 with columnsN1[0]:
     if st.button("Previous page"):
-        st.switch_page("pages/06_🎯_▶️ Pumping_Test_Analysis.py")
+        st.switch_page("pages/07_🔄_▶️ Recovery_Test_Analysis.py")
 with columnsN1[1]:
     st.subheader(':orange[**Navigation**]')
 with columnsN1[2]:
     if st.button("Next page"):
-        st.switch_page("pages/08_👉_About.py")
\ No newline at end of file
+        st.switch_page("pages/09_👉_About.py")
\ No newline at end of file
@@ -3,6 +3,12 @@ import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import streamlit as st
+import sys
+from pathlib import Path
+ROOT = str(Path(__file__).resolve().parents[4])  # repository root with the shared gwtools package
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+from gwtools.metrics import compute_statistics
 
 
 st.title('Analytical solution for 1D unconfined flow with one defined head boundary/river boundary')
@@ -56,30 +62,6 @@ def add_noise(j,noise):
     lower_value = round((i - noise/2)/ i * 100000)
     return upper_value, lower_value
     
-def compute_statistics(measured, computed):
-    # Calculate the number of values
-    n = len(measured)
-
-    # Initialize a variable to store the sum of squared differences
-    total_me = 0
-    total_mae = 0
-    total_rmse = 0
-
-    # Loop through each value
-    for i in range(n): # Add the squared difference to the total
-        total_me   += (computed[i] - measured[i])
-        total_mae  += (abs(computed[i] - measured[i]))
-        total_rmse += (computed[i] - measured[i])**2
-
-    # Calculate the me, mae, mean squared error
-    me = total_me / n
-    mae = total_mae / n
-    meanSquaredError = total_rmse / n
-
-    # Raise the mean squared error to the power of 0.5 
-    rmse = (meanSquaredError) ** (1/2)
-    return me, mae, rmse
-
 # Data for Calibration exercises
 # 1 Regular
 xp1 = [250, 500, 750, 1000, 1250, 1500, 1750,2000, 2250]
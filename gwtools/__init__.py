@@ -0,0 +1,6 @@
+"""Shared computational helpers for the iNUX groundwater Streamlit apps.
+
+The apps are started from the repository root (e.g.
+``streamlit run 90_Streamlit_apps/GWP_Pumping_Test_Analysis/PumpingTestAnalysis.py``),
+so the pages add the repository root to ``sys.path`` and import from here.
+"""
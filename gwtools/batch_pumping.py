@@ -0,0 +1,138 @@
+"""Batch analysis of pumping tests without the Streamlit interface.
+
+Every drawdown file in a directory (searched recursively) is fitted with the
+Theis, Hantush-Jacob and Neuman solutions in parallel worker processes. The
+results are collected in one summary table with the parameters, RMSE and AIC
+per dataset and model.
+
+The drawdown files have two columns, time and drawdown in m, with or without
+a header line. The well metadata file is a CSV table with the columns
+
+- file: path of the drawdown file relative to the data directory
+- r: distance of the observation well in m
+- b: aquifer thickness in m (used for K = T/b)
+- Q: pumping rate in m³/s
+- time_unit: s, min, h or d (optional, default min)
+- test_type: pumping or recovery (optional, default pumping); recovery
+  records are skipped
+
+The dataset registry of the apps (gwtools.datasets) has these columns, so
+it can be used as metadata file. Example, run from the repository root::
+
+    python -m gwtools.batch_pumping 05_Applied_hydrogeology/DATA/Pumping_tests \\
+        05_Applied_hydrogeology/DATA/Pumping_tests/datasets.csv -o pumping_tests_summary.csv
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gwtools.datasets import TIME_UNITS, read_drawdown
+from gwtools.fitting import fit_hantush_jacob, fit_neuman, fit_theis
+
+MODELS = {'Theis': fit_theis,
+          'Hantush-Jacob': fit_hantush_jacob,
+          'Neuman': fit_neuman}
+
+COLUMNS = ['dataset', 'model', 'T', 'K', 'S', 'Sy', 'r_div_B', 'beta',
+           'rmse', 'aic', 'delta_aic', 'n', 'iterations', 'error']
+
+
+def read_metadata(path):
+    """Well metadata table indexed by the relative file path."""
+    meta = pd.read_csv(path, skipinitialspace=True)
+    if 'time_unit' not in meta:
+        meta['time_unit'] = 'min'
+    meta['time_unit'] = meta['time_unit'].fillna('min')
+    if 'test_type' not in meta:
+        meta['test_type'] = 'pumping'
+    meta['test_type'] = meta['test_type'].fillna('pumping')
+    meta['file'] = [Path(f).as_posix() for f in meta['file']]
+    return meta.set_index('file')
+
+
+def analyse(job):
+    """Fit all models to one dataset. Returns one summary row per model."""
+    name, path, r, b, Q, time_factor = job
+    t, s = read_drawdown(path)
+    t = t * time_factor
+    # The start of pumping (t = 0) carries no information for the fits
+    t, s = t[t > 0], s[t > 0]
+    rows = []
+    for model, fit_function in MODELS.items():
+        row = {'dataset': name, 'model': model, 'n': len(t)}
+        try:
+            fit = fit_function(t, s, Q, r)
+        except (ValueError, np.linalg.LinAlgError) as error:
+            row['error'] = str(error)
+        else:
+            row.update({key: fit.get(key) for key in ('T', 'S', 'Sy', 'r_div_B', 'beta',
+                                                       'rmse', 'aic', 'iterations')})
+            row['K'] = fit['T'] / b
+        rows.append(row)
+    return rows
+
+
+def match_files(data_dir, metadata, metadata_file=None):
+    """(name, path) of the CSV files in data_dir with a metadata row, warn about files without."""
+    data_dir = Path(data_dir)
+    skip = Path(metadata_file).resolve() if metadata_file else None
+    files = []
+    for path in sorted(data_dir.rglob('*.csv')):
+        if path.resolve() == skip:
+            continue
+        name = path.relative_to(data_dir).as_posix()
+        if name not in metadata.index:
+            print('No metadata for %s, skipped' % name, file=sys.stderr)
+            continue
+        files.append((name, path))
+    missing = set(metadata.index) - {name for name, _ in files}
+    for name in sorted(missing):
+        print('No data file for %s' % name, file=sys.stderr)
+    return files
+
+
+def collect_jobs(data_dir, metadata, metadata_file=None):
+    """Pair the drawdown files of pumping tests with their metadata, other test types are skipped."""
+    jobs = []
+    for name, path in match_files(data_dir, metadata, metadata_file):
+        if metadata.loc[name, 'test_type'] != 'pumping':
+            print('%s is a %s test, skipped' % (name, metadata.loc[name, 'test_type']), file=sys.stderr)
+            continue
+        jobs.append((name, path, metadata.loc[name, 'r'], metadata.loc[name, 'b'], metadata.loc[name, 'Q'],
+                     TIME_UNITS[metadata.loc[name, 'time_unit']]))
+    return jobs
+
+
+def run(data_dir, metadata_file, workers=None):
+    """Analyse all datasets in parallel and return the summary table."""
+    metadata = read_metadata(metadata_file)
+    jobs = collect_jobs(data_dir, metadata, metadata_file)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rows = [row for result in pool.map(analyse, jobs) for row in result]
+    summary = pd.DataFrame(rows).reindex(columns=COLUMNS)
+    summary['delta_aic'] = summary['aic'] - summary.groupby('dataset')['aic'].transform('min')
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fit Theis, Hantush-Jacob and Neuman solutions to a directory of pumping tests.')
+    parser.add_argument('data_dir', help='directory with the drawdown CSV files')
+    parser.add_argument('metadata', help='CSV file with file, r, b, Q and optional time_unit per well')
+    parser.add_argument('-o', '--output', default='pumping_tests_summary.csv', help='summary table (CSV)')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='number of worker processes (default: all cores)')
+    args = parser.parse_args(argv)
+
+    summary = run(args.data_dir, args.metadata, args.workers)
+    summary.to_csv(args.output, index=False)
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(summary.drop(columns='error').to_string(index=False, float_format='%.4g'))
+    print('\nSummary written to %s' % args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""Batch analysis of slug tests without the Streamlit interface.
+
+Every logger file in a directory (searched recursively) is read with
+gwtools.loggers, the slug is located in the record and the Bouwer & Rice,
+Hvorslev and KGS models are fitted in parallel worker processes. The results
+are collected in one summary table with K, its confidence interval, the
+offset, Ss (KGS), RMSE and AIC per dataset and model. Diagnostic figures
+(measured record and fitted curves per well) are rendered in a thread while
+the workers fit the next records.
+
+The logger files have a time column (seconds or date/time stamps) and a
+head column in m, as in DATA/Slug. The well metadata file is a CSV table
+with the columns
+
+- file: path of the logger file relative to the data directory
+- rc: casing radius in m
+- rw: screen radius in m
+- L: screen length in m
+- h_static: static water level (head) in m
+- slugsize: slug volume in cm³ (negative for a removed slug)
+- b, d, anisotropy: aquifer thickness and depth of the screen top in m and
+  Kz/Kr for the KGS model (optional, default fully penetrating and
+  isotropic)
+- time_unit: s, min, h or d for numeric times (optional, default s)
+
+Example, run from the repository root::
+
+    python -m gwtools.batch_slug 05_Applied_hydrogeology/DATA/Slug \\
+        05_Applied_hydrogeology/DATA/Slug/slug_tests.csv -o slug_tests_summary.csv --figures slug_figures
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from gwtools.batch_pumping import match_files
+from gwtools.loggers import decimate, read_logger
+from gwtools.slug import compare_slug_models, slug_start
+
+COLUMNS = ['dataset', 'model', 'K', 'K_low', 'K_high', 't_off', 'Ss', 'rmse', 'aic',
+           'delta_aic', 'n', 'slug_start', 'error']
+
+# Records with more samples are averaged in log-spaced time bins around the slug
+MAX_SAMPLES = 2000
+
+
+def read_metadata(path):
+    """Well metadata table indexed by the relative file path."""
+    meta = pd.read_csv(path, skipinitialspace=True)
+    for column, default in (('b', np.nan), ('d', 0.), ('anisotropy', 1.), ('time_unit', 's')):
+        if column not in meta:
+            meta[column] = default
+        meta[column] = meta[column].fillna(default)
+    # The KGS model needs an aquifer at least as thick as the screen
+    meta['b'] = meta['b'].fillna(meta['L'] + meta['d'])
+    meta['file'] = [Path(f).as_posix() for f in meta['file']]
+    return meta.set_index('file')
+
+
+def analyse(job):
+    """Locate the slug and fit all models to one record.
+
+    Returns a dict with one summary row per model and the data of the
+    diagnostic figure.
+    """
+    name, path, well = job
+    row = {'dataset': name}
+    try:
+        record = read_logger(path, time_unit=well['time_unit'], per_decade=None)
+        t, head = record['t'], record['values']
+        H0 = 0.01 * well['slugsize'] / np.pi / (well['rc'] * 100) ** 2
+        h = (head - well['h_static']) / H0
+        start = slug_start(t, h)
+        if len(t) > MAX_SAMPLES:
+            t, h = decimate(t, h, origin=start)
+        fits = compare_slug_models(t, h, well['rc'], well['rw'], well['L'], well['b'], well['d'], well['anisotropy'])
+    except (OSError, ValueError, KeyError, np.linalg.LinAlgError) as error:
+        row['error'] = str(error)
+        return {'rows': [row]}
+    rows = []
+    for model, fit in fits.items():
+        rows.append(dict(row, model=model, K=fit['K'], K_low=fit['ci_K'][0], K_high=fit['ci_K'][1],
+                         t_off=fit['t_off'], Ss=fit.get('Ss'), rmse=fit['decay_rmse'], aic=fit['decay_aic'],
+                         n=int(fit['window'].sum()), slug_start=start))
+    plot = {'name': name, 't_raw': record['t'], 'head': record['values'], 'h_static': well['h_static'],
+            'start': start, 't': t, 'h': h,
+            'fits': {model: {key: fit[key] for key in ('h', 'window', 'K')} for model, fit in fits.items()}}
+    return {'rows': rows, 'plot': plot}
+
+
+def render(plot, figure_dir):
+    """Save the diagnostic figure of one record as PNG. Returns the path."""
+    # Figure without pyplot: no global state, safe outside the main thread
+    fig = Figure(figsize=(14, 5))
+    ax = fig.add_subplot(1, 2, 1)
+    ax.plot(plot['t_raw'], plot['head'], 'b-', lw=1, label='measured head')
+    ax.axhline(plot['h_static'], color='grey', ls=':', label='static level')
+    ax.axvline(plot['start'], color='r', ls='--', label='detected slug')
+    ax.set_xlabel('time t in (s)')
+    ax.set_ylabel('head in (m)')
+    ax.set_title(plot['name'])
+    ax.legend()
+    ax = fig.add_subplot(1, 2, 2)
+    ax.plot(plot['t'], plot['h'], 'ko', mfc='none', ms=4, label='measured')
+    for model, fit in plot['fits'].items():
+        ax.plot(plot['t'], fit['h'], label='%s, K = %5.2e m/s' % (model, fit['K']))
+    used = plot['fits']['Bouwer & Rice']['window']
+    ax.plot(plot['t'][used], plot['h'][used], 'k.', label='Bouwer & Rice window')
+    ax.set_yscale('log')
+    ax.set_ylim(0.01, 1.5)
+    ax.set_xlim(plot['start'], plot['t'].max())
+    ax.set_xlabel('time t in (s)')
+    ax.set_ylabel('H/H0')
+    ax.grid(which='both')
+    ax.legend(fontsize=9)
+    path = Path(figure_dir) / (Path(plot['name']).with_suffix('').as_posix().replace('/', '_') + '.png')
+    fig.savefig(path, dpi=100, bbox_inches='tight')
+    return path
+
+
+def run(data_dir, metadata_file, workers=None, figure_dir=None):
+    """Analyse all records in parallel and return the summary table."""
+    metadata = read_metadata(metadata_file)
+    jobs = [(name, path, metadata.loc[name].to_dict())
+            for name, path in match_files(data_dir, metadata, metadata_file)]
+    if figure_dir is not None:
+        Path(figure_dir).mkdir(parents=True, exist_ok=True)
+    rows, figures = [], []
+    with ProcessPoolExecutor(max_workers=workers) as pool, ThreadPoolExecutor(max_workers=1) as renderer:
+        for future in as_completed([pool.submit(analyse, job) for job in jobs]):
+            result = future.result()
+            rows.extend(result['rows'])
+            if figure_dir is not None and 'plot' in result:
+                figures.append(renderer.submit(render, result['plot'], figure_dir))
+        for figure in figures:
+            figure.result()
+    summary = pd.DataFrame(rows).reindex(columns=COLUMNS).sort_values(['dataset', 'model'], kind='stable')
+    summary['delta_aic'] = summary['aic'] - summary.groupby('dataset')['aic'].transform('min')
+    return summary.reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fit Bouwer & Rice, Hvorslev and KGS models to a directory of slug tests.')
+    parser.add_argument('data_dir', help='directory with the logger CSV files')
+    parser.add_argument('metadata', help='CSV file with file, rc, rw, L, h_static, slugsize and optional b, d, anisotropy, time_unit per well')
+    parser.add_argument('-o', '--output', default='slug_tests_summary.csv', help='summary table (CSV)')
+    parser.add_argument('-f', '--figures', default=None, help='directory for the diagnostic PNG figures (default: none)')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='number of worker processes (default: all cores)')
+    args = parser.parse_args(argv)
+
+    summary = run(args.data_dir, args.metadata, args.workers, args.figures)
+    summary.to_csv(args.output, index=False)
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(summary.drop(columns='error').to_string(index=False, float_format='%.4g'))
+    for _, row in summary[summary['error'].notna()].iterrows():
+        print('%s: %s' % (row['dataset'], row['error']), file=sys.stderr)
+    print('\nSummary written to %s' % args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Registry of the field pumping tests stored on disk.
+
+The registry is a CSV table (DATA/Pumping_tests/datasets.csv in
+05_Applied_hydrogeology) with one row per dataset and the columns
+
+- key: short identifier used by the apps, e.g. varnum_2016_r12
+- label: name shown in the apps
+- site, year, well: site metadata
+- version: incremented when the data of a dataset are revised
+- file: drawdown file relative to the registry (time and drawdown columns)
+- r: distance of the observation well in m
+- b: aquifer thickness in m
+- Q: pumping rate in m³/s
+- time_unit: s, min, h or d
+- test_type: pumping, or recovery for a record with pumping and recovery
+  phase (optional, default pumping)
+
+New sites are added by copying their drawdown file next to the registry
+and adding a row. Files are read when a dataset is first requested and
+memoized by their SHA-1 hash, so an edited file is read again while an
+unchanged one costs only the hash.
+"""
+
+import functools
+import hashlib
+from pathlib import Path
+
+import pandas as pd
+
+REGISTRY_FILE = Path(__file__).resolve().parents[1] / '05_Applied_hydrogeology' / 'DATA' / 'Pumping_tests' / 'datasets.csv'
+
+TIME_UNITS = {'s': 1., 'min': 60., 'h': 3600., 'd': 86400.}
+
+
+def file_hash(path):
+    """SHA-1 hex digest of a file's content."""
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+@functools.lru_cache(maxsize=128)
+def _read_csv(path, digest, **kwargs):
+    # digest is only part of the cache key
+    return pd.read_csv(path, skipinitialspace=True, **kwargs)
+
+
+def read_drawdown(path):
+    """Time and drawdown from the first two columns of a CSV file, with or without header."""
+    data = _read_csv(str(path), file_hash(path), header=None).iloc[:, :2]
+    data = data.apply(pd.to_numeric, errors='coerce').dropna()
+    return data.iloc[:, 0].to_numpy(dtype=float), data.iloc[:, 1].to_numpy(dtype=float)
+
+
+def registry(path=REGISTRY_FILE):
+    """The registry table indexed by dataset key."""
+    table = _read_csv(str(path), file_hash(path)).copy()
+    if 'time_unit' not in table:
+        table['time_unit'] = 'min'
+    table['time_unit'] = table['time_unit'].fillna('min')
+    if 'test_type' not in table:
+        table['test_type'] = 'pumping'
+    table['test_type'] = table['test_type'].fillna('pumping')
+    return table.set_index('key')
+
+
+def load_dataset(key, path=REGISTRY_FILE):
+    """Measured drawdown and well metadata of a registered dataset.
+
+    Returns a dict with the registry columns and the arrays t (time in s)
+    and s (drawdown in m). Raises KeyError for an unknown key.
+    """
+    entry = registry(path).loc[key]
+    t, s = read_drawdown(Path(path).parent / entry['file'])
+    dataset = entry.to_dict()
+    dataset.update({'key': key, 't': t * TIME_UNITS[entry['time_unit']], 's': s})
+    return dataset
@@ -0,0 +1,70 @@
+"""Stakeholder utilities and dewatering rate optimization under uncertainty.
+
+The utility of a stakeholder falls (or rises) linearly between the
+drawdowns s_U0 (utility 0) and s_U1 (utility 1), evaluated at the
+stakeholder's distance and assessment time. For a set of candidate rates
+and an ensemble of (T, S) realizations the utilities of all rates,
+realizations and stakeholders are one broadcast Theis evaluation. Each
+rate is then summarized per stakeholder by the ensemble mean and the
+conditional value at risk (CVaR, the mean of the worst alpha fraction of
+the realizations), and the rates that are not dominated by another rate
+form the Pareto front.
+"""
+
+import numpy as np
+
+from gwtools.well_hydraulics import compute_s
+
+
+def compute_linU(s, s_U0, s_U1):
+    """Linear utility of a drawdown s, 0 at s_U0 and 1 at s_U1 (clipped to [0, 1])."""
+    u = (s-s_U0)/(s_U1-s_U0)
+    u = u.clip(0,1)
+    return u
+
+
+def utility_ensemble(Q, T, S, r, t, s_U0, s_U1):
+    """Utilities for every rate, realization and stakeholder.
+
+    Q (m³/s) are the candidate rates, T and S the ensemble of realizations
+    (same length), r (m), t (s), s_U0 and s_U1 (m) one value per
+    stakeholder. Returns an array of shape (len(Q), len(T), len(r)).
+    """
+    Q, T, S = (np.atleast_1d(np.asarray(x, dtype=float)) for x in (Q, T, S))
+    r, t, s_U0, s_U1 = (np.atleast_1d(np.asarray(x, dtype=float)) for x in (r, t, s_U0, s_U1))
+    s = compute_s(T[None, :, None], S[None, :, None], t, Q[:, None, None], r)
+    return compute_linU(s, s_U0, s_U1)
+
+
+def cvar(u, alpha=0.1, axis=1):
+    """Conditional value at risk: mean of the lowest alpha fraction of the utilities along axis."""
+    u = np.sort(u, axis=axis)
+    n = max(1, int(np.ceil(alpha * u.shape[axis])))
+    return np.take(u, np.arange(n), axis=axis).mean(axis=axis)
+
+
+def pareto_front(objectives):
+    """Mask of the non-dominated rows of objectives (n, k), all objectives maximized."""
+    o = np.asarray(objectives, dtype=float)
+    dominated = (np.all(o[None, :, :] >= o[:, None, :], axis=2) & np.any(o[None, :, :] > o[:, None, :], axis=2)).any(axis=1)
+    return ~dominated
+
+
+def optimize_rate(Q, T, S, r, t, s_U0, s_U1, alpha=0.1):
+    """Scan the candidate rates Q over a (T, S) ensemble.
+
+    Returns a dict with the utilities (len(Q), len(T), len(r)), the mean and
+    CVaR per rate and stakeholder, the Pareto masks of the rates for both
+    summaries and the rates with the highest total mean utility (Q_mean),
+    the highest total CVaR (Q_cvar) and the highest CVaR of the worst-off
+    stakeholder (Q_maximin).
+    """
+    Q = np.atleast_1d(np.asarray(Q, dtype=float))
+    u = utility_ensemble(Q, T, S, r, t, s_U0, s_U1)
+    u_mean = u.mean(axis=1)
+    u_cvar = cvar(u, alpha, axis=1)
+    return {'utilities': u, 'mean': u_mean, 'cvar': u_cvar,
+            'pareto_mean': pareto_front(u_mean), 'pareto_cvar': pareto_front(u_cvar),
+            'Q_mean': Q[np.argmax(u_mean.sum(axis=1))],
+            'Q_cvar': Q[np.argmax(u_cvar.sum(axis=1))],
+            'Q_maximin': Q[np.argmax(u_cvar.min(axis=1))]}
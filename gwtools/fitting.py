@@ -0,0 +1,329 @@
+"""Automatic parameter estimation for pumping tests.
+
+The fits work in log10 parameter space, the same space as the T and S
+sliders of the apps. The drawdown residuals are minimized with a bounded
+Levenberg-Marquardt iteration that uses the analytic Jacobian of the Theis
+solution (dW/du = -e^(-u)/u). The Hantush-Jacob and Neuman solutions use a
+finite difference Jacobian, with r/B and β as continuous parameters. The
+Hantush-Jacob drawdown comes from the cached type curves of the apps, so
+the T and S steps of an iteration reuse one curve. The Neuman drawdown is
+computed directly, as every σ and β step would need a new type curve.
+objective_surface maps the misfit of the Theis solution over a whole
+log10 T x log10 S grid.
+"""
+
+import numpy as np
+import scipy.stats
+
+from gwtools.neuman import neuman_s
+from gwtools.type_curves import hantush_s
+from gwtools.well_hydraulics import compute_s, cooper_jacob, theis_u, well_function
+
+LN10 = np.log(10.)
+
+
+def theis_jacobian(T, S, t, Q, r):
+    """Drawdown and its derivatives with respect to log10 T and log10 S.
+
+    Returns s and an array of shape (..., 2) with ds/dlog10T and ds/dlog10S.
+    """
+    u = theis_u(T, S, r, t)
+    s = compute_s(T, S, t, Q, r)
+    a = Q / 4. / np.pi / T * np.exp(-u)
+    # T ds/dT = -s + Q/(4 pi T) e^(-u),  S ds/dS = -Q/(4 pi T) e^(-u)
+    jac = np.stack((-s + a, -a), axis=-1) * LN10
+    return s, jac
+
+
+def levenberg_marquardt(residual_jac, p0, bounds, max_iter=100, tol=1e-10, lam=1e-3, jacobian=None):
+    """Minimize the sum of squared residuals by a bounded Levenberg-Marquardt iteration.
+
+    residual_jac(p) returns the residual vector and its Jacobian. Steps are
+    projected onto the box given by bounds = (lower, upper). For expensive
+    Jacobians, residual_jac(p) may return the residuals only and
+    jacobian(p, res) the Jacobian, which is then evaluated for accepted
+    steps only.
+    Returns the parameters, the final residuals and Jacobian and the number of iterations.
+    """
+    if jacobian is not None:
+        residuals = residual_jac
+
+        def residual_jac(p):
+            return residuals(p), None
+
+    lower, upper = (np.asarray(b, dtype=float) for b in bounds)
+    p = np.clip(np.asarray(p0, dtype=float), lower, upper)
+    res, jac = residual_jac(p)
+    if jacobian is not None:
+        jac = jacobian(p, res)
+    cost = res @ res
+    for it in range(1, max_iter + 1):
+        jtj = jac.T @ jac
+        grad = jac.T @ res
+        # Parameters held at a bound by the gradient are not stepped
+        free = ~(((p <= lower) & (grad > 0)) | ((p >= upper) & (grad < 0)))
+        if not free.any():
+            break
+        while True:
+            step = np.zeros(len(p))
+            step[free] = np.linalg.solve((jtj + lam * np.diag(np.diag(jtj) + 1e-12))[np.ix_(free, free)], -grad[free])
+            p_new = np.clip(p + step, lower, upper)
+            res_new, jac_new = residual_jac(p_new)
+            cost_new = res_new @ res_new
+            if cost_new <= cost:
+                lam = max(lam / 10., 1e-12)
+                if jacobian is not None:
+                    jac_new = jacobian(p_new, res_new)
+                break
+            lam *= 10.
+            if lam > 1e12:
+                return p, res, jac, it
+        converged = abs(cost - cost_new) <= tol * max(cost, 1e-30) and np.max(np.abs(p_new - p)) < 1e-8
+        p, res, jac, cost = p_new, res_new, jac_new, cost_new
+        if converged:
+            break
+    return p, res, jac, it
+
+
+def cooper_jacob_start(t, s, Q, r, bounds=((-7., -7.), (0., 0.)), default=(-3., -4.)):
+    """Cooper-Jacob estimate of (log10 T, log10 S) inside the bounds as start for iterative fits."""
+    try:
+        cj = cooper_jacob(t, s, Q, r)
+    except ValueError:
+        return np.array(default)
+    return np.clip((cj['log_T'], cj['log_S']), *bounds)
+
+
+def fit_theis(t, s, Q, r, p0=None, bounds=((-7., -7.), (0., 0.))):
+    """Fit the Theis solution to measured drawdown.
+
+    t (s) and s (m) are the measured times and drawdowns, Q (m³/s) the pumping
+    rate and r (m) the distance of the observation well. p0 and bounds are
+    given as (log10 T, log10 S), matching the slider ranges of the apps.
+    Without p0 the fit starts from the Cooper-Jacob estimate.
+
+    Returns a dict with T, S, their log10 values, the covariance matrix of
+    (log10 T, log10 S), the residuals (computed - measured), RMSE and the
+    number of iterations.
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    if p0 is None:
+        p0 = cooper_jacob_start(t, s, Q, r, bounds)
+
+    def residual_jac(p):
+        s_calc, jac = theis_jacobian(10 ** p[0], 10 ** p[1], t, Q, r)
+        return s_calc - s, jac
+
+    p, res, jac, iterations = levenberg_marquardt(residual_jac, p0, bounds)
+    fit = _fit_result(p, res, jac, iterations)
+    fit.update({'T': 10 ** p[0], 'S': 10 ** p[1], 'log_T': p[0], 'log_S': p[1]})
+    return fit
+
+
+def fit_theis_batch(t, s, Q, r, p0, bounds=((-7., -7.), (0., 0.)), max_iter=50, tol=1e-10):
+    """Fit the Theis solution to many drawdown records with common times at once.
+
+    s has the shape (m, n) with one record of n measurements at the times t
+    per row. p0 is one (log10 T, log10 S) start for all records or an array
+    of shape (m, 2). All records are iterated together: every Gauss-Newton
+    step with Levenberg-Marquardt damping is one broadcast evaluation of the
+    Theis solution and its Jacobian plus m 2x2 solves, and each record keeps
+    its own damping. Returns an array (m, 2) of log10 T and log10 S.
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.atleast_2d(np.asarray(s, dtype=float))
+    lower, upper = (np.asarray(b, dtype=float) for b in bounds)
+    p = np.clip(np.broadcast_to(np.asarray(p0, dtype=float), (len(s), 2)), lower, upper)
+
+    def residual_jac(p):
+        s_calc, jac = theis_jacobian(10 ** p[:, :1], 10 ** p[:, 1:], t, Q, r)
+        return s_calc - s, jac
+
+    res, jac = residual_jac(p)
+    cost = np.einsum('ij,ij->i', res, res)
+    lam = np.full(len(s), 1e-3)
+    active = np.ones(len(s), dtype=bool)
+    for _ in range(max_iter):
+        jtj = np.einsum('kni,knj->kij', jac[active], jac[active])
+        grad = np.einsum('kni,kn->ki', jac[active], res[active])
+        damping = lam[active, None] * (np.diagonal(jtj, axis1=1, axis2=2) + 1e-12)
+        jtj[:, [0, 1], [0, 1]] += damping
+        step = np.linalg.solve(jtj, -grad[..., None])[..., 0]
+        p_new = np.clip(p[active] + step, lower, upper)
+        s_calc, jac_new = theis_jacobian(10 ** p_new[:, :1], 10 ** p_new[:, 1:], t, Q, r)
+        res_new = s_calc - s[active]
+        cost_new = np.einsum('ij,ij->i', res_new, res_new)
+        better = cost_new <= cost[active]
+        converged = better & (np.abs(cost[active] - cost_new) <= tol * np.maximum(cost[active], 1e-30)) \
+            & (np.max(np.abs(p_new - p[active]), axis=1) < 1e-8)
+        index = np.flatnonzero(active)
+        accepted = index[better]
+        p[accepted], res[accepted], jac[accepted], cost[accepted] = p_new[better], res_new[better], jac_new[better], cost_new[better]
+        lam[index] = np.where(better, np.maximum(lam[index] / 10., 1e-12), lam[index] * 10.)
+        active[index[converged | (lam[index] > 1e12)]] = False
+        if not active.any():
+            break
+    return p
+
+
+def aic(residuals, k):
+    """Akaike information criterion n ln(RSS/n) + 2k for least squares residuals and k parameters."""
+    n = len(residuals)
+    return n * np.log(residuals @ residuals / n) + 2 * k
+
+
+def _fit_result(p, res, jac, iterations):
+    n = len(res)
+    sigma2 = res @ res / max(n - len(p), 1)
+    return {'p': p, 'cov': sigma2 * np.linalg.pinv(jac.T @ jac), 'residuals': res,
+            'rmse': np.sqrt(np.mean(res ** 2)), 'aic': aic(res, len(p)),
+            'iterations': iterations}
+
+
+def fit_model(model, t, s, p0, bounds, step=1e-6, max_iter=100):
+    """Fit an arbitrary drawdown model s = model(p, t) with a finite difference Jacobian.
+
+    p0 and bounds are given in the parameter space of the model (log10 values
+    for the apps). The Jacobian is only evaluated for accepted steps.
+    Returns the same dict as fit_theis, with the parameter vector as 'p'
+    instead of T and S.
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    dp = step * np.eye(len(p0))
+
+    def residuals(p):
+        return model(p, t) - s
+
+    def jacobian(p, res):
+        s_calc = res + s
+        return np.stack([(model(p + d, t) - s_calc) / step for d in dp], axis=-1)
+
+    p, res, jac, iterations = levenberg_marquardt(residuals, p0, bounds, max_iter, jacobian=jacobian)
+    return _fit_result(p, res, jac, iterations)
+
+
+def fit_hantush_jacob(t, s, Q, r, bounds=((-7., -7., -6.), (0., 0., 1.)), r_div_B_start=(0.01, 0.1, 1.)):
+    """Fit the Hantush-Jacob solution to measured drawdown.
+
+    The parameters are log10 T, log10 S and log10 r/B. The fit is started
+    from the Cooper-Jacob estimate of T and S with each r/B of
+    r_div_B_start and from the Theis fit with r/B at its lower bound, the
+    best of these fits is returned. The lower bound of r/B is low enough
+    that this start reproduces the Theis solution even for the very small u
+    of a pumped well, and the iteration never increases the misfit, so the
+    result is at least as good as Theis and the AIC of both models stays
+    comparable. The dict of fit_model is extended by T, S, r/B and their
+    log10 values.
+    """
+    lower, upper = bounds
+    log_T, log_S = cooper_jacob_start(t, s, Q, r, (lower[:2], upper[:2]))
+    starts = [(log_T, log_S, np.log10(r_div_B)) for r_div_B in r_div_B_start]
+    theis = fit_theis(t, s, Q, r, bounds=(lower[:2], upper[:2]))
+    starts.append((theis['log_T'], theis['log_S'], lower[2]))
+    best = None
+    for p_start in starts:
+        fit = fit_model(lambda p, t: hantush_s(10 ** p[0], 10 ** p[1], t, Q, r, 10 ** p[2]),
+                        t, s, p_start, bounds)
+        if best is None or fit['rmse'] < best['rmse']:
+            best = fit
+    log_T, log_S, log_r_div_B = best['p']
+    best.update({'T': 10 ** log_T, 'S': 10 ** log_S, 'r_div_B': 10 ** log_r_div_B,
+                 'log_T': log_T, 'log_S': log_S, 'log_r_div_B': log_r_div_B})
+    return best
+
+
+def fit_neuman(t, s, Q, r, p0=None, bounds=((-7., -10., -7., -3.), (0., 0., np.log10(0.5), 1.)),
+               beta_start=(0.01, 0.1, 1.), screen_iter=8):
+    """Fit the Neuman solution to measured drawdown.
+
+    The parameters are log10 T, log10 S (elastic storativity), log10 Sy and
+    log10 β. Without p0 the fit is started with T and Sy from the
+    Cooper-Jacob line (Sy at least 0.01), S = Sy/100 and each β of
+    beta_start, and from the Theis fit as the late Theis curve (Sy = S of
+    Theis, S = Sy/1000, β at its upper bound). The bounds of S and Sy are
+    wide enough for that start, which reproduces the Theis drawdown, so the
+    result is as good as the Theis fit or better. Each start is iterated
+    screen_iter times and only the best one is iterated to convergence. The
+    dict of fit_model is extended by T, S, Sy, β and their log10 values.
+    """
+    lower, upper = bounds
+    if p0 is None:
+        log_T, log_Sy = cooper_jacob_start(t, s, Q, r, (lower[::2], upper[::2]), default=(-3., -1.))
+        log_Sy = max(log_Sy, -2.)
+        starts = [(log_T, log_Sy - 2., log_Sy, np.log10(beta)) for beta in beta_start]
+        theis = fit_theis(t, s, Q, r, bounds=(lower[:2], upper[:2]))
+        starts.append((theis['log_T'], theis['log_S'] - 3., theis['log_S'], upper[3]))
+    else:
+        starts = [p0]
+
+    def model(p, t):
+        return neuman_s(10 ** p[0], 10 ** p[1], 10 ** p[2], t, Q, r, 10 ** p[3])
+
+    if len(starts) > 1:
+        screened = [fit_model(model, t, s, np.clip(p_start, *bounds), bounds, max_iter=screen_iter)
+                    for p_start in starts]
+        starts = [min(screened, key=lambda fit: fit['rmse'])['p']]
+    best = fit_model(model, t, s, np.clip(starts[0], *bounds), bounds)
+    log_T, log_S, log_Sy, log_beta = best['p']
+    best.update({'T': 10 ** log_T, 'S': 10 ** log_S, 'Sy': 10 ** log_Sy, 'beta': 10 ** log_beta,
+                 'log_T': log_T, 'log_S': log_S, 'log_Sy': log_Sy, 'log_beta': log_beta})
+    return best
+
+
+def _uniform_step(x):
+    # Step of an evenly spaced axis, None otherwise
+    step = np.diff(x)
+    if len(step) and np.allclose(step, step[0], rtol=1e-9, atol=0.):
+        return step[0]
+    return None
+
+
+def objective_surface(t, s, Q, r, log_T, log_S, alpha=0.05, chunk_size=2 ** 21):
+    """ME, MAE and RMSE of the Theis solution for every (log10 T, log10 S) of a grid.
+
+    log_T and log_S are 1D arrays of the grid axes. The drawdown of all grid
+    points and measurements is computed by broadcasting, in blocks of about
+    chunk_size values to bound the memory. As u depends only on S/T, W(u)
+    is evaluated once per diagonal of the grid if both axes have the same
+    even spacing. The returned arrays have the shape (len(log_S),
+    len(log_T)), as expected by matplotlib's contour. The dict also contains
+    the grid optimum (log_T_opt, log_S_opt, rmse_min) and the RMSE on the
+    border of the joint (1 - alpha) confidence region of the linearized least
+    squares problem (rmse_limit),
+
+        RSS <= RSS_min (1 + 2 / (n - 2) F(2, n - 2, 1 - alpha)).
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    log_T = np.asarray(log_T, dtype=float)
+    log_S = np.asarray(log_S, dtype=float)
+    n, n_T, n_S = len(t), len(log_T), len(log_S)
+    me = np.empty((n_S, n_T))
+    mae = np.empty_like(me)
+    mse = np.empty_like(me)
+    step_T, step_S = _uniform_step(log_T), _uniform_step(log_S)
+    diagonal = step_T is not None and step_S is not None and np.isclose(step_T, step_S, rtol=1e-9, atol=0.)
+    if diagonal:
+        # W(u) for log10(S/T) = log_S[0] - log_T[0] + k*step, k = i_S - i_T
+        k = np.arange(-(n_T - 1), n_S)
+        ratio = 10 ** (log_S[0] - log_T[0] + k * step_T)
+        w_diagonal = well_function(theis_u(1., ratio[:, None], r, t))
+    rows = max(1, chunk_size // (n_T * n))
+    for i in range(0, n_S, rows):
+        block = slice(i, i + rows)
+        if diagonal:
+            index = np.arange(i, min(i + rows, n_S))[:, None] - np.arange(n_T) + n_T - 1
+            diff = Q / 4. / np.pi / 10 ** log_T[:, None] * w_diagonal[index] - s
+        else:
+            diff = compute_s(10 ** log_T[None, :, None], 10 ** log_S[block, None, None], t, Q, r) - s
+        me[block] = diff.mean(axis=-1)
+        mae[block] = np.abs(diff).mean(axis=-1)
+        mse[block] = (diff ** 2).mean(axis=-1)
+    rmse = np.sqrt(mse)
+    i_S, i_T = np.unravel_index(np.argmin(rmse), rmse.shape)
+    factor = 1. + 2. / max(n - 2, 1) * scipy.stats.f.ppf(1. - alpha, 2, max(n - 2, 1))
+    return {'me': me, 'mae': mae, 'rmse': rmse,
+            'log_T_opt': log_T[i_T], 'log_S_opt': log_S[i_S], 'rmse_min': rmse[i_S, i_T],
+            'rmse_limit': rmse[i_S, i_T] * np.sqrt(factor)}
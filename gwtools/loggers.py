@@ -0,0 +1,202 @@
+"""Streaming import of pressure transducer (data logger) records.
+
+Logger exports such as the Diver files in DATA/Slug contain 10^4 - 10^6
+samples (1 Hz over several days) and, depending on the export software,
+a block of metadata lines, a header line with units (e.g. Pressure[cmH2O]),
+date/time stamps instead of elapsed seconds and a footer line. read_logger
+detects the layout from the first lines, then parses the data with the C
+reader in chunks of fixed dtypes and reduces every chunk to log-spaced time
+bins before the next one is read. Only the bin sums are kept, so memory is
+bounded by the chunk size and the number of bins, not by the record length.
+
+The bins are log-spaced in the time since an origin (the start of the test,
+e.g. the slug or the pump start) with per_decade bins per log cycle, so
+early samples are kept one by one and late samples are averaged. Samples
+before the origin are binned the same way backwards in time.
+"""
+
+import contextlib
+import io
+import re
+import warnings
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from gwtools.datasets import TIME_UNITS
+
+LENGTH_UNITS = {'m': 1., 'mH2O': 1., 'cm': 0.01, 'cmH2O': 0.01, 'mm': 0.001, 'mmH2O': 0.001}
+
+SEPARATORS = ('\t', ';', ',')
+
+
+@contextlib.contextmanager
+def _text(source):
+    # Path, text or binary file (e.g. a Streamlit upload), positioned at the start
+    if not hasattr(source, 'read'):
+        with open(source, encoding='utf-8-sig', errors='replace', newline='') as handle:
+            yield handle
+        return
+    source.seek(0)
+    if isinstance(source.read(0), str):
+        yield source
+        return
+    handle = io.TextIOWrapper(source, encoding='utf-8-sig', errors='replace', newline='')
+    try:
+        yield handle
+    finally:
+        # Keep the upload open for the next rerun
+        handle.detach()
+
+
+def _date_format(text, dayfirst):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return guess_datetime_format(text.strip(), dayfirst=dayfirst)
+
+
+def _number(text, decimal):
+    try:
+        float(text.strip().replace(decimal, '.'))
+        return True
+    except ValueError:
+        return False
+
+
+def sniff_logger(source, dayfirst=False, max_lines=200):
+    """Layout of a logger file from its first lines.
+
+    The first line with at least two fields that starts with a number or a
+    date is the first data line; the line before it is used as header if it
+    has as many fields. Returns a dict with skiprows, sep, decimal, names,
+    time_cols (one column, or date and time in two columns) and date_format
+    (None for numeric times). Raises ValueError if no data line is found.
+    """
+    with _text(source) as handle:
+        previous = None
+        for skiprows in range(max_lines):
+            line = handle.readline()
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            for sep in SEPARATORS:
+                fields = [field.strip() for field in line.split(sep)]
+                if len(fields) < 2:
+                    continue
+                # Decimal commas are only possible if the fields are not separated by commas
+                decimal = ',' if sep != ',' and re.fullmatch(r'-?\d+,\d*', fields[-1]) else '.'
+                time_cols, date_format = [0], None
+                if not _number(fields[0], decimal):
+                    date_format = _date_format(fields[0], dayfirst)
+                    if date_format is None:
+                        continue
+                    combined = _date_format(fields[0] + ' ' + fields[1], dayfirst) if len(fields) > 2 else None
+                    if '%H' not in date_format and combined is not None:
+                        time_cols, date_format = [0, 1], combined
+                if not all(_number(field, decimal) for field in fields[len(time_cols):] if field):
+                    continue
+                names = [field.strip() for field in previous.split(sep)] if previous else []
+                if len(names) != len(fields):
+                    names = ['column %d' % (i + 1) for i in range(len(fields))]
+                return {'skiprows': skiprows, 'sep': sep, 'decimal': decimal, 'names': names,
+                        'time_cols': time_cols, 'date_format': date_format}
+            previous = line
+    raise ValueError('No data lines with time and value columns found')
+
+
+def log_time_bins(elapsed, per_decade):
+    """Integer bin codes of log-spaced bins in elapsed time (0 for elapsed = 0, negative before the origin).
+
+    The codes increase with time, per_decade bins per log cycle of |elapsed|.
+    """
+    elapsed = np.asarray(elapsed, dtype=float)
+    with np.errstate(divide='ignore'):
+        index = np.floor(np.log10(np.abs(elapsed)) * per_decade)
+    # Offset so that bins down to 10^-10 s stay on their side of the origin
+    index = np.clip(index, -10 * per_decade, None) + 10 * per_decade + 1
+    return (np.sign(elapsed) * np.where(elapsed == 0, 0, index)).astype(np.int64)
+
+
+def decimate(t, values, per_decade=50, origin=0.):
+    """Means of t and values in the log-spaced time bins of log_time_bins around origin."""
+    means = pd.DataFrame({'t': t, 'value': values}).groupby(log_time_bins(np.asarray(t, dtype=float) - origin, per_decade)).mean()
+    return means['t'].to_numpy(), means['value'].to_numpy()
+
+
+def read_logger(source, column=None, time_unit='s', per_decade=50, origin=0., dayfirst=False, chunksize=2 ** 17):
+    """Time series of one logger channel, read in chunks and decimated in log-spaced time bins.
+
+    source is a path or an (uploaded) file. column selects the value column
+    by name or position (default: the first column after the time); values
+    with a length unit in the header (e.g. [cmH2O]) are converted to m.
+    Numeric times are in time_unit, date/time stamps are converted to the
+    seconds since the first sample. origin (s since the first sample) is the
+    origin of the log-spaced bins with per_decade bins per log cycle; bins
+    are means of time and value. per_decade=None keeps all samples.
+
+    Returns a dict with t (s since the first sample), values, name, unit,
+    start (time stamp of the first sample or None) and n (number of samples
+    read).
+    """
+    layout = sniff_logger(source, dayfirst)
+    names = layout['names']
+    time_cols = layout['time_cols']
+    if column is None:
+        column = time_cols[-1] + 1
+    elif not isinstance(column, (int, np.integer)):
+        column = names.index(column)
+    name = names[column]
+    unit = re.search(r'[\[(]\s*([^\])]+?)\s*[\])]\s*$', name)
+    unit = unit.group(1) if unit else None
+    scale = LENGTH_UNITS.get(unit, 1.)
+    date_format = layout['date_format']
+    # Fixed dtypes: time stamps as strings, numbers as float64
+    dtype = {i: str if date_format else np.float64 for i in time_cols}
+    dtype[column] = np.float64
+
+    start, first, n = None, None, 0
+    t_all, values_all, parts = [], [], []
+    with _text(source) as handle:
+        reader = pd.read_csv(handle, sep=layout['sep'], decimal=layout['decimal'], header=None,
+                             skiprows=layout['skiprows'], usecols=time_cols + [column], dtype=dtype,
+                             skipinitialspace=True, skip_blank_lines=True, chunksize=chunksize)
+        for chunk in reader:
+            if date_format:
+                # Footer lines and other text give NaT and are dropped
+                stamps = chunk[time_cols].astype(str).agg(' '.join, axis=1) if len(time_cols) > 1 else chunk[time_cols[0]]
+                stamps = pd.to_datetime(stamps, format=date_format, errors='coerce')
+                if start is None:
+                    valid = stamps.notna()
+                    if valid.any():
+                        start = stamps[valid].iloc[0]
+                t = ((stamps - start) / pd.Timedelta(seconds=1)).to_numpy(dtype=float, na_value=np.nan) if start is not None else np.full(len(chunk), np.nan)
+            else:
+                t = chunk[time_cols[0]].to_numpy() * TIME_UNITS[time_unit]
+            value = chunk[column].to_numpy() * scale
+            valid = np.isfinite(t) & np.isfinite(value)
+            t, value = t[valid], value[valid]
+            if not len(t):
+                continue
+            if first is None and not date_format:
+                first = t[0]
+            if not date_format:
+                t = t - first
+            n += len(t)
+            if per_decade is None:
+                t_all.append(t)
+                values_all.append(value)
+            else:
+                sums = pd.DataFrame({'t': t, 'value': value, 'count': 1.}).groupby(log_time_bins(t - origin, per_decade)).sum()
+                parts.append(sums)
+    if not n:
+        raise ValueError('No valid samples in the logger file')
+    if per_decade is None:
+        t, values = np.concatenate(t_all), np.concatenate(values_all)
+    else:
+        sums = pd.concat(parts).groupby(level=0).sum()
+        t = (sums['t'] / sums['count']).to_numpy()
+        values = (sums['value'] / sums['count']).to_numpy()
+    return {'t': t, 'values': values, 'name': name, 'unit': unit, 'start': start, 'n': n}
@@ -0,0 +1,166 @@
+"""Bayesian estimation of well-test parameters with an ensemble MCMC sampler.
+
+The posterior of (log10 T, log10 S[, log10 r/B], log10 σ) is sampled with
+the affine-invariant ensemble sampler of Goodman & Weare (2010) (stretch
+move, as in emcee). σ is the standard deviation of the measurement noise,
+so the noise level is estimated together with the aquifer parameters. The
+priors are uniform in the log10 parameters within the bounds, the
+likelihood is Gaussian:
+
+    ln L = -n ln σ - Σ (s_calc - s)² / (2σ²)
+
+The walkers are split into two halves that are moved alternately, and the
+log-posterior of a whole half is one vectorized call of the drawdown model.
+Independent chains (ensembles) run in parallel worker processes, which
+gives the between-chain convergence diagnostic R-hat.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from gwtools.fitting import fit_hantush_jacob, fit_theis
+from gwtools.hantush_jacob import hantush_s
+from gwtools.well_hydraulics import compute_s
+
+# Parameter names and bounds (log10 values) per model; the last parameter is the noise level σ in m
+MODELS = {'theis': (('log_T', 'log_S', 'log_sigma'),
+                    ((-7., -7., -5.), (0., 0., 1.))),
+          'hantush_jacob': (('log_T', 'log_S', 'log_r_div_B', 'log_sigma'),
+                            ((-7., -7., -3., -5.), (0., 0., 1., 1.)))}
+# Default number of steps per chain: the leakage factor is poorly resolved by
+# most records, so the Hantush-Jacob ensembles decorrelate about four times
+# slower (autocorrelation time of 200 - 400 steps) than the Theis ensembles
+N_STEPS = {'theis': 2000, 'hantush_jacob': 8000}
+
+
+def drawdown(model, theta, t, Q, r):
+    """Drawdown of a model for parameter vectors theta of shape (m, k), shape (m, len(t))."""
+    T = 10 ** theta[:, :1]
+    S = 10 ** theta[:, 1:2]
+    if model == 'theis':
+        return compute_s(T, S, t, Q, r)
+    return hantush_s(T, S, t, Q, r, 10 ** theta[:, 2:3])
+
+
+def log_posterior(model, theta, t, s, Q, r):
+    """Log-posterior (up to a constant) of parameter vectors theta of shape (m, k)."""
+    lower, upper = (np.asarray(b) for b in MODELS[model][1])
+    inside = np.all((theta >= lower) & (theta <= upper), axis=1)
+    log_p = np.full(len(theta), -np.inf)
+    if inside.any():
+        theta = theta[inside]
+        sigma = 10 ** theta[:, -1]
+        res = drawdown(model, theta, t, Q, r) - s
+        log_p[inside] = -len(t) * np.log(sigma) - np.einsum('ij,ij->i', res, res) / 2. / sigma ** 2
+    return log_p
+
+
+def sample_ensemble(model, t, s, Q, r, p0, n_steps, a=2., seed=None):
+    """Run one ensemble of walkers with the stretch move.
+
+    p0 has the shape (n_walkers, k) with an even number of walkers. Returns
+    the chain (n_steps, n_walkers, k) and the acceptance fraction.
+    """
+    rng = np.random.default_rng(seed)
+    walkers = np.array(p0, dtype=float)
+    n_walkers, k = walkers.shape
+    half = n_walkers // 2
+    log_p = log_posterior(model, walkers, t, s, Q, r)
+    chain = np.empty((n_steps, n_walkers, k))
+    accepted = 0
+    for step in range(n_steps):
+        for active, other in ((slice(0, half), slice(half, None)), (slice(half, None), slice(0, half))):
+            moving = walkers[active]
+            partners = walkers[other][rng.integers(0, n_walkers - half if active.start == 0 else half, len(moving))]
+            # z is distributed as g(z) ∝ 1/sqrt(z) on [1/a, a]
+            z = ((a - 1.) * rng.random(len(moving)) + 1.) ** 2 / a
+            proposal = partners + z[:, None] * (moving - partners)
+            log_p_new = log_posterior(model, proposal, t, s, Q, r)
+            accept = np.log(rng.random(len(moving))) < (k - 1) * np.log(z) + log_p_new - log_p[active]
+            walkers[active][accept] = proposal[accept]
+            log_p[active][accept] = log_p_new[accept]
+            accepted += accept.sum()
+        chain[step] = walkers
+    return chain, accepted / n_steps / n_walkers
+
+
+def _run_chain(job):
+    return sample_ensemble(*job)
+
+
+def start_ensembles(model, t, s, Q, r, n_chains, n_walkers, seed=None):
+    """Walkers of n_chains ensembles in a small ball around the least squares fit, shape (n_chains, n_walkers, k)."""
+    if model == 'theis':
+        fit = fit_theis(t, s, Q, r)
+    else:
+        fit = fit_hantush_jacob(t, s, Q, r)
+    p = np.append(fit['p'], np.log10(max(fit['rmse'], 1e-5)))
+    lower, upper = (np.asarray(b) for b in MODELS[model][1])
+    rng = np.random.default_rng(seed)
+    # Keep the ball inside the bounds, clipped walkers would collapse the ensemble onto the bound
+    p = np.clip(p, lower + 1e-2, upper - 1e-2)
+    return p + 1e-3 * rng.standard_normal((n_chains, n_walkers, len(p)))
+
+
+def r_hat(chains):
+    """Split R-hat (Gelman-Rubin) per parameter for chains of shape (n_chains, n_steps, k)."""
+    n_steps = chains.shape[1] // 2
+    split = np.concatenate((chains[:, :n_steps], chains[:, n_steps:2 * n_steps]))
+    within = split.var(axis=1, ddof=1).mean(axis=0)
+    between = n_steps * split.mean(axis=1).var(axis=0, ddof=1)
+    return np.sqrt(((n_steps - 1) / n_steps * within + between / n_steps) / within)
+
+
+def autocorrelation_time(chain, c=5.):
+    """Integrated autocorrelation time per parameter of an ensemble chain (n_steps, n_walkers, k).
+
+    The autocorrelation function is averaged over the walkers and summed up
+    to Sokal's automatic window (the first lag M >= c τ(M)).
+    """
+    n = len(chain)
+    x = chain - chain.mean(axis=0)
+    f = np.fft.rfft(x, 2 * n, axis=0)
+    acf = np.fft.irfft(f * np.conj(f), axis=0)[:n].mean(axis=1)
+    acf = acf / np.where(acf[0] > 0, acf[0], 1.)
+    tau = 2. * np.cumsum(acf, axis=0) - 1.
+    inside = np.arange(n)[:, None] < c * tau
+    window = np.where(inside.all(axis=0), n - 1, np.argmin(inside, axis=0))
+    return tau[window, np.arange(tau.shape[1])]
+
+
+def run_mcmc(model, t, s, Q, r, n_chains=4, n_walkers=32, n_steps=None, burn=0.5, processes=None, seed=0):
+    """Posterior samples of a well-test model from independent ensembles.
+
+    model is 'theis' or 'hantush_jacob'; t (s) and s (m) are the measured
+    times and drawdowns. The chains run in up to `processes` worker
+    processes (all cores if None, in this process if 1). n_steps defaults
+    to N_STEPS of the model; the first `burn` fraction of each chain is
+    discarded.
+
+    Returns a dict with the parameter names, the samples (n_chains,
+    n_kept, n_walkers, k), the flat samples (n, k), the acceptance fractions
+    and the diagnostics r_hat (split R-hat of the walker means over the
+    chains), tau (autocorrelation time per chain) and ess (effective
+    sample size, summed over the chains) per parameter.
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    if n_steps is None:
+        n_steps = N_STEPS[model]
+    seeds = np.random.SeedSequence(seed).spawn(n_chains + 1)
+    p0 = start_ensembles(model, t, s, Q, r, n_chains, n_walkers, seeds[0])
+    jobs = [(model, t, s, Q, r, p0[i], n_steps, 2., seeds[i + 1]) for i in range(n_chains)]
+    if processes == 1 or n_chains == 1:
+        results = [_run_chain(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_run_chain, jobs))
+    samples = np.stack([chain[int(burn * n_steps):] for chain, _ in results])
+    tau = np.stack([autocorrelation_time(chain) for chain in samples])
+    n_kept = samples.shape[1]
+    return {'names': MODELS[model][0], 'samples': samples,
+            'flat': samples.reshape(-1, samples.shape[-1]),
+            'acceptance': np.array([acc for _, acc in results]),
+            'r_hat': r_hat(samples.mean(axis=2)), 'tau': tau,
+            'ess': np.sum(n_kept * n_walkers / np.maximum(tau, 1.), axis=0)}
@@ -0,0 +1,79 @@
+"""Goodness-of-fit measures and residual diagnostics of model results.
+
+All measures work on the last axis, so computed values of shape (m, n)
+(m candidate parameter sets, e.g. the samples of a Monte Carlo run or a
+parameter grid, and n measurements) are scored against measured values of
+shape (n,) in one call; the results have the shape (m,). The residuals are
+computed - measured, as in the ME of the apps. Optional weights (e.g.
+1/σ² of the measurements) have the shape of the measurements:
+
+    ME   = Σ w r / Σ w,  MAE = Σ w |r| / Σ w,  RMSE = (Σ w r² / Σ w)^0.5
+    NSE  = 1 - Σ w r² / Σ w (m - m̄)²           (Nash & Sutcliffe 1970)
+    KGE  = 1 - ((ρ - 1)² + (α - 1)² + (β - 1)²)^0.5   (Gupta et al. 2009)
+    AIC  = n ln(WRSS/n) + 2k,  BIC = n ln(WRSS/n) + k ln n
+
+with ρ the (weighted) correlation of measured and computed values, α the
+ratio of their standard deviations, β the ratio of their means and R² = ρ².
+The lag autocorrelation of the residuals (in the order of the measurements,
+e.g. time) shows systematic misfit that the summary measures hide.
+"""
+
+import numpy as np
+
+
+def _prepare(measured, computed, weights):
+    measured = np.asarray(measured, dtype=float)
+    computed = np.asarray(computed, dtype=float)
+    if weights is None:
+        weights = np.ones(measured.shape[-1])
+    weights = np.asarray(weights, dtype=float)
+    return measured, computed, weights / weights.sum(axis=-1, keepdims=True)
+
+
+def compute_statistics(measured, computed, weights=None):
+    """ME, MAE and RMSE of computed - measured (arrays of the leading axes for stacked input)."""
+    measured, computed, w = _prepare(measured, computed, weights)
+    residuals = computed - measured
+    return ((w * residuals).sum(axis=-1), (w * np.abs(residuals)).sum(axis=-1),
+            np.sqrt((w * residuals ** 2).sum(axis=-1)))
+
+
+def residual_autocorrelation(residuals, max_lag=1):
+    """Autocorrelation of the residuals for the lags 1 to max_lag, shape (..., max_lag).
+
+    Residuals without variance give nan.
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    centred = residuals - residuals.mean(axis=-1, keepdims=True)
+    variance = (centred ** 2).sum(axis=-1)
+    lags = [(centred[..., :-lag] * centred[..., lag:]).sum(axis=-1) for lag in range(1, max_lag + 1)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.stack(lags, axis=-1) / variance[..., None]
+
+
+def goodness_of_fit(measured, computed, weights=None, k=0, max_lag=1):
+    """All measures of computed against measured values, k the number of fitted parameters.
+
+    Returns a dict with me, mae, rmse, nse, kge, r2, aic, bic, autocorrelation
+    (lags 1 to max_lag in the last axis) and n. Measures that are undefined
+    for constant values (NSE, KGE, R²) are nan.
+    """
+    measured, computed, w = _prepare(measured, computed, weights)
+    n = measured.shape[-1]
+    residuals = computed - measured
+    me, mae, rmse = compute_statistics(measured, computed, w)
+    mean_m = (w * measured).sum(axis=-1, keepdims=True)
+    mean_c = (w * computed).sum(axis=-1, keepdims=True)
+    var_m = (w * (measured - mean_m) ** 2).sum(axis=-1)
+    var_c = (w * (computed - mean_c) ** 2).sum(axis=-1)
+    cov = (w * (measured - mean_m) * (computed - mean_c)).sum(axis=-1)
+    mean_m, mean_c = mean_m[..., 0], mean_c[..., 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        nse = 1. - rmse ** 2 / var_m
+        rho = cov / np.sqrt(var_m * var_c)
+        kge = 1. - np.sqrt((rho - 1.) ** 2 + (np.sqrt(var_c / var_m) - 1.) ** 2 + (mean_c / mean_m - 1.) ** 2)
+        # Weighted residual sum of squares with the weights scaled to a sum of n
+        log_likelihood = n * np.log(rmse ** 2)
+    return {'me': me, 'mae': mae, 'rmse': rmse, 'nse': nse, 'kge': kge, 'r2': rho ** 2,
+            'aic': log_likelihood + 2 * k, 'bic': log_likelihood + k * np.log(n),
+            'autocorrelation': residual_autocorrelation(np.sqrt(w * n) * residuals, max_lag), 'n': n}
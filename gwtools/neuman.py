@@ -0,0 +1,117 @@
+"""Neuman well function for unconfined aquifers by numerical Laplace inversion.
+
+For a fully penetrating pumping well and a fully penetrating observation
+well the Laplace transform (with respect to t_D = Tt/(Sr²)) of the
+dimensionless drawdown W = 4πTs/Q is
+
+    W̄(p) = 4/p Σ_n K0(x_n) sin²ε_n / (ε_n (ε_n + sin ε_n cos ε_n)),
+    x_n = (p + β ε_n²)^(1/2),    ε_n tan ε_n = p / (σ β)
+
+with σ = S/Sy and β = (Kz r²)/(Kr b²) (Neuman 1974, Moench 1997). The
+series is summed until x_n exceeds X_MAX, so small β need more terms. W is
+recovered with the Gaver-Stehfest algorithm, all times at once. For S/Sy
+-> 0 the early and late times follow the Theis curves for S and Sy.
+
+Long records (at least GRID_MIN_SIZE times with one σ and β) are
+evaluated on a log-spaced grid of GRID_PER_DECADE points per decade and
+interpolated with a cubic spline in log t.
+"""
+
+import numpy as np
+import scipy.interpolate
+import scipy.special
+
+from gwtools.well_hydraulics import theis_u
+
+# Number of Stehfest terms (even); 12 is a good compromise for double precision
+N_STEHFEST = 12
+# The series is truncated where K0(x_n) < 1e-11
+X_MAX = 25.
+GRID_MIN_SIZE = 200
+GRID_PER_DECADE = 20
+
+
+def _stehfest_weights(n):
+    k = np.arange(1, n + 1)
+    v = np.zeros(n)
+    for i in k:
+        j = np.arange((i + 1) // 2, min(i, n // 2) + 1)
+        v[i - 1] = (-1) ** (n // 2 + i) * np.sum(
+            j ** (n // 2) * scipy.special.factorial(2 * j)
+            / scipy.special.factorial(n // 2 - j) / scipy.special.factorial(j)
+            / scipy.special.factorial(j - 1) / scipy.special.factorial(i - j)
+            / scipy.special.factorial(2 * j - i))
+    return v
+
+
+_STEHFEST_V = _stehfest_weights(N_STEHFEST)
+
+
+def _eigenvalues(a, n_terms):
+    # Roots ε_n of ε tan ε = a, n = 0 .. n_terms-1, along a new last axis
+    a = a[..., None]
+    n_pi = np.pi * np.arange(n_terms)
+    # n = 0: bisection on (0, π/2), ε sin ε - a cos ε increases there
+    low = np.zeros(a.shape)
+    high = np.full(a.shape, np.pi / 2.)
+    for _ in range(55):
+        mid = (low + high) / 2.
+        above = mid * np.sin(mid) - a * np.cos(mid) > 0
+        high = np.where(above, mid, high)
+        low = np.where(above, low, mid)
+    eps_0 = (low + high) / 2.
+    # n >= 1: ε = nπ + θ with θ = arctan(a / (nπ + θ)), a contraction by at least 1/(2π)
+    theta = np.arctan(a / n_pi[1:])
+    for _ in range(20):
+        theta = np.arctan(a / (n_pi[1:] + theta))
+    return np.concatenate((eps_0, n_pi[1:] + theta), axis=-1)
+
+
+def neuman_laplace(p, sigma, beta):
+    """Laplace transform of the Neuman well function for broadcastable p, σ = S/Sy and β."""
+    p, sigma, beta = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (p, sigma, beta)))
+    n_terms = int(np.ceil(X_MAX / np.pi / np.sqrt(np.min(beta)))) + 1
+    eps = _eigenvalues(p / sigma / beta, n_terms)
+    x = np.sqrt(p[..., None] + beta[..., None] * eps ** 2)
+    sin = np.sin(eps)
+    terms = scipy.special.k0(x) * sin ** 2 / eps / (eps + sin * np.cos(eps))
+    return 4. / p * terms.sum(axis=-1)
+
+
+def _stehfest(t_D, sigma, beta):
+    ln2_t = np.log(2.) / t_D
+    p = ln2_t[..., None] * np.arange(1, N_STEHFEST + 1)
+    return ln2_t * (neuman_laplace(p, sigma[..., None], beta[..., None]) @ _STEHFEST_V)
+
+
+def neuman_well_function(u, sigma, beta):
+    """Neuman well function W(u, σ, β) for broadcastable u = r²S/(4Tt), σ = S/Sy and β.
+
+    u = inf (t <= 0) gives zero.
+    """
+    u, sigma, beta = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (u, sigma, beta)))
+    w = np.zeros(u.shape)
+    active = np.isfinite(u) & (u > 0)
+    if not active.any():
+        return w[()]
+    t_D = 1. / 4. / u[active]
+    log_t = np.log(t_D)
+    if t_D.size >= GRID_MIN_SIZE and np.ptp(log_t) > 0 and np.ptp(sigma) == 0 and np.ptp(beta) == 0:
+        num = max(int(np.ceil(np.ptp(log_t) / np.log(10.) * GRID_PER_DECADE)) + 1, 4)
+        grid = np.linspace(log_t.min(), log_t.max(), num)
+        w_grid = _stehfest(np.exp(grid), np.full(num, sigma.flat[0]), np.full(num, beta.flat[0]))
+        w[active] = scipy.interpolate.CubicSpline(grid, w_grid)(log_t)
+    else:
+        w[active] = _stehfest(t_D, sigma[active], beta[active])
+    return w[()]
+
+
+def neuman_s(T, S, Sy, t, Q, r, beta):
+    """Drawdown of an unconfined aquifer (Neuman) for broadcastable T, S, Sy, t, Q, r and β.
+
+    S is the elastic storativity (Ss·b), Sy the specific yield and
+    β = Kz r² / (Kr b²). Times t <= 0 give zero drawdown.
+    """
+    u = theis_u(T, S, r, t)
+    u = np.where(u < 0, np.inf, u)[()]
+    return Q / 4. / np.pi / T * neuman_well_function(u, np.divide(S, Sy), beta)
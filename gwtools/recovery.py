@@ -0,0 +1,132 @@
+"""Recovery test analysis with the Theis solution.
+
+After the pump is shut down at t_p the residual drawdown is the
+superposition of the pumping well and an injection well with the same rate
+that starts at t_p (t' = t - t_p is the time since shutdown):
+
+    s' = Q/(4πT) [W(u) - W(u')],    u = r²S/(4Tt),  u' = r²S/(4Tt')
+
+For small u and u' this becomes the Theis recovery line
+
+    s' = 2.303 Q/(4πT) log10(t/t')
+
+so T follows from the slope per log cycle of t/t' without S.
+fit_theis_recovery fits T and S to the pumping and recovery phases together
+(or to the recovery phase only) with the analytic Jacobian of both terms.
+
+At an observation well the drawdown still rises for a while after the
+shutdown, so the drawdown peak found by split_phases is only an upper bound
+of t_p (exact at the pumped well). The fit can therefore also estimate t_p,
+with ds'/dt_p = Q/(4πT) e^(-u')/t'.
+"""
+
+import numpy as np
+import scipy.ndimage
+
+from gwtools.fitting import _fit_result, cooper_jacob_start, levenberg_marquardt, theis_jacobian
+from gwtools.superposition import schedule_drawdown
+
+
+def split_phases(t, s, window=5, min_drop=3., min_fraction=0.05):
+    """Index of the first measurement after the drawdown peak of a pumping and recovery record.
+
+    The peak is the highest measured drawdown near the maximum of the
+    running median of s (window values). A recovery phase is only detected
+    if the drawdown at the end of the record (median of the last window
+    values) lies below the maximum by more than min_drop times the noise
+    level (median absolute difference of consecutive values) and by more
+    than min_fraction of the peak drawdown; otherwise None is returned.
+    """
+    s = np.asarray(s, dtype=float)
+    n = len(s)
+    if n < 2 * window:
+        return None
+    smooth = scipy.ndimage.median_filter(s, size=window, mode='nearest')
+    i = int(np.argmax(smooth))
+    noise = np.median(np.abs(np.diff(s)))
+    threshold = max(min_drop * noise, min_fraction * abs(smooth[i]), 1e-12)
+    if i >= n - window or smooth[i] - np.median(s[-window:]) <= threshold:
+        return None
+    lo = max(i - window // 2, 0)
+    return lo + int(np.argmax(s[lo:i + window // 2 + 1])) + 1
+
+
+def residual_drawdown(T, S, t, Q, r, t_p):
+    """Theis drawdown for pumping until t_p and the residual drawdown afterwards."""
+    return schedule_drawdown(T, S, t, r, (0., t_p), (Q, 0.))
+
+
+def recovery_line(t, s, Q, t_p, fraction=0.5):
+    """Theis recovery straight line through the residual drawdown against log10(t/t').
+
+    The line is fitted to the latest `fraction` of the recovery measurements
+    (smallest t/t', where u' is small). Returns a dict with T, log_T, the
+    slope per log cycle, the intercept (0 for ideal Theis conditions), the
+    boolean window and the ratio t/t' of all recovery measurements (nan
+    during pumping). Raises ValueError if the residual drawdown does not
+    fall.
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    recovery = t > t_p
+    ratio = np.full(len(t), np.nan)
+    ratio[recovery] = t[recovery] / (t[recovery] - t_p)
+    n_min = max(2, int(np.ceil(fraction * recovery.sum())))
+    if recovery.sum() < 2:
+        raise ValueError('Recovery analysis needs at least two measurements after the shutdown')
+    window = np.zeros(len(t), dtype=bool)
+    window[np.flatnonzero(recovery)[np.argsort(ratio[recovery])[:n_min]]] = True
+    slope, intercept = np.polyfit(np.log10(ratio[window]), s[window], 1)
+    if slope <= 0:
+        raise ValueError('Residual drawdown does not decrease during recovery')
+    T = np.log(10.) * Q / 4. / np.pi / slope
+    return {'T': T, 'log_T': np.log10(T), 'slope': slope, 'intercept': intercept,
+            'window': window, 'ratio': ratio}
+
+
+def fit_theis_recovery(t, s, Q, r, t_p, phases='both', fit_shutdown=False, p0=None, bounds=((-7., -7.), (0., 0.))):
+    """Fit the Theis solution to a pumping and recovery record.
+
+    phases is 'both' (all measurements) or 'recovery' (t > t_p only). With
+    fit_shutdown the shutdown time is estimated as well, between the first
+    measurement and t_p (e.g. the drawdown peak). p0 and bounds are
+    (log10 T, log10 S); without p0 the fit starts with T from the recovery
+    line and S from the Cooper-Jacob estimate of the pumping phase. Returns
+    the dict of fit_theis for the fitted measurements, extended by t_p.
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    # The shutdown is searched from the first measurement, also if only the recovery is fitted
+    t_first = t[t > 0].min()
+    used = t > t_p if phases == 'recovery' else t > 0
+    t, s = t[used], s[used]
+    if p0 is None:
+        pumping = t <= t_p
+        p0 = cooper_jacob_start(t[pumping], s[pumping], Q, r, bounds)
+        try:
+            p0[0] = np.clip(recovery_line(t, s, Q, t_p)['log_T'], bounds[0][0], bounds[1][0])
+        except ValueError:
+            pass
+    if fit_shutdown:
+        # Third parameter log10 t_p, searched before the given t_p
+        p0 = np.append(p0, np.log10(t_p))
+        bounds = (tuple(bounds[0]) + (np.log10(t_first),), tuple(bounds[1]) + (np.log10(t_p),))
+
+    def residual_jac(p):
+        T, S = 10 ** p[0], 10 ** p[1]
+        t_shut = 10 ** p[2] if fit_shutdown else t_p
+        t_rec = np.where(t > t_shut, t - t_shut, 0.)
+        s_pump, jac_pump = theis_jacobian(T, S, t, Q, r)
+        s_inj, jac_inj = theis_jacobian(T, S, t_rec, Q, r)
+        jac = jac_pump - jac_inj
+        if fit_shutdown:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ds_dt = np.where(t_rec > 0, Q / 4. / np.pi / T * np.exp(-r ** 2 * S / 4. / T / t_rec) / t_rec, 0.)
+            jac = np.column_stack((jac, ds_dt * t_shut * np.log(10.)))
+        return s_pump - s_inj - s, jac
+
+    p, res, jac, iterations = levenberg_marquardt(residual_jac, p0, bounds)
+    fit = _fit_result(p, res, jac, iterations)
+    fit.update({'T': 10 ** p[0], 'S': 10 ** p[1], 'log_T': p[0], 'log_S': p[1],
+                't_p': 10 ** p[2] if fit_shutdown else t_p})
+    return fit
@@ -0,0 +1,348 @@
+"""Slug test analysis with the Bouwer & Rice, Hvorslev and KGS models.
+
+After the slug is added at t_off, the normalized head H/H0 in the well
+decays exponentially:
+
+    H/H0 = exp(-F K (t - t_off) / (π rc²)),    F = 2πL / ln(L/rw)
+
+(the shape factor of the apps, with ln(Re/rw) approximated by ln(L/rw)).
+ln(H/H0) is therefore a straight line in t with the slope -F K/(π rc²) and
+the intercept F K t_off/(π rc²), so K and the offset follow together from
+one linear regression. The regression is robust (Huber weights, iteratively
+reweighted least squares), so single logger spikes do not bias K.
+
+Early data can be affected by the slug introduction and the drainage of the
+filter pack, late data by noise around the static level. fit_bouwer_rice
+therefore chooses the window automatically: all head ranges between the
+levels of WINDOW_LEVELS (relative to the peak) are fitted and the one with
+the smallest relative standard error of K is used.
+
+The Hvorslev (1951) solution has the same exponential form, with the shape
+factor F = 2πL / asinh(m L/(2 rw)) of a screen in an anisotropic medium,
+m = (Kr/Kz)^(1/2). Both neglect the storage of the aquifer. The KGS model
+(Hyder et al. 1994) includes the specific storage Ss and the anisotropy
+Kz/Kr of a confined aquifer of thickness b, with the screen from the depth
+d to d + L below the top of the aquifer. With uniform flux along the screen
+and the mean screen head as well head, the Laplace transform of H/H0 is
+
+    H̄(p) = 1 / (p + 2 L Kr / (rc² G)),   G = Σ w_n K0(x_n) / (x_n K1(x_n))
+    x_n = rw ((Ss p + Kz (nπ/b)²) / Kr)^(1/2)
+
+with w_0 = L/b and w_n = c_n² b/(2L), c_n the cosine coefficients of the
+screen interval (c_n = 0 for n >= 1 if the well fully penetrates the
+aquifer, the solution of Cooper et al. 1967). H/H0 is recovered with the
+Stehfest algorithm for all times and all terms in one broadcast; long
+records are evaluated on a log-spaced grid of times and interpolated, as
+for the Neuman solution.
+"""
+
+import numpy as np
+import scipy.interpolate
+import scipy.ndimage
+import scipy.special
+import scipy.stats
+
+from gwtools.fitting import _fit_result, levenberg_marquardt
+from gwtools.metrics import goodness_of_fit
+from gwtools.neuman import _STEHFEST_V, GRID_MIN_SIZE, GRID_PER_DECADE, N_STEHFEST
+
+WINDOW_LEVELS = (0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.15, 0.1, 0.05)
+
+
+def shape_factor(rw, L):
+    """Shape factor F = 2πL/ln(L/rw) of a well screen with length L and radius rw."""
+    return 2. * np.pi * L / np.log(L / rw)
+
+
+def bouwer_rice(K, t, rc, rw, L, t_off=0.):
+    """Normalized head H/H0 of the Bouwer & Rice solution, 0 before the slug at t_off."""
+    t = np.asarray(t, dtype=float)
+    a = shape_factor(rw, L) * K / np.pi / rc ** 2
+    return np.where(t < t_off, 0., np.exp(-a * np.maximum(t - t_off, 0.)))
+
+
+def hvorslev_shape_factor(rw, L, anisotropy=1.):
+    """Hvorslev shape factor 2πL/asinh(m L/(2 rw)) of a screen, m = (Kr/Kz)^(1/2) with anisotropy = Kz/Kr."""
+    return 2. * np.pi * L / np.arcsinh(L / 2. / rw / np.sqrt(anisotropy))
+
+
+def hvorslev(K, t, rc, rw, L, t_off=0., anisotropy=1.):
+    """Normalized head H/H0 of the Hvorslev solution with the horizontal conductivity K, 0 before t_off."""
+    t = np.asarray(t, dtype=float)
+    a = hvorslev_shape_factor(rw, L, anisotropy) * K / np.pi / rc ** 2
+    return np.where(t < t_off, 0., np.exp(-a * np.maximum(t - t_off, 0.)))
+
+
+def _kgs_transforms(p, K, Ss, rc, rw, L, b, d, anisotropy, n_terms):
+    # H̄, dH̄/dln K, dH̄/dln Ss and the transform p H̄ - 1 of dH/dt along a new last axis
+    if d < 0 or d + L > b:
+        raise ValueError('The screen must lie inside the aquifer (0 <= d, d + L <= b)')
+    p = np.asarray(p, dtype=float)[..., None]
+    n = np.arange(n_terms)
+    c = np.zeros(n_terms)
+    c[1:] = 2. / np.pi / n[1:] * (np.sin(n[1:] * np.pi * (d + L) / b) - np.sin(n[1:] * np.pi * d / b))
+    w = np.where(n == 0, L / b, c ** 2 * b / 2. / L)
+    storage = rw ** 2 * Ss * p / K
+    x = np.sqrt(storage + rw ** 2 * anisotropy * (n * np.pi / b) ** 2)
+    # Exponentially scaled Bessel functions, their ratio does not underflow
+    ratio = scipy.special.k0e(x) / scipy.special.k1e(x)
+    G = (w * ratio / x).sum(axis=-1)
+    # d/dx (K0/(x K1)) = ((K0/K1)² - 1)/x and dx/dln Ss = -dx/dln K = storage/(2x)
+    G_Ss = (w * (ratio ** 2 - 1.) * storage / 2. / x ** 2).sum(axis=-1)
+    A = 2. * L * K / rc ** 2
+    p = p[..., 0]
+    H = 1. / (p + A / G)
+    return np.stack((H, -H ** 2 * A / G * (1. + G_Ss / G), H ** 2 * A * G_Ss / G ** 2, p * H - 1.), axis=-1)
+
+
+def kgs_laplace(p, K, Ss, rc, rw, L, b, d=0., anisotropy=1., n_terms=100):
+    """Laplace transform of H/H0 of the KGS model for an array of p (1/s)."""
+    return _kgs_transforms(p, K, Ss, rc, rw, L, b, d, anisotropy, n_terms)[..., 0]
+
+
+def kgs_jacobian(K, Ss, t, rc, rw, L, b, d=0., anisotropy=1., t_off=0., n_terms=100):
+    """Normalized head of the KGS model and its derivatives with respect to log10 K, log10 Ss and t_off.
+
+    Returns h and an array of shape (len(t), 3). The derivatives are
+    inverted from their Laplace transforms together with h, so they cost no
+    further Bessel function evaluations.
+    """
+    t = np.asarray(t, dtype=float) - t_off
+    active = t > 0
+    h = np.where(t < 0, 0., 1.)
+    jac = np.zeros(t.shape + (3,))
+
+    def stehfest(t):
+        ln2_t = np.log(2.) / t
+        p = ln2_t[:, None] * np.arange(1, N_STEHFEST + 1)
+        return ln2_t[:, None] * np.einsum('tki,k->ti', _kgs_transforms(p, K, Ss, rc, rw, L, b, d, anisotropy, n_terms), _STEHFEST_V)
+
+    log_t = np.log(t[active])
+    if log_t.size >= GRID_MIN_SIZE and np.ptp(log_t) > 0:
+        num = max(int(np.ceil(np.ptp(log_t) / np.log(10.) * GRID_PER_DECADE)) + 1, 4)
+        grid = np.linspace(log_t.min(), log_t.max(), num)
+        values = scipy.interpolate.CubicSpline(grid, stehfest(np.exp(grid)))(log_t)
+    else:
+        values = stehfest(t[active])
+    h[active] = values[:, 0]
+    jac[active] = values[:, 1:] * np.array([np.log(10.), np.log(10.), -1.])
+    return h, jac
+
+
+def kgs(K, Ss, t, rc, rw, L, b, d=0., anisotropy=1., t_off=0., n_terms=100):
+    """Normalized head H/H0 of the KGS model (Stehfest inversion), 0 before t_off and 1 at t_off."""
+    return kgs_jacobian(K, Ss, t, rc, rw, L, b, d, anisotropy, t_off, n_terms)[0]
+
+
+def robust_line(x, y, c=1.345, max_iter=50, tol=1e-10, x0=None):
+    """Straight line y = slope x + intercept fitted with Huber weights (IRLS).
+
+    Residuals beyond c times the robust scale (MAD) get the weight c/|z|.
+    If x0 is given, the line is forced through (x0, 0) and only the slope is
+    fitted. Returns a dict with slope, intercept, their covariance matrix,
+    the weights and the residuals.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x0 is None:
+        X = np.column_stack((x, np.ones_like(x)))
+    else:
+        X = (x - x0)[:, None]
+    w = np.ones_like(x)
+    p = np.zeros(X.shape[1])
+    for _ in range(max_iter):
+        p_new = np.linalg.lstsq(X * np.sqrt(w)[:, None], y * np.sqrt(w), rcond=None)[0]
+        res = y - X @ p_new
+        scale = max(1.4826 * np.median(np.abs(res - np.median(res))), 1e-12)
+        z = np.abs(res) / scale
+        w = np.where(z <= c, 1., c / np.maximum(z, 1e-300))
+        converged = np.all(np.abs(p_new - p) <= tol * (1. + np.abs(p)))
+        p = p_new
+        if converged:
+            break
+    sigma2 = (w * res ** 2).sum() / max(len(x) - X.shape[1], 1)
+    cov = sigma2 * np.linalg.pinv((X * w[:, None]).T @ X)
+    if x0 is None:
+        return {'slope': p[0], 'intercept': p[1], 'cov': cov, 'weights': w, 'residuals': res}
+    # Covariance of (slope, intercept = -slope x0)
+    J = np.array([[1.], [-x0]])
+    return {'slope': p[0], 'intercept': -p[0] * x0, 'cov': J @ cov @ J.T, 'weights': w, 'residuals': res}
+
+
+def slug_start(t, h, threshold=0.1):
+    """Time of the slug in a normalized head record.
+
+    The slug is placed at the last measurement before the peak (of the
+    running median) with a head below threshold times the peak head; the
+    first time if the record starts above it.
+    """
+    t = np.asarray(t, dtype=float)
+    h = np.asarray(h, dtype=float)
+    smooth = scipy.ndimage.median_filter(h, size=min(5, len(h)), mode='nearest')
+    peak = int(np.argmax(smooth))
+    below = np.flatnonzero(h[:peak + 1] < threshold * smooth[peak])
+    return t[below[-1]] if len(below) else t[0]
+
+
+def decay_phase(t, h):
+    """Measurements of the head decay (boolean array) and the peak head.
+
+    The decay starts at the peak of the running median of h and ends where
+    the heads fall below three times the noise level (median absolute
+    difference of consecutive heads).
+    """
+    h = np.asarray(h, dtype=float)
+    smooth = scipy.ndimage.median_filter(h, size=min(5, len(h)), mode='nearest')
+    peak = int(np.argmax(smooth))
+    after = np.arange(len(h)) >= peak
+    noise = np.median(np.abs(np.diff(h[after]))) if after.sum() > 1 else 0.
+    return after & (h > 3. * noise), smooth[peak]
+
+
+def slug_window(t, h, levels=WINDOW_LEVELS, min_points=5):
+    """Automatic fitting window of a slug test record (boolean array).
+
+    Every range of the decay phase between two levels (times the peak head)
+    with at least min_points measurements is fitted and the range with the
+    smallest relative standard error of the slope is returned. Raises
+    ValueError if no range has enough measurements.
+    """
+    t = np.asarray(t, dtype=float)
+    h = np.asarray(h, dtype=float)
+    decay, peak = decay_phase(t, h)
+    levels = [level * peak for level in levels]
+    best, best_error = None, np.inf
+    for i, high in enumerate(levels):
+        for low in levels[i + 1:]:
+            window = decay & (h <= high) & (h >= low)
+            if window.sum() < min_points:
+                continue
+            line = robust_line(t[window], np.log(h[window]))
+            if line['slope'] >= 0:
+                continue
+            error = np.sqrt(line['cov'][0, 0]) / -line['slope']
+            if error < best_error:
+                best, best_error = window, error
+    if best is None:
+        raise ValueError('Not enough measurements during the head decay for a fit')
+    return best
+
+
+def _fit_exponential(t, h, factor, window, alpha):
+    # K = -slope factor and t_off from the robust line through ln(H/H0); an
+    # offset outside the record (before the first sample or after the start
+    # of the window) is fixed at that limit and only K is fitted
+    t = np.asarray(t, dtype=float)
+    h = np.asarray(h, dtype=float)
+    if window is None:
+        window = slug_window(t, h)
+    window = window & (h > 0)
+    if window.sum() < 3:
+        raise ValueError('At least three positive normalized heads are needed for a fit')
+    line = robust_line(t[window], np.log(h[window]))
+    if line['slope'] >= 0:
+        raise ValueError('The normalized head does not decrease in the fitting window')
+    t_off = -line['intercept'] / line['slope']
+    t_off_bounded = float(np.clip(t_off, t.min(), t[window].min()))
+    clipped = t_off_bounded != t_off
+    if clipped:
+        line = robust_line(t[window], np.log(h[window]), x0=t_off_bounded)
+        if line['slope'] >= 0:
+            raise ValueError('The normalized head does not decrease in the fitting window')
+    slope, intercept, cov = line['slope'], line['intercept'], line['cov']
+    K, t_off = -slope * factor, -intercept / slope
+    # Linearized (delta method) standard errors of K and t_off
+    grad = np.array([intercept / slope ** 2, -1. / slope])
+    se_K = np.sqrt(cov[0, 0]) * factor
+    se_t_off = np.sqrt(max(grad @ cov @ grad, 0.))
+    q = scipy.stats.t.ppf(1. - alpha / 2., max(window.sum() - (1 if clipped else 2), 1))
+    return {'K': K, 'log_K': np.log10(K), 't_off': t_off, 't_off_clipped': clipped,
+            'ci_K': (max(K - q * se_K, 0.), K + q * se_K), 'ci_t_off': (t_off - q * se_t_off, t_off + q * se_t_off),
+            'window': window, 'rmse': np.sqrt(np.mean(line['residuals'] ** 2)),
+            'slope': slope, 'intercept': intercept, 'cov': cov}
+
+
+def fit_bouwer_rice(t, h, rc, rw, L, window=None, alpha=0.05):
+    """Fit K and the time offset of the Bouwer & Rice solution to a normalized head record.
+
+    t (s) are the measurement times, h the normalized heads H/H0, rc, rw and
+    L (m) the casing radius, screen radius and screen length. window is a
+    boolean array of the measurements to fit (default: slug_window).
+    Returns a dict with K, log_K, t_off, their (1 - alpha) confidence
+    intervals ci_K and ci_t_off, the window, the RMSE of ln(H/H0) in the
+    window and the regression line of ln(H/H0) against t. t_off is bounded
+    by the first measurement and the start of the window; if the regression
+    places it outside, it is fixed at the bound (t_off_clipped is True,
+    ci_t_off has zero width) and K is fitted alone.
+    """
+    return _fit_exponential(t, h, np.pi * rc ** 2 / shape_factor(rw, L), window, alpha)
+
+
+def fit_hvorslev(t, h, rc, rw, L, anisotropy=1., window=None, alpha=0.05):
+    """Fit K and the time offset of the Hvorslev solution (anisotropy = Kz/Kr), see fit_bouwer_rice."""
+    return _fit_exponential(t, h, np.pi * rc ** 2 / hvorslev_shape_factor(rw, L, anisotropy), window, alpha)
+
+
+def fit_kgs(t, h, rc, rw, L, b, d=0., anisotropy=1., window=None, p0=None, bounds=None, alpha=0.05, n_terms=100):
+    """Fit K, Ss and the time offset of the KGS model to a normalized head record.
+
+    The parameters are (log10 K, log10 Ss, t_off); window defaults to the
+    decay phase and p0 to K and t_off of the Hvorslev fit with Ss = 1e-5 1/m.
+    t_off is searched between the first measurement and the window.
+    Returns the dict of fit_theis with K, Ss, t_off, their log10 values,
+    the (1 - alpha) confidence intervals ci_K, ci_Ss and ci_t_off and the
+    window.
+    """
+    t = np.asarray(t, dtype=float)
+    h = np.asarray(h, dtype=float)
+    if window is None:
+        window = decay_phase(t, h)[0]
+    if bounds is None:
+        bounds = ((-9., -7., t.min()), (-1., -1., t[window].min()))
+    if p0 is None:
+        try:
+            start = fit_hvorslev(t, h, rc, rw, L, anisotropy)
+            p0 = (start['log_K'], -5., start['t_off'])
+        except ValueError:
+            p0 = (-5., -5., t.min())
+    p0 = np.clip(np.asarray(p0, dtype=float), *bounds)
+    t, h = t[window], h[window]
+
+    def residual_jac(p):
+        h_calc, jac = kgs_jacobian(10 ** p[0], 10 ** p[1], t, rc, rw, L, b, d, anisotropy, p[2], n_terms)
+        return h_calc - h, jac
+
+    p, res, jac, iterations = levenberg_marquardt(residual_jac, p0, bounds)
+    fit = _fit_result(p, res, jac, iterations)
+    q = scipy.stats.t.ppf(1. - alpha / 2., max(len(t) - 3, 1)) * np.sqrt(np.diag(fit['cov']))
+    fit.update({'K': 10 ** p[0], 'Ss': 10 ** p[1], 't_off': p[2], 'log_K': p[0], 'log_Ss': p[1],
+                'ci_K': (10 ** (p[0] - q[0]), 10 ** (p[0] + q[0])), 'ci_Ss': (10 ** (p[1] - q[1]), 10 ** (p[1] + q[1])),
+                'ci_t_off': (p[2] - q[2], p[2] + q[2]), 'window': window})
+    return fit
+
+
+def compare_slug_models(t, h, rc, rw, L, b, d=0., anisotropy=1.):
+    """Fit the Bouwer & Rice, Hvorslev and KGS models to one normalized head record.
+
+    Returns a dict of model name -> fit dict, each extended by the computed
+    heads h at all times t and the RMSE of H/H0, AIC, NSE and lag-1
+    residual autocorrelation over the decay phase after the latest fitted
+    t_off (the same measurements for all models).
+    """
+    t = np.asarray(t, dtype=float)
+    h = np.asarray(h, dtype=float)
+    fits = {'Bouwer & Rice': fit_bouwer_rice(t, h, rc, rw, L),
+            'Hvorslev': fit_hvorslev(t, h, rc, rw, L, anisotropy),
+            'KGS': fit_kgs(t, h, rc, rw, L, b, d, anisotropy)}
+    fits['Bouwer & Rice']['h'] = bouwer_rice(fits['Bouwer & Rice']['K'], t, rc, rw, L, fits['Bouwer & Rice']['t_off'])
+    fits['Hvorslev']['h'] = hvorslev(fits['Hvorslev']['K'], t, rc, rw, L, fits['Hvorslev']['t_off'], anisotropy)
+    fits['KGS']['h'] = kgs(fits['KGS']['K'], fits['KGS']['Ss'], t, rc, rw, L, b, d, anisotropy, fits['KGS']['t_off'])
+    decay = decay_phase(t, h)[0] & (t >= max(fit['t_off'] for fit in fits.values()))
+    scores = goodness_of_fit(h[decay], np.stack([fit['h'][decay] for fit in fits.values()]),
+                             k=np.array([2, 2, 3]))
+    for i, fit in enumerate(fits.values()):
+        fit['decay_rmse'] = scores['rmse'][i]
+        fit['decay_aic'] = scores['aic'][i]
+        fit['decay_nse'] = scores['nse'][i]
+        fit['decay_autocorrelation'] = scores['autocorrelation'][i, 0]
+    return fits
@@ -0,0 +1,245 @@
+"""Spatial and temporal superposition of Theis drawdown.
+
+A well field is an array with one row (x, y, Q) per well, Q in m³/s
+(positive for pumping, negative for injection). Straight boundaries are
+represented by image wells (Ferris et al. 1962): the image is the
+mirror of the real well across the boundary line, with the same rate for a
+no-flow boundary and the opposite rate for a constant-head boundary.
+Several boundaries (wedges, strips) are handled by reflecting the images
+again, up to a given number of reflections; for two parallel boundaries
+this truncates the infinite image series.
+
+drawdown_field sums the drawdown of all wells for any set of points and
+times, in chunks of cells so that the (times x cells x wells) block stays
+below chunk_size values. Each well may follow its own rate schedule (see
+below). Images whose drawdown stays below a tolerance everywhere in the area
+are dropped, and images far from the area are summed on a coarse lattice
+and interpolated, since their drawdown varies smoothly there.
+
+Variable pumping rates are piecewise-constant schedules: rate Q_i is pumped
+from t_i until t_(i+1), so the drawdown is the sum of the unit responses of
+the rate changes (recovery is a change to Q = 0):
+
+    s(t) = Σ (Q_i - Q_(i-1)) s_1(t - t_i)
+
+schedule_drawdown evaluates this sum for any times and steps in one
+broadcast call. For schedules on a uniform grid (e.g. daily rates over
+years) uniform_schedule_drawdown samples the unit response once on the grid
+and convolves it with the rate changes by FFT, i.e. O(N log N) instead of
+O(N²) for N steps.
+"""
+
+import numpy as np
+import scipy.interpolate
+import scipy.signal
+
+from gwtools.well_hydraulics import compute_s, well_function
+
+BOUNDARY_SIGN = {'no_flow': 1., 'constant_head': -1.}
+
+# Rate changes farther from the area of a well field than FAR_DISTANCE times its
+# size are summed on a lattice with FAR_STEPS steps per FAR_DISTANCE (plus a margin
+# of two steps) and interpolated with bicubic splines
+FAR_DISTANCE = 0.5
+FAR_STEPS = 8
+
+def boundary(kind, x0, y0, angle):
+    """Straight boundary of a kind in BOUNDARY_SIGN through (x0, y0) with direction angle (degrees from the x-axis)."""
+    if kind not in BOUNDARY_SIGN:
+        raise ValueError('Unknown boundary type %r' % kind)
+    return kind, float(x0), float(y0), np.radians(angle)
+
+
+def reflect(wells, bound):
+    """Image wells of wells (n, 3) across one boundary."""
+    kind, x0, y0, angle = bound
+    wells = np.atleast_2d(np.asarray(wells, dtype=float))
+    n = np.array([-np.sin(angle), np.cos(angle)])
+    d = (wells[:, 0] - x0) * n[0] + (wells[:, 1] - y0) * n[1]
+    return np.column_stack((wells[:, 0] - 2 * d * n[0], wells[:, 1] - 2 * d * n[1],
+                            BOUNDARY_SIGN[kind] * wells[:, 2]))
+
+
+def _images(wells, boundaries, reflections=None, decimals=6):
+    # Real and image wells (m, 3) with the index of their real well and the sign of their rate
+    wells = np.atleast_2d(np.asarray(wells, dtype=float))
+    source = np.arange(len(wells))
+    if not boundaries:
+        return wells, source, np.ones(len(wells))
+    if reflections is None:
+        reflections = 1 if len(boundaries) == 1 else 10
+    result, sources, signs = [wells], [source], [np.ones(len(wells))]
+    generation = [(wells, source, np.ones(len(wells)), None)]
+    for _ in range(reflections):
+        new = []
+        for images, source, sign, last in generation:
+            for i, bound in enumerate(boundaries):
+                if i != last:
+                    new.append((reflect(images, bound), source, sign * BOUNDARY_SIGN[bound[0]], i))
+        if not new:
+            break
+        result += [images for images, _, _, _ in new]
+        sources += [source for _, source, _, _ in new]
+        signs += [sign for _, _, sign, _ in new]
+        generation = new
+    result, sources, signs = np.concatenate(result), np.concatenate(sources), np.concatenate(signs)
+    # Key: source well, reflection sign and position; the real wells come first and are always kept
+    key = np.column_stack((sources, signs, np.round(result[:, :2], decimals)))
+    _, index = np.unique(key, axis=0, return_index=True)
+    index = np.sort(index)
+    return result[index], sources[index], signs[index]
+
+
+def image_wells(wells, boundaries, reflections=None, decimals=6):
+    """Real and image wells for a list of boundaries, shape (m, 3).
+
+    Images are reflected across every boundary again up to `reflections`
+    times (default: 1 for one boundary, 10 for several). Images of the same
+    real well with the same position and sign (e.g. reached by different
+    reflection sequences in a right-angle corner) are only kept once; real
+    wells and images of different wells are never merged.
+    """
+    return _images(wells, boundaries, reflections, decimals)[0]
+
+
+def _rate_changes(wells, schedules, t_max):
+    # Well index, start time and rate change of every step of the wells
+    if schedules is None:
+        schedules = [None] * len(wells)
+    if len(schedules) != len(wells):
+        raise ValueError('One schedule (or None) per well is required')
+    index, t_steps, dQ = [], [], []
+    for i, (well, schedule) in enumerate(zip(wells, schedules)):
+        steps, rates = ((0.,), (well[2],)) if schedule is None else schedule
+        steps = np.atleast_1d(np.asarray(steps, dtype=float))
+        changes = np.diff(np.atleast_1d(np.asarray(rates, dtype=float)), prepend=0.)
+        # Rate changes after the last time do not contribute
+        used = (steps < t_max) & (changes != 0)
+        index.append(np.full(used.sum(), i))
+        t_steps.append(steps[used])
+        dQ.append(changes[used])
+    return np.concatenate(index), np.concatenate(t_steps), np.concatenate(dQ)
+
+
+def _unit_responses(x, y, x_e, y_e, factor, q_e, r_w, chunk_size):
+    # Sum of q_e W(r² factor) of the rate changes at the points, shape (len(factor), len(x))
+    s = np.zeros((len(factor), len(x)))
+    if not len(q_e):
+        return s
+    rows = max(1, chunk_size // (len(q_e) * len(factor)))
+    for i in range(0, len(x), rows):
+        block = slice(i, i + rows)
+        r2 = (x[block, None] - x_e) ** 2 + (y[block, None] - y_e) ** 2
+        r2 = np.maximum(r2, r_w ** 2)
+        s[:, block] = well_function(factor[:, None, :] * r2) @ q_e
+    return s
+
+
+def drawdown_field(wells, x, y, t, T, S, boundaries=(), reflections=None, r_w=0.1, chunk_size=2 ** 22,
+                   schedules=None, tol=1e-4):
+    """Drawdown of a well field at the points (x, y) and times t.
+
+    wells has one row (x, y, Q) per well, x and y are broadcastable arrays
+    of the evaluation points (e.g. from np.meshgrid) and t the times in s.
+    schedules optionally gives a pumping schedule (t_steps, Q_steps) per
+    well as in schedule_drawdown, or None for a well that pumps its rate Q
+    from t = 0; the images follow the schedule of their real well. The
+    field is the sum of the unit responses of all rate changes of the real
+    and image wells:
+
+    - rate changes whose drawdown stays below tol (m) at the nearest point
+      of the bounding box of the points until the last time are left out,
+    - rate changes far from the bounding box (the outer images of strips
+      and wedges) give a smooth drawdown in it; for many points they are
+      summed on a coarse lattice and interpolated.
+
+    Distances below the well radius r_w are set to r_w. Returns an array of
+    shape (len(t),) + shape of the points; t <= 0 gives zero drawdown.
+    """
+    wells = np.atleast_2d(np.asarray(wells, dtype=float))
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    shape = x.shape
+    x, y = x.ravel(), y.ravel()
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    if not len(x) or t.max() <= 0:
+        return np.zeros((len(t),) + shape)
+    well, t_steps, dQ = _rate_changes(wells, schedules, t.max())
+    images, source, sign = _images(wells, list(boundaries), reflections)
+    # Every rate change of a real well is repeated by its images
+    image, step = np.nonzero(source[:, None] == well[None, :])
+    x_e, y_e = images[image, 0], images[image, 1]
+    t_e, q_e = t_steps[step], sign[image] * dQ[step] / 4. / np.pi / T
+    # Largest drawdown of each rate change in the area: nearest point of the bounding box at the last time
+    x_min, x_max, y_min, y_max = x.min(), x.max(), y.min(), y.max()
+    dx = np.maximum(np.maximum(x_min - x_e, x_e - x_max), 0.)
+    dy = np.maximum(np.maximum(y_min - y_e, y_e - y_max), 0.)
+    distance = np.sqrt(dx ** 2 + dy ** 2)
+    keep = np.abs(q_e) * well_function(np.maximum(distance, r_w) ** 2 * S / 4. / T / (t.max() - t_e)) >= tol
+    # Drawdown per unit of r² S / (4 T (t - t_e)); rate changes after t give u = inf (no drawdown)
+    elapsed = t[:, None] - t_e
+    with np.errstate(divide='ignore'):
+        factor = np.where(elapsed > 0, S / 4. / T / elapsed, np.inf)
+    far_distance = FAR_DISTANCE * max(x_max - x_min, y_max - y_min)
+    step_size = far_distance / FAR_STEPS
+    if step_size > 0:
+        x_lattice = x_min + step_size * np.arange(-2, int(np.ceil((x_max - x_min) / step_size)) + 3)
+        y_lattice = y_min + step_size * np.arange(-2, int(np.ceil((y_max - y_min) / step_size)) + 3)
+    far = keep & (distance >= far_distance)
+    if step_size == 0 or not far.any() or len(x) <= 4 * len(x_lattice) * len(y_lattice):
+        far[:] = False
+    near = keep & ~far
+    s = _unit_responses(x, y, x_e[near], y_e[near], factor[:, near], q_e[near], r_w, chunk_size)
+    if far.any():
+        X, Y = np.meshgrid(x_lattice, y_lattice)
+        s_far = _unit_responses(X.ravel(), Y.ravel(), x_e[far], y_e[far], factor[:, far], q_e[far], r_w, chunk_size)
+        for k, s_k in enumerate(s_far):
+            s[k] += scipy.interpolate.RectBivariateSpline(y_lattice, x_lattice, s_k.reshape(X.shape))(y, x, grid=False)
+    return s.reshape((len(t),) + shape)
+
+
+def _parameter_sets(T, S):
+    T, S = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(S, dtype=float))
+    return T.shape, T.ravel(), S.ravel()
+
+
+def schedule_drawdown(T, S, t, r, t_steps, Q_steps, chunk_size=2 ** 22):
+    """Drawdown at distance r for a piecewise-constant pumping schedule.
+
+    Q_steps[i] (m³/s) is pumped from t_steps[i] until t_steps[i + 1] (s),
+    the last rate until the end; nothing is pumped before t_steps[0]. T and
+    S can be arrays of parameter sets (e.g. an ensemble). Returns an array
+    of the shape of T and S + (len(t),).
+    """
+    shape, T, S = _parameter_sets(T, S)
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    t_steps = np.atleast_1d(np.asarray(t_steps, dtype=float))
+    dQ = np.diff(np.atleast_1d(np.asarray(Q_steps, dtype=float)), prepend=0.)
+    # Rate changes after the last time do not contribute
+    used = (t_steps < t.max()) & (dQ != 0)
+    t_steps, dQ = t_steps[used], dQ[used]
+    s = np.zeros((len(T), len(t)))
+    rows = max(1, chunk_size // max(len(t) * len(t_steps), 1))
+    for i in range(0, len(T), rows):
+        block = slice(i, i + rows)
+        s[block] = compute_s(T[block, None, None], S[block, None, None], t[:, None] - t_steps, dQ, r).sum(axis=-1)
+    return s.reshape(shape + (len(t),))
+
+
+def uniform_schedule_drawdown(T, S, r, Q, dt, chunk_size=2 ** 22):
+    """Drawdown at distance r for rates on a uniform time grid, by FFT convolution.
+
+    Q[j] (m³/s) is pumped from j dt to (j + 1) dt. Returns the drawdown at
+    the times dt, 2 dt, ..., len(Q) dt, an array of the shape of T and S +
+    (len(Q),).
+    """
+    shape, T, S = _parameter_sets(T, S)
+    dQ = np.diff(np.asarray(Q, dtype=float), prepend=0.)
+    n = len(dQ)
+    t = dt * np.arange(1, n + 1)
+    s = np.empty((len(T), n))
+    rows = max(1, chunk_size // n)
+    for i in range(0, len(T), rows):
+        block = slice(i, i + rows)
+        unit = compute_s(T[block, None], S[block, None], t, 1., r)
+        s[block] = scipy.signal.fftconvolve(unit, dQ[None, :], axes=-1)[:, :n]
+    return s.reshape(shape + (n,))
@@ -0,0 +1,342 @@
+"""Batched machine translation of the app texts with a persistent cache.
+
+translate_markdown translates all texts of a page together. The texts are
+split into segments (the text of a line between header marks, list
+bullets and HTML tags), LaTeX math and technical terms are masked by
+tokens, and the segments that are not cached yet are sent in batches of
+bounded size, separated by numbered markers. The batches run concurrently
+on a thread pool, so a page costs about one round trip to the service.
+The backends are Google Translate (deep_translator), a phrase dictionary
+(etc/dictionary.json) and an offline stand-in that returns the text.
+
+The translations are stored in an SQLite database keyed by the SHA-256
+hash of the normalized source segment (Unicode NFC, runs of white space
+collapsed), the target language, a glossary version and the backend
+name. A segment is translated once and then shared by all sessions and
+processes of the apps. The glossary version is a hash of the technical
+terms and their fixed translations, so a changed glossary addresses new
+entries and the old ones are not used anymore. The backend name keeps
+the output of the offline backends apart from real translations.
+
+The database is ~/.cache/gwtools/translations.sqlite or the file given by
+the environment variable GWTOOLS_TRANSLATION_CACHE.
+"""
+
+import concurrent.futures
+import contextlib
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+
+CACHE_FILE = Path(os.environ.get('GWTOOLS_TRANSLATION_CACHE', Path.home() / '.cache' / 'gwtools' / 'translations.sqlite'))
+
+
+def normalize(text):
+    """Unicode NFC form of text with runs of white space collapsed to one blank."""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def text_key(text):
+    """SHA-256 hex digest of the normalized text."""
+    return hashlib.sha256(normalize(text).encode('utf-8')).hexdigest()
+
+
+def glossary_version(*glossaries):
+    """Short hash of glossaries (JSON serializable, e.g. dicts of term translations)."""
+    return hashlib.sha256(json.dumps(glossaries, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
+DICTIONARY_FILE = Path(__file__).resolve().parents[1] / 'etc' / 'dictionary.json'
+
+# Backend of the apps: GWTOOLS_TRANSLATOR (google, dictionary or offline), else Google if installed
+DEFAULT_BACKEND = os.environ.get('GWTOOLS_TRANSLATOR') or ('google' if importlib.util.find_spec('deep_translator') else 'offline')
+
+
+class GoogleBackend:
+    """Google Translate through deep_translator (optional dependency, imported on first use).
+
+    GoogleTranslator keeps the query of a request in the instance, so every
+    thread uses its own translator.
+    """
+
+    name = 'google'
+    # The service accepts up to 5000 characters per request
+    max_chars = 4500
+    thread_safe = True
+
+    def __init__(self, source='auto', target='en'):
+        from deep_translator import GoogleTranslator
+        self.factory = lambda: GoogleTranslator(source=source, target=target)
+        self.local = threading.local()
+        # Fails early for unsupported languages
+        self.local.translator = self.factory()
+
+    def translate(self, text):
+        if not hasattr(self.local, 'translator'):
+            self.local.translator = self.factory()
+        return self.local.translator.translate(text) or ''
+
+
+class DictionaryBackend:
+    """Offline translation by replacing known phrases, longest first; other text is kept.
+
+    entries is a dict source phrase -> translation, e.g. from
+    etc/dictionary.json (German -> English). from_json(path, invert=True)
+    gives the opposite direction.
+    """
+
+    max_chars = 10 ** 6
+    thread_safe = True
+
+    def __init__(self, entries, name='dictionary'):
+        self.entries = {key.lower(): value for key, value in entries.items()}
+        self.name = '%s-%s' % (name, glossary_version(entries))
+        phrases = sorted(entries, key=len, reverse=True)
+        self.pattern = re.compile(r'\b(%s)\b' % '|'.join(map(re.escape, phrases)), re.IGNORECASE) if phrases else None
+
+    @classmethod
+    def from_json(cls, path, invert=False, name='dictionary'):
+        entries = json.loads(Path(path).read_text(encoding='utf-8'))
+        if invert:
+            entries = {value: key for key, value in entries.items()}
+        return cls(entries, name)
+
+    def translate(self, text):
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(lambda match: self.entries[match.group(0).lower()], text)
+
+
+class OfflineTranslator:
+    """Stand-in backend and test stub without network access; returns the text unchanged."""
+
+    name = 'offline'
+    max_chars = 10 ** 6
+    thread_safe = True
+
+    def __init__(self, source='auto', target='en'):
+        self.source = source
+        self.target = target
+
+    def translate(self, text):
+        return text
+
+
+def get_backend(kind, target, source='auto'):
+    """Translation backend by name: google, dictionary (etc/dictionary.json) or offline.
+
+    etc/dictionary.json translates German to English; for the target de it
+    is used in the opposite direction.
+    """
+    if kind == 'google':
+        return GoogleBackend(source, target)
+    if kind == 'dictionary':
+        return DictionaryBackend.from_json(DICTIONARY_FILE, invert=target == 'de')
+    if kind == 'offline':
+        return OfflineTranslator(source, target)
+    raise ValueError('Unknown translation backend %s' % kind)
+
+
+class TranslationCache:
+    """Translated segments in an SQLite database, shared by threads and processes.
+
+    Every call opens its own connection, so one instance can be used from
+    several threads; concurrent writers are serialized by SQLite.
+    """
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            # Write-ahead logging lets readers continue while another process writes
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS segments (key TEXT, language TEXT, glossary TEXT, backend TEXT, '
+                       'source TEXT, translation TEXT, PRIMARY KEY (key, language, glossary, backend))')
+
+    @contextlib.contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30.)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get_many(self, texts, language, glossary='', backend=''):
+        """Cached translations of texts as dict text -> translation (missing texts are left out)."""
+        keys = {text: text_key(text) for text in texts}
+        found = {}
+        with self._connect() as db:
+            # Bounded number of parameters per statement
+            items = sorted(set(keys.values()))
+            for i in range(0, len(items), 500):
+                chunk = items[i:i + 500]
+                rows = db.execute('SELECT key, translation FROM segments WHERE language = ? AND glossary = ? AND backend = ? '
+                                  'AND key IN (%s)' % ','.join('?' * len(chunk)), (language, glossary, backend, *chunk))
+                found.update(rows)
+        return {text: found[key] for text, key in keys.items() if key in found}
+
+    def put_many(self, translations, language, glossary='', backend=''):
+        """Store a dict text -> translation; existing entries are kept."""
+        with self._connect() as db:
+            db.executemany('INSERT OR IGNORE INTO segments VALUES (?, ?, ?, ?, ?, ?)',
+                           [(text_key(text), language, glossary, backend, text, translation)
+                            for text, translation in translations.items()])
+
+    def translate(self, text, language, translate, glossary='', backend=''):
+        """Cached translation of text, translate(text) is only called on a cache miss.
+
+        Blank text is returned unchanged without a lookup.
+        """
+        if not text.strip():
+            return text
+        cached = self.get_many([text], language, glossary, backend)
+        if text in cached:
+            return cached[text]
+        translation = translate(text)
+        if translation is not None:
+            self.put_many({text: translation}, language, glossary, backend)
+        return translation
+
+
+# Segment markers of a batch; segments that contain one are sent alone
+SEGMENT_MARK = '[[%d]]'
+SEGMENT_MARK_PATTERN = re.compile(r'\[\[\s*(\d+)\s*\]\]')
+
+# Protected spans (LaTeX math and glossary terms) are sent as tokens like zx3q
+TOKEN = 'zx%dq'
+TOKEN_PATTERN = re.compile(r'zx\s*(\d+)\s*q', re.IGNORECASE)
+MATH_PATTERN = re.compile(r'\$[^$]+\$')
+
+
+def split_markdown(text):
+    """Markdown/HTML text as lines of fixed parts and text segments to translate.
+
+    Lines are stripped of their indentation. Header marks, list bullets and
+    HTML tags stay fixed, the texts between them are segments. Returns the
+    list of lines (lists of parts, int for the index of a segment) and the
+    list of segments.
+    """
+    lines, segments = [], []
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        prefix = re.match(r'(#+\s*|[-*+]\s+|\d+\.\s+)?', line).group(0)
+        parts = [prefix] if prefix else []
+        for piece in re.split(r'(<[^>]+>)', line[len(prefix):]):
+            if piece.strip() and not piece.startswith('<'):
+                # The blanks around a segment (e.g. next to a tag) stay fixed
+                text = piece.strip()
+                start = piece.index(text)
+                parts += [piece[:start], len(segments), piece[start + len(text):]]
+                segments.append(text)
+            elif piece:
+                parts.append(piece)
+        lines.append(parts)
+    return lines, segments
+
+
+def join_markdown(lines, translations):
+    """Text of the lines of split_markdown with the translated segments."""
+    return '\n'.join(''.join(translations[part] if isinstance(part, int) else part for part in parts) for parts in lines)
+
+
+def _mask(segment, terms_pattern):
+    # Bold and italic with inner spaces are kept intact by the translators
+    segment = re.sub(r"(\*\*|\*)(\S.*?\S)(\*\*|\*)", r"\1 \2 \3", segment)
+    spans = []
+
+    def token(match):
+        spans.append(match.group(0))
+        return TOKEN % (len(spans) - 1)
+    segment = MATH_PATTERN.sub(token, segment)
+    if terms_pattern is not None:
+        segment = terms_pattern.sub(token, segment)
+    return segment, spans
+
+
+def _unmask(translation, spans, glossary):
+    def restore(match):
+        i = int(match.group(1))
+        if i >= len(spans):
+            return match.group(0)
+        span = spans[i]
+        return span if span.startswith('$') else glossary.get(span.lower(), span)
+    translation = TOKEN_PATTERN.sub(restore, translation)
+    return re.sub(r"(\*\*|\*) (.*?) (\*\*|\*)", r"\1\2\3", translation)
+
+
+def _batches(texts, max_chars):
+    # Consecutive texts up to max_chars per batch (with markers)
+    batch, size = [], 0
+    for text in texts:
+        length = len(text) + 10
+        if batch and (size + length > max_chars or SEGMENT_MARK_PATTERN.search(text)):
+            yield batch
+            batch, size = [], 0
+        if SEGMENT_MARK_PATTERN.search(text):
+            yield [text]
+            continue
+        batch.append(text)
+        size += length
+    if batch:
+        yield batch
+
+
+def translate_batch(backend, texts):
+    """Translations of texts with one request, segments separated by numbered markers.
+
+    If the markers do not come back complete and in order, the texts are
+    translated one by one.
+    """
+    if len(texts) == 1:
+        return [backend.translate(texts[0])]
+    translated = backend.translate('\n'.join(SEGMENT_MARK % i + ' ' + text for i, text in enumerate(texts)))
+    parts = SEGMENT_MARK_PATTERN.split(translated)
+    if [int(i) for i in parts[1::2]] != list(range(len(texts))):
+        return [backend.translate(text) for text in texts]
+    return [part.strip() for part in parts[2::2]]
+
+
+def translate_markdown(texts, backend, language, terms=(), glossary=None, cache=None, workers=8):
+    """Translations of a dict of Markdown/HTML texts (e.g. all sections of a page).
+
+    The segments of all texts (split_markdown) are translated together:
+    cached segments are taken from cache (a TranslationCache or None), LaTeX
+    math and the technical terms are masked by tokens, and the other
+    segments are sent in batches of at most backend.max_chars characters,
+    concurrently on a pool of workers threads. Backends without a true
+    thread_safe attribute get one request at a time. The terms are replaced by
+    glossary[term] (dict of lower-case term -> translation) or kept. Returns
+    a dict with the same keys.
+    """
+    glossary = {term.lower(): value for term, value in (glossary or {}).items()}
+    version = glossary_version(sorted(term.lower() for term in terms), glossary)
+    phrases = sorted(terms, key=len, reverse=True)
+    terms_pattern = re.compile(r'\b(%s)\b' % '|'.join(map(re.escape, phrases)), re.IGNORECASE) if phrases else None
+
+    split = {key: split_markdown(text) for key, text in texts.items()}
+    segments = list(dict.fromkeys(segment for _, parts in split.values() for segment in parts))
+    translations = cache.get_many(segments, language, version, backend.name) if cache is not None else {}
+    missing = [segment for segment in segments if segment not in translations]
+    masked = [_mask(segment, terms_pattern) for segment in missing]
+    batches = list(_batches([text for text, _ in masked], backend.max_chars))
+    # Backends that keep the request in the instance must not be shared by threads
+    lock = contextlib.nullcontext() if getattr(backend, 'thread_safe', False) else threading.Lock()
+
+    def run(batch):
+        with lock:
+            return translate_batch(backend, batch)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        translated = [text for batch in pool.map(run, batches) for text in batch]
+    new = {segment: _unmask(text, spans, glossary) for segment, (_, spans), text in zip(missing, masked, translated)}
+    if cache is not None and new:
+        cache.put_many(new, language, version, backend.name)
+    translations.update(new)
+    return {key: join_markdown(lines, [translations[segment] for segment in parts])
+            for key, (lines, parts) in split.items()}
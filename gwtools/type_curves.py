@@ -0,0 +1,77 @@
+"""Cached type curves of the Hantush-Jacob and Neuman solutions.
+
+The numerical well functions depend on u only through the dimensionless
+time, so for one set of shape parameters (r/B, or S/Sy and β) the whole
+type curve W(u) is computed once on a log-spaced grid and then reused for
+any T, S, Q and r. Moving the T or S slider of an app costs a cache lookup
+plus an interpolation in log-log space.
+
+The interpolators are kept in a functools.lru_cache registry keyed by
+(model, shape parameters, method). It lives in the module, so it is shared
+by all Streamlit sessions of a server process. Values of u outside of the
+grid are computed directly with the numerical well function.
+"""
+
+import functools
+
+import numpy as np
+import scipy.interpolate
+
+from gwtools.hantush_jacob import hantush_well_function
+from gwtools.neuman import neuman_well_function
+from gwtools.well_hydraulics import theis_u
+
+# Grid of the type curves (log10 u) and number of cached curves
+LOG_U_MIN = -8.
+LOG_U_MAX = {'hantush_jacob': 1., 'neuman': 0.5}
+PER_DECADE = 20
+CACHE_SIZE = 512
+
+WELL_FUNCTIONS = {'hantush_jacob': hantush_well_function,
+                  'neuman': neuman_well_function}
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def type_curve(model, params, method='cubic'):
+    """Interpolator ln u -> ln W(u, *params) for model 'hantush_jacob' or 'neuman'.
+
+    params are the shape parameters of the well function, (r/B,) or
+    (S/Sy, β). method is 'cubic' (spline) or 'linear'.
+    """
+    log_u = np.linspace(LOG_U_MIN, LOG_U_MAX[model],
+                        int(round((LOG_U_MAX[model] - LOG_U_MIN) * PER_DECADE)) + 1) * np.log(10.)
+    ln_w = np.log(WELL_FUNCTIONS[model](np.exp(log_u), *params))
+    if method == 'cubic':
+        return scipy.interpolate.CubicSpline(log_u, ln_w)
+    if method == 'linear':
+        return functools.partial(np.interp, xp=log_u, fp=ln_w)
+    raise ValueError('Unknown interpolation method %r' % method)
+
+
+def well_function_cached(model, u, params, method='cubic'):
+    """Well function W(u, *params) of a model from the cached type curve, for an array u."""
+    u = np.asarray(u, dtype=float)
+    params = tuple(float(p) for p in params)
+    interpolator = type_curve(model, params, method)
+    with np.errstate(divide='ignore'):
+        log_u = np.log(u)
+    inside = (log_u >= LOG_U_MIN * np.log(10.)) & (log_u <= LOG_U_MAX[model] * np.log(10.))
+    w = np.empty(u.shape)
+    w[inside] = np.exp(interpolator(log_u[inside]))
+    if not inside.all():
+        w[~inside] = WELL_FUNCTIONS[model](u[~inside], *params)
+    return w[()]
+
+
+def hantush_s(T, S, t, Q, r, r_div_B, method='cubic'):
+    """Hantush-Jacob drawdown from the cached type curve for scalar T, S, Q, r and r/B."""
+    u = theis_u(T, S, r, t)
+    u = np.where(u < 0, np.inf, u)
+    return Q / 4. / np.pi / T * well_function_cached('hantush_jacob', u, (r_div_B,), method)
+
+
+def neuman_s(T, S, Sy, t, Q, r, beta, method='cubic'):
+    """Neuman drawdown from the cached type curve for scalar T, S, Sy, Q, r and β."""
+    u = theis_u(T, S, r, t)
+    u = np.where(u < 0, np.inf, u)
+    return Q / 4. / np.pi / T * well_function_cached('neuman', u, (S / Sy, beta), method)
@@ -0,0 +1,65 @@
+"""Parameter ensembles and drawdown prediction bands for the Theis solution.
+
+Two ways of propagating the uncertainty of a pumping test fit into a
+drawdown prediction are provided:
+
+- residual bootstrap: the residuals of the best fit are resampled with
+  replacement and added to the fitted drawdown, and every synthetic record
+  is refitted (fit_theis_batch fits all records at once)
+- Monte Carlo: log10 T and log10 S are drawn from the normal distribution
+  given by the fit's covariance matrix
+
+The predictions of the whole ensemble are one broadcast of compute_s over
+(realization x time), or of schedule_drawdown for a variable pumping rate.
+"""
+
+import numpy as np
+
+from gwtools.fitting import fit_theis, fit_theis_batch
+from gwtools.superposition import schedule_drawdown
+from gwtools.well_hydraulics import compute_s
+
+PERCENTILES = (5., 50., 95.)
+
+
+def bootstrap_theis(t, s, Q, r, n=10000, seed=None, bounds=((-7., -7.), (0., 0.))):
+    """Residual bootstrap ensemble of (log10 T, log10 S) for measured drawdown.
+
+    The residuals are scaled by sqrt(n_obs / (n_obs - 2)) to account for
+    the two fitted parameters. Returns an array of shape (n, 2).
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    fit = fit_theis(t, s, Q, r, bounds=bounds)
+    n_obs = len(t)
+    res = fit['residuals'] * np.sqrt(n_obs / max(n_obs - 2, 1))
+    rng = np.random.default_rng(seed)
+    s_star = (s + fit['residuals'])[None, :] - res[rng.integers(0, n_obs, (n, n_obs))]
+    return fit_theis_batch(t, s_star, Q, r, fit['p'], bounds)
+
+
+def monte_carlo_theis(t, s, Q, r, n=10000, seed=None, bounds=((-7., -7.), (0., 0.))):
+    """Ensemble of (log10 T, log10 S) drawn from the linearized covariance of the Theis fit.
+
+    Returns an array of shape (n, 2).
+    """
+    fit = fit_theis(t, s, Q, r, bounds=bounds)
+    rng = np.random.default_rng(seed)
+    return rng.multivariate_normal(fit['p'], fit['cov'], n)
+
+
+def prediction_bands(ensemble, t, Q, r, percentiles=PERCENTILES, t_steps=None):
+    """Drawdown percentiles of a (log10 T, log10 S) ensemble at the times t.
+
+    If t_steps is given, Q holds the rates of a pumping schedule starting at
+    these times (see schedule_drawdown). Returns an array of shape
+    (len(percentiles), len(t)) and the drawdown of every realization, shape
+    (len(ensemble), len(t)).
+    """
+    ensemble = np.asarray(ensemble, dtype=float)
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    if t_steps is None:
+        s = compute_s(10 ** ensemble[:, :1], 10 ** ensemble[:, 1:], t, Q, r)
+    else:
+        s = schedule_drawdown(10 ** ensemble[:, 0], 10 ** ensemble[:, 1], t, r, t_steps, Q)
+    return np.percentile(s, percentiles, axis=0), s
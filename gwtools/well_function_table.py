@@ -0,0 +1,122 @@
+"""Tabulated Theis well function W(u) for bulk drawdown sweeps.
+
+ln W is tabulated against ln u on a uniform grid for 1e-12 <= u <= 50. Each
+cell uses a cubic Hermite polynomial built from the exact values and the
+exact derivatives (dW/du = -e^(-u)/u). Outside the table the analytic
+expansions are used:
+
+- u < 1e-12: W(u) = -γ - ln u + u (the next term, u²/4, is below 1e-24)
+- u > 50: W(u) = e^(-u)/u · Σ (-1)^k k!/u^k, truncated after 12 terms
+
+With the default 8192 cells the maximum relative error against
+scipy.special.exp1 is below 5e-11 over the whole range of u (checked on
+1e7 log-uniform points, see ``benchmark``). That is far below anything
+visible in a drawdown plot or relevant for a parameter fit.
+
+Run ``python -m gwtools.well_function_table`` from the repository root for
+the timing and accuracy comparison with exp1.
+"""
+
+import time
+
+import numpy as np
+import scipy.special
+
+U_MIN = 1e-12
+U_MAX = 50.
+N_CELLS = 8192
+N_ASYMPTOTIC = 12
+
+_x0 = np.log(U_MIN)
+_h = (np.log(U_MAX) - _x0) / N_CELLS
+
+
+def _build_table():
+    # Polynomial coefficients per cell for ln W in the local coordinate s in [0, 1]
+    x = _x0 + _h * np.arange(N_CELLS + 1)
+    u = np.exp(x)
+    w = scipy.special.exp1(u)
+    y = np.log(w)
+    dy = -np.exp(-u) / w * _h          # d(ln W)/d(ln u), scaled to the cell width
+    y0, y1, m0, m1 = y[:-1], y[1:], dy[:-1], dy[1:]
+    c0 = y0
+    c1 = m0
+    c2 = 3 * (y1 - y0) - 2 * m0 - m1
+    c3 = 2 * (y0 - y1) + m0 + m1
+    return np.stack((c0, c1, c2, c3), axis=-1)
+
+
+_coef = _build_table()
+_k = np.arange(N_ASYMPTOTIC)
+_asym = (-1.) ** _k * scipy.special.factorial(_k)
+
+
+def _small_u(u):
+    return -np.euler_gamma - np.log(u) + u
+
+
+def _large_u(u):
+    series = np.zeros_like(u)
+    for a in _asym[::-1]:
+        series = series / u + a
+    return np.exp(-u) / u * series
+
+
+def well_function_table(u):
+    """W(u) from the tabulated interpolant, with analytic tails.
+
+    Returns inf for u = 0, 0 for u = inf and nan for negative u, like
+    scipy.special.exp1 for real arguments.
+    """
+    u = np.asarray(u, dtype=float)
+    scalar = u.ndim == 0
+    shape = u.shape
+    u = np.atleast_1d(u).ravel()
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        t = (np.log(u) - _x0) / _h
+        i = np.fmin(np.fmax(t, 0), N_CELLS - 1).astype(np.intp)
+        s = t - i
+        c = np.take(_coef, i, axis=0)
+        w = np.exp(((c[:, 3] * s + c[:, 2]) * s + c[:, 1]) * s + c[:, 0])
+
+    # Analytic tails and special values, only evaluated where present
+    small = u < U_MIN
+    if small.any():
+        us = u[small]
+        with np.errstate(divide='ignore'):
+            w[small] = np.where(us > 0, _small_u(np.abs(us)), np.inf)
+    large = u > U_MAX
+    if large.any():
+        w[large] = _large_u(u[large])
+    invalid = (u < 0) | np.isnan(u)
+    if invalid.any():
+        w[invalid] = np.nan
+
+    return w[0] if scalar else w.reshape(shape)
+
+
+def benchmark(n=10_000_000, seed=0):
+    """Compare speed and accuracy of the table with scipy.special.exp1."""
+    rng = np.random.default_rng(seed)
+    u = 10 ** rng.uniform(np.log10(U_MIN), np.log10(U_MAX), n)
+
+    start = time.perf_counter()
+    exact = scipy.special.exp1(u)
+    t_exact = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = well_function_table(u)
+    t_fast = time.perf_counter() - start
+
+    rel_err = np.max(np.abs(fast - exact) / exact)
+    return {'n': n, 't_exp1': t_exact, 't_table': t_fast, 'max_rel_error': rel_err}
+
+
+if __name__ == '__main__':
+    result = benchmark()
+    print('W(u) for %i points' % result['n'])
+    print('  scipy.special.exp1: %6.3f s' % result['t_exp1'])
+    print('  tabulated:          %6.3f s' % result['t_table'])
+    print('  speedup:            %6.2f x' % (result['t_exp1'] / result['t_table']))
+    print('  max relative error: %9.2e' % result['max_rel_error'])
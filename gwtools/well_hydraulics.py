@@ -0,0 +1,114 @@
+"""Theis well hydraulics that broadcast over arrays.
+
+All functions follow NumPy broadcasting rules, so T, S, Q, r and t can each be
+a scalar or an array.
+
+Units follow the apps: T in m²/s, S dimensionless, Q in m³/s, r in m, t in s.
+"""
+
+import numpy as np
+import scipy.special
+
+from gwtools.well_function_table import well_function_table
+
+# Arrays with at least this many values use the tabulated W(u)
+TABLE_MIN_SIZE = 10_000
+
+
+def well_function(u):
+    """Theis well function W(u) = E1(u).
+
+    Large arrays (parameter sweeps, uncertainty ensembles) are evaluated with
+    the tabulated interpolant (relative error < 5e-11), small ones with
+    scipy.special.exp1.
+    """
+    if np.size(u) >= TABLE_MIN_SIZE:
+        return well_function_table(u)
+    return scipy.special.exp1(u)
+
+
+def theis_u(T, S, r, t):
+    """Dimensionless time u = r²S / (4Tt)."""
+    r = np.asarray(r, dtype=float)
+    t = np.asarray(t, dtype=float)
+    with np.errstate(divide='ignore'):
+        u = r ** 2 * S / 4. / T / t
+    return u
+
+
+def theis_s(Q, T, u):
+    """Drawdown s = Q / (4πT) W(u)."""
+    return Q / 4. / np.pi / T * well_function(u)
+
+
+def cooper_jacob(t, s, Q, r, u_max=0.05, min_fraction=0.25, max_iter=20):
+    """Cooper-Jacob straight-line estimate of T and S from measured drawdown.
+
+    Drawdown is regressed against log10 t over the late-time window where the
+    Jacob approximation holds (u < u_max). The window starts with the later
+    half of the data and is updated from the resulting T and S until it no
+    longer changes. If fewer points satisfy u < u_max, the latest
+    min_fraction of the data is used (flag 'valid' is False then). T and S
+    follow in closed form from the slope per log cycle and the time
+    intercept t0 (s = 0):
+
+        T = 2.303 Q / (4π Δs),    S = 2.25 T t0 / r²
+
+    Returns a dict with T, S, log_T, log_S, the boolean window, the slope
+    Δs, t0 and valid. Raises ValueError if the late-time drawdown does not
+    increase.
+    """
+    t = np.asarray(t, dtype=float)
+    s = np.asarray(s, dtype=float)
+    n = len(t)
+    if n < 2:
+        raise ValueError('Cooper-Jacob needs at least two measurements')
+    order = np.argsort(t)
+
+    def latest(k):
+        window = np.zeros(n, dtype=bool)
+        window[order[-k:]] = True
+        return window
+
+    n_min = max(2, int(np.ceil(min_fraction * n)))
+    window = latest(max(n_min, n // 2))
+    estimate = None
+    for _ in range(max_iter):
+        slope, intercept = np.polyfit(np.log10(t[window]), s[window], 1)
+        if slope <= 0:
+            break
+        T = np.log(10.) * Q / 4. / np.pi / slope
+        t0 = 10 ** (-intercept / slope)
+        S = 2.25 * T * t0 / r ** 2
+        valid = theis_u(T, S, r, t) < u_max
+        estimate = (T, S, window, slope, t0, bool(np.all(valid[window])))
+        new_window = valid if valid.sum() >= n_min else latest(n_min)
+        if np.array_equal(new_window, window):
+            break
+        window = new_window
+    if estimate is None:
+        raise ValueError('Late-time drawdown does not increase with time')
+    T, S, window, slope, t0, valid = estimate
+    return {'T': T, 'S': S, 'log_T': np.log10(T), 'log_S': np.log10(S),
+            'window': window, 'slope': slope, 't0': t0, 'valid': valid}
+
+
+def theis_wu(Q, T, s):
+    """Well function value W(u) = 4πTs / Q that corresponds to a drawdown s."""
+    return np.asarray(s, dtype=float) * 4. * np.pi * T / Q
+
+
+def compute_s(T, S, t, Q, r):
+    """Theis drawdown for broadcastable T, S, t, Q and r.
+
+    Times t <= 0 give zero drawdown (the well has not started pumping yet).
+    """
+    u = theis_u(T, S, r, t)
+    u = np.where(u < 0, np.inf, u)[()]
+    return theis_s(Q, T, u)
+
+
+def theis_type_curve(u_min=-5, u_max=4, num=50):
+    """Log-spaced 1/u and W(u) arrays for plotting the Theis type curve."""
+    u = np.logspace(u_min, u_max, num)
+    return 1 / u, well_function(u)